@@ -5,10 +5,21 @@ Consolidated version with 20 tools organized into multiple modules.
 """
 import os
 import argparse
-from typing import Dict, Any
+import contextvars
+import functools
+import inspect
+import itertools
+import threading
+import time
+import weakref
+from collections.abc import MutableMapping
+from typing import Dict, Any, List, Optional
 from mcp.server.fastmcp import FastMCP
 
 # import utils  # Currently unused
+from utils.concurrency_utils import ToolExecutor, PRESENTATION_CREATION_LOCK
+from utils.presentation_utils import PresentationStore, export_cache, save_jobs, template_package_cache
+from utils.media_utils import image_cache
 from tools import (
     register_presentation_tools,
     register_content_tools,
@@ -19,7 +30,8 @@ from tools import (
     register_chart_tools,
     register_connector_tools,
     register_master_tools,
-    register_transition_tools
+    register_transition_tools,
+    register_media_tools
 )
 
 # Initialize the FastMCP server
@@ -27,60 +39,165 @@ app = FastMCP(
     name="ppt-mcp-server"
 )
 
-# Global state to store presentations in memory
-presentations = {}
-current_presentation_id = None
+# ---- Session state ----
+
+class SessionState:
+    """Per-session state: the session's presentation namespace and its current presentation."""
+    
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.current_presentation_id = None
+
+# State used outside of an MCP request (e.g. direct calls) and by single-session transports
+default_session_state = SessionState("")
+_session_states = weakref.WeakKeyDictionary()
+_session_states_lock = threading.Lock()
+_session_numbers = itertools.count(1)
+_active_session_state = contextvars.ContextVar("active_session_state", default=None)
+
+def get_session_state() -> SessionState:
+    """Get the state of the MCP session the current tool call belongs to."""
+    return _active_session_state.get() or default_session_state
+
+def session_state_for(session) -> SessionState:
+    """
+    Get (creating on first use) the state for an MCP session object.
+    
+    State is held weakly; when the session goes away its presentations are dropped.
+    """
+    if session is None:
+        return default_session_state
+    with _session_states_lock:
+        state = _session_states.get(session)
+        if state is None:
+            state = SessionState(f"session_{next(_session_numbers)}")
+            _session_states[session] = state
+            weakref.finalize(session, _drop_session_presentations, state.namespace)
+        return state
+
+def _drop_session_presentations(namespace: str) -> None:
+    """Release every presentation that belonged to a closed session."""
+    for key in [key for key in list(loaded_presentations) if key[0] == namespace]:
+        try:
+            del loaded_presentations[key]
+        except KeyError:
+            pass
+        tool_executor.locks.discard(key)
+
+
+class SessionPresentations(MutableMapping):
+    """
+    Dict-like view of the presentations visible to the active session.
+    
+    Presentation IDs are namespaced per session, so two clients can both use
+    "presentation_1" without touching each other's decks. Outside a session
+    (stdio, direct calls) the default namespace is used.
+    """
+    
+    def __init__(self, backing: Dict):
+        self.backing = backing
+    
+    @staticmethod
+    def namespace():
+        """Get the namespace of the active session."""
+        return get_session_state().namespace
+    
+    @classmethod
+    def qualify(cls, pres_id):
+        """Get the backing-store key for a presentation ID in the active session."""
+        return (cls.namespace(), pres_id)
+    
+    def __getitem__(self, pres_id):
+        return self.backing[self.qualify(pres_id)]
+    
+    def __setitem__(self, pres_id, pres):
+        self.backing[self.qualify(pres_id)] = pres
+    
+    def __delitem__(self, pres_id):
+        del self.backing[self.qualify(pres_id)]
+    
+    def __contains__(self, pres_id):
+        return self.qualify(pres_id) in self.backing
+    
+    def __iter__(self):
+        namespace = self.namespace()
+        return iter([pres_id for ns, pres_id in list(self.backing) if ns == namespace])
+    
+    def __len__(self):
+        namespace = self.namespace()
+        return sum(1 for ns, _ in list(self.backing) if ns == namespace)
+
+# Shared worker pool and per-presentation locks for tool calls
+tool_executor = ToolExecutor()
+
+# Global state to store presentations, keyed by (session namespace, presentation ID).
+# Least recently used decks beyond the memory budget are spilled to disk and reloaded on access.
+loaded_presentations = PresentationStore(lock_for=tool_executor.locks.lock_for,
+                                         in_use=tool_executor.locks.in_use)
+presentations = SessionPresentations(loaded_presentations)
 
 # Template configuration
+_DEFAULT_TEMPLATE_DIRECTORIES = ['.', './templates', './assets', './resources']
+_template_env_directories_cache = {}   # PPT_TEMPLATE_PATH value -> (checked at, existing directories)
+_template_env_directories_lock = threading.Lock()
+
 def get_template_search_directories():
     """
     Get list of directories to search for templates.
     Uses environment variable PPT_TEMPLATE_PATH if set, otherwise uses default directories.
+    Which PPT_TEMPLATE_PATH directories exist is cached and re-checked at most once
+    per PPT_TEMPLATE_INDEX_TTL seconds (default 5), the interval the template index
+    re-checks directories at, so directories that appear later (e.g. late mounts)
+    are picked up without checking the filesystem on every call.
     
     Returns:
         List of directories to search for templates
     """
     template_env_path = os.environ.get('PPT_TEMPLATE_PATH')
+    if not template_env_path:
+        return list(_DEFAULT_TEMPLATE_DIRECTORIES)
     
-    if template_env_path:
-        # If environment variable is set, use it as the primary template directory
-        # Support multiple paths separated by colon (Unix) or semicolon (Windows)
-        import platform
-        separator = ';' if platform.system() == "Windows" else ':'
-        env_dirs = [path.strip() for path in template_env_path.split(separator) if path.strip()]
-        
-        # Verify that the directories exist
-        valid_env_dirs = []
-        for dir_path in env_dirs:
-            expanded_path = os.path.expanduser(dir_path)
-            if os.path.exists(expanded_path) and os.path.isdir(expanded_path):
-                valid_env_dirs.append(expanded_path)
-        
-        if valid_env_dirs:
-            # Add default fallback directories
-            return valid_env_dirs + ['.', './templates', './assets', './resources']
+    now = time.monotonic()
+    ttl = float(os.environ.get('PPT_TEMPLATE_INDEX_TTL', '5'))
+    with _template_env_directories_lock:
+        cached = _template_env_directories_cache.get(template_env_path)
+        if cached is None or now - cached[0] >= ttl:
+            valid_env_dirs = [
+                dir_path for dir_path in _split_template_env_path(template_env_path) if os.path.isdir(dir_path)
+            ]
+            # Warn each time the configured directories go from (partly) present to all missing
+            if not valid_env_dirs and (cached is None or cached[1]):
+                print(f"Warning: PPT_TEMPLATE_PATH directories not found: {template_env_path}")
+            _template_env_directories_cache[template_env_path] = (now, valid_env_dirs)
         else:
-            print(f"Warning: PPT_TEMPLATE_PATH directories not found: {template_env_path}")
+            valid_env_dirs = cached[1]
     
-    # Default search directories when no environment variable or invalid paths
-    return ['.', './templates', './assets', './resources']
+    # Add default fallback directories
+    return valid_env_dirs + _DEFAULT_TEMPLATE_DIRECTORIES
+
+def _split_template_env_path(template_env_path):
+    """Split and expand a PPT_TEMPLATE_PATH value into its directories."""
+    # Support multiple paths separated by colon (Unix) or semicolon (Windows)
+    import platform
+    separator = ';' if platform.system() == "Windows" else ':'
+    return [os.path.expanduser(path.strip()) for path in template_env_path.split(separator) if path.strip()]
 
 # ---- Helper Functions ----
 
 def get_current_presentation():
     """Get the current presentation object or raise an error if none is loaded."""
+    current_presentation_id = get_current_presentation_id()
     if current_presentation_id is None or current_presentation_id not in presentations:
         raise ValueError("No presentation is currently loaded. Please create or open a presentation first.")
     return presentations[current_presentation_id]
 
 def get_current_presentation_id():
-    """Get the current presentation ID."""
-    return current_presentation_id
+    """Get the current presentation ID of the active session."""
+    return get_session_state().current_presentation_id
 
 def set_current_presentation_id(pres_id):
-    """Set the current presentation ID."""
-    global current_presentation_id
-    current_presentation_id = pres_id
+    """Set the current presentation ID of the active session."""
+    get_session_state().current_presentation_id = pres_id
 
 def validate_parameters(params):
     """
@@ -201,6 +318,116 @@ class PresentationManager:
         set_current_presentation_id(pres_id)
         return pres_id
 
+# ---- Tool registry ----
+
+class ToolRegistry:
+    """
+    Proxy around the FastMCP app handed to the register_*_tools functions.
+    
+    Every tool is registered with the app through an async wrapper that runs
+    the synchronous tool body on the shared ToolExecutor, holding the lock of
+    the presentation it targets. The undecorated functions are also recorded by
+    name so that they can be dispatched in-process (e.g. by execute_batch)
+    without a client round-trip. Tools taking a presentation_id refuse
+    presentations opened read-only unless they are allowed as read-only.
+    """
+    
+    def __init__(self, app, executor: ToolExecutor):
+        self.app = app
+        self.executor = executor
+        self.functions = {}
+        self._parameters = {}
+        self._wrappers = {}
+        self._read_only_tools = set()
+    
+    def wrap_tool(self, tool_name: str, wrapper) -> None:
+        """Apply a state-management wrapper to a tool when it gets registered."""
+        self._wrappers[tool_name] = wrapper
+    
+    def allow_read_only(self, *tool_names: str) -> None:
+        """Let tools that don't modify presentations run against ones opened read-only."""
+        self._read_only_tools.update(tool_names)
+    
+    @staticmethod
+    def _refuse_read_only(tool_name: str, fn):
+        """Wrap a tool so it returns an error instead of modifying a read-only presentation."""
+        @functools.wraps(fn)
+        def wrapper(**kwargs):
+            pres_id = kwargs.get("presentation_id")
+            if pres_id is None:
+                pres_id = get_current_presentation_id()
+            if pres_id is not None and loaded_presentations.is_read_only(SessionPresentations.qualify(pres_id)):
+                return {
+                    "error": f"Presentation '{pres_id}' was opened read-only and {tool_name} modifies presentations. "
+                             f"Reopen it with open_presentation(mode='edit') to make changes."
+                }
+            return fn(**kwargs)
+        return wrapper
+    
+    def tool(self, *args, **kwargs):
+        """Drop-in replacement for app.tool() that records and wraps the tool function."""
+        register = self.app.tool(*args, **kwargs)
+        
+        def decorator(fn):
+            name = kwargs.get('name') or fn.__name__
+            if name in self._wrappers:
+                fn = self._wrappers[name](fn)
+            if name not in self._read_only_tools and "presentation_id" in inspect.signature(fn).parameters:
+                fn = self._refuse_read_only(name, fn)
+            self.functions[name] = fn
+            
+            @functools.wraps(fn)
+            async def run_tool(**tool_kwargs):
+                token = _active_session_state.set(session_state_for(self.current_session()))
+                try:
+                    lock_key = self.resolve_lock_key(name, tool_kwargs)
+                    return await self.executor.run(lock_key, fn, tool_kwargs)
+                finally:
+                    _active_session_state.reset(token)
+            
+            register(run_tool)
+            return fn
+        return decorator
+    
+    def current_session(self):
+        """Get the MCP session object of the request being handled, if any."""
+        try:
+            return self.app.get_context().session
+        except (LookupError, ValueError):
+            return None
+    
+    def accepts_parameter(self, tool_name: str, parameter: str) -> bool:
+        """Check (with caching) whether a registered tool accepts a given parameter."""
+        if tool_name not in self._parameters:
+            self._parameters[tool_name] = frozenset(
+                inspect.signature(self.functions[tool_name]).parameters
+            )
+        return parameter in self._parameters[tool_name]
+    
+    def resolve_lock_key(self, tool_name: str, tool_kwargs: Dict) -> Optional[str]:
+        """
+        Work out which presentation a tool call touches.
+        
+        When presentation_id is omitted the current ID is resolved here and
+        injected into the call, so the tool operates on the presentation that
+        was locked even if another client switches presentations meanwhile.
+        """
+        if self.accepts_parameter(tool_name, "presentation_id"):
+            if tool_name == "switch_presentation":
+                return None
+            if tool_kwargs.get("presentation_id") is None:
+                pres_id = get_current_presentation_id()
+                if pres_id is not None:
+                    tool_kwargs["presentation_id"] = pres_id
+            pres_id = tool_kwargs.get("presentation_id")
+            return SessionPresentations.qualify(pres_id) if pres_id is not None else None
+        if self.accepts_parameter(tool_name, "id"):
+            pres_id = tool_kwargs.get("id")
+            return SessionPresentations.qualify(pres_id) if pres_id is not None else PRESENTATION_CREATION_LOCK
+        return None
+
+tool_registry = ToolRegistry(app, tool_executor)
+
 # ---- Register Tools ----
 
 # Create presentation manager wrapper
@@ -209,6 +436,7 @@ presentation_manager = PresentationManager(presentations)
 # Wrapper functions to handle state management
 def create_presentation_wrapper(original_func):
     """Wrapper to handle presentation creation with state management."""
+    @functools.wraps(original_func)
     def wrapper(*args, **kwargs):
         result = original_func(*args, **kwargs)
         if "presentation_id" in result and result["presentation_id"] in presentations:
@@ -218,6 +446,7 @@ def create_presentation_wrapper(original_func):
 
 def open_presentation_wrapper(original_func):
     """Wrapper to handle presentation opening with state management."""
+    @functools.wraps(original_func)
     def wrapper(*args, **kwargs):
         result = original_func(*args, **kwargs)
         if "presentation_id" in result and result["presentation_id"] in presentations:
@@ -225,16 +454,28 @@ def open_presentation_wrapper(original_func):
         return result
     return wrapper
 
+# New or opened presentations become the current presentation of the calling session
+tool_registry.wrap_tool("create_presentation", create_presentation_wrapper)
+tool_registry.wrap_tool("create_presentation_from_template", create_presentation_wrapper)
+tool_registry.wrap_tool("open_presentation", open_presentation_wrapper)
+
+# Tools that only read presentations may also run against decks opened with mode="read"
+tool_registry.allow_read_only(
+    "save_presentation", "export_presentation", "get_presentation_info", "get_slide_info",
+    "extract_slide_text", "extract_presentation_text", "validate_presentation",
+    "switch_presentation", "close_presentation", "execute_batch"
+)
+
 # Register all tool modules
 register_presentation_tools(
-    app, 
+    tool_registry, 
     presentations, 
     get_current_presentation_id, 
     get_template_search_directories
 )
 
 register_content_tools(
-    app,
+    tool_registry,
     presentations,
     get_current_presentation_id,
     validate_parameters,
@@ -245,7 +486,7 @@ register_content_tools(
 )
 
 register_structural_tools(
-    app,
+    tool_registry,
     presentations,
     get_current_presentation_id,
     validate_parameters,
@@ -257,19 +498,19 @@ register_structural_tools(
 )
 
 register_professional_tools(
-    app,
+    tool_registry,
     presentations,
     get_current_presentation_id
 )
 
 register_template_tools(
-    app,
+    tool_registry,
     presentations,
     get_current_presentation_id
 )
 
 register_hyperlink_tools(
-    app,
+    tool_registry,
     presentations,
     get_current_presentation_id,
     validate_parameters,
@@ -280,7 +521,7 @@ register_hyperlink_tools(
 )
 
 register_chart_tools(
-    app,
+    tool_registry,
     presentations,
     get_current_presentation_id,
     validate_parameters,
@@ -292,7 +533,7 @@ register_chart_tools(
 
 
 register_connector_tools(
-    app,
+    tool_registry,
     presentations,
     get_current_presentation_id,
     validate_parameters,
@@ -303,7 +544,7 @@ register_connector_tools(
 )
 
 register_master_tools(
-    app,
+    tool_registry,
     presentations,
     get_current_presentation_id,
     validate_parameters,
@@ -314,7 +555,7 @@ register_master_tools(
 )
 
 register_transition_tools(
-    app,
+    tool_registry,
     presentations,
     get_current_presentation_id,
     validate_parameters,
@@ -324,26 +565,34 @@ register_transition_tools(
     is_valid_rgb
 )
 
+register_media_tools(
+    tool_registry,
+    presentations,
+    get_current_presentation_id
+)
+
 
 # ---- Additional Utility Tools ----
 
-@app.tool()
+@tool_registry.tool()
 def list_presentations() -> Dict:
-    """List all loaded presentations."""
+    """List all presentations loaded in this session."""
+    current_presentation_id = get_current_presentation_id()
     return {
         "presentations": [
             {
                 "id": pres_id,
-                "slide_count": len(pres.slides),
+                "slide_count": loaded_presentations.get_slide_count(presentations.qualify(pres_id)),
+                "in_memory": loaded_presentations.is_loaded(presentations.qualify(pres_id)),
                 "is_current": pres_id == current_presentation_id
             }
-            for pres_id, pres in presentations.items()
+            for pres_id in list(presentations)
         ],
         "current_presentation_id": current_presentation_id,
         "total_presentations": len(presentations)
     }
 
-@app.tool()
+@tool_registry.tool()
 def switch_presentation(presentation_id: str) -> Dict:
     """Switch to a different loaded presentation."""
     if presentation_id not in presentations:
@@ -351,35 +600,194 @@ def switch_presentation(presentation_id: str) -> Dict:
             "error": f"Presentation '{presentation_id}' not found. Available presentations: {list(presentations.keys())}"
         }
     
-    global current_presentation_id
-    old_id = current_presentation_id
-    current_presentation_id = presentation_id
+    old_id = get_current_presentation_id()
+    set_current_presentation_id(presentation_id)
     
     return {
         "message": f"Switched from presentation '{old_id}' to '{presentation_id}'",
         "previous_presentation_id": old_id,
-        "current_presentation_id": current_presentation_id
+        "current_presentation_id": presentation_id
+    }
+
+@tool_registry.tool()
+def close_presentation(presentation_id: Optional[str] = None) -> Dict:
+    """
+    Close a loaded presentation and release its memory.
+    
+    Unsaved changes are discarded; call save_presentation first to keep them. A deck
+    opened from a memory-mapped file releases that file (unless a background save of
+    it is still being written, in which case the file is released when it finishes).
+    
+    Args:
+        presentation_id: Presentation to close (uses current if not provided)
+    """
+    pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+    
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
+        }
+    
+    key = presentations.qualify(pres_id)
+    del presentations[pres_id]
+    tool_executor.locks.discard(key)
+    
+    if get_current_presentation_id() == pres_id:
+        set_current_presentation_id(None)
+    
+    return {
+        "message": f"Closed presentation '{pres_id}'",
+        "presentation_id": pres_id,
+        "current_presentation_id": get_current_presentation_id(),
+        "remaining_presentations": len(presentations)
     }
 
-@app.tool()
+@tool_registry.tool()
+def execute_batch(
+    operations: List[Dict[str, Any]],
+    presentation_id: Optional[str] = None,
+    stop_on_error: bool = False,
+    include_results: bool = True
+) -> Dict:
+    """
+    Execute many tool operations against one presentation in a single call.
+    
+    Args:
+        operations: Ordered list of operations, each {"tool": <tool name>, "args": {...}}
+        presentation_id: Presentation to run against (uses current if not provided).
+            Injected into every operation whose tool accepts presentation_id and
+            whose args don't already specify one. Operations naming a different
+            presentation, and tools that create or open presentations, are
+            rejected, since only this one is locked for the batch.
+        stop_on_error: Stop at the first failed operation instead of continuing
+        include_results: Include each operation's full result (otherwise only status)
+    
+    Example operations:
+    [
+        {"tool": "add_slide", "args": {"layout_index": 1, "title": "Overview"}},
+        {"tool": "manage_text", "args": {"slide_index": 0, "operation": "add", "text": "Hello"}},
+        {"tool": "add_shape", "args": {"slide_index": 0, "shape_type": "oval", "left": 1, "top": 3, "width": 1, "height": 1}}
+    ]
+    """
+    pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+    
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
+        }
+    
+    if not operations:
+        return {
+            "error": "Operations list cannot be empty"
+        }
+    
+    batch_lock_key = presentations.qualify(pres_id)
+    results = []
+    succeeded = 0
+    failed = 0
+    stopped_at = None
+    
+    for index, operation in enumerate(operations):
+        tool_name = operation.get("tool") if isinstance(operation, dict) else None
+        entry = {"index": index, "tool": tool_name}
+        
+        args = dict(operation.get("args") or {}) if isinstance(operation, dict) else {}
+        if (tool_name in tool_registry.functions and "presentation_id" not in args
+                and tool_registry.accepts_parameter(tool_name, "presentation_id")):
+            args["presentation_id"] = pres_id
+        target_id = args.get("presentation_id")
+        # Only the batch's presentation is locked while the batch runs
+        lock_key = tool_registry.resolve_lock_key(tool_name, args) if tool_name in tool_registry.functions else None
+        
+        if tool_name == "execute_batch":
+            entry["error"] = "execute_batch cannot be nested"
+        elif tool_name not in tool_registry.functions:
+            entry["error"] = f"Unknown tool: {tool_name}"
+        elif lock_key is not None and lock_key != batch_lock_key and tool_registry.accepts_parameter(tool_name, "id"):
+            entry["error"] = f"{tool_name} creates or opens a presentation; call it outside execute_batch"
+        elif lock_key is not None and lock_key != batch_lock_key:
+            entry["error"] = (
+                f"Operation targets presentation '{target_id}' but the batch runs against '{pres_id}'; "
+                f"use a separate execute_batch call for it"
+            )
+        else:
+            try:
+                result = tool_registry.functions[tool_name](**args)
+                if isinstance(result, dict) and "error" in result:
+                    entry["error"] = result["error"]
+                elif include_results:
+                    entry["result"] = result
+            except Exception as e:
+                entry["error"] = f"Failed to execute {tool_name}: {str(e)}"
+        
+        entry["success"] = "error" not in entry
+        if entry["success"]:
+            succeeded += 1
+        else:
+            failed += 1
+        results.append(entry)
+        
+        if not entry["success"] and stop_on_error:
+            stopped_at = index
+            break
+    
+    response = {
+        "message": f"Executed {len(results)} of {len(operations)} operations: {succeeded} succeeded, {failed} failed",
+        "presentation_id": pres_id,
+        "total_operations": len(operations),
+        "executed": len(results),
+        "succeeded": succeeded,
+        "failed": failed,
+        "results": results
+    }
+    if stopped_at is not None:
+        response["stopped_at_index"] = stopped_at
+    return response
+
+# Feature groups reported by get_server_info, by the module a tool is defined in
+_TOOL_FEATURE_GROUPS = {
+    "tools.presentation_tools": "Presentation Management",
+    "tools.content_tools": "Content Management",
+    "tools.template_tools": "Template Operations",
+    "tools.structural_tools": "Structural Elements",
+    "tools.professional_tools": "Professional Design",
+    "tools.hyperlink_tools": "Specialized Features",
+    "tools.chart_tools": "Specialized Features",
+    "tools.connector_tools": "Specialized Features",
+    "tools.master_tools": "Specialized Features",
+    "tools.transition_tools": "Specialized Features",
+    "tools.media_tools": "Media Optimization",
+}
+
+def _tool_feature_counts() -> Dict[str, int]:
+    """Count the registered tools per feature group (tools defined here are server utilities)."""
+    counts = {}
+    for fn in tool_registry.functions.values():
+        group = _TOOL_FEATURE_GROUPS.get(inspect.unwrap(fn).__module__, "Server Utilities")
+        counts[group] = counts.get(group, 0) + 1
+    return counts
+
+@tool_registry.tool()
 def get_server_info() -> Dict:
     """Get information about the MCP server."""
+    feature_counts = _tool_feature_counts()
+    tool_modules = {inspect.unwrap(fn).__module__ for fn in tool_registry.functions.values()}
     return {
         "name": "PowerPoint MCP Server - Enhanced Edition",
         "version": "2.1.0",
-        "total_tools": 32,  # Organized into 11 specialized modules
+        "total_tools": len(tool_registry.functions),
         "loaded_presentations": len(presentations),
-        "current_presentation": current_presentation_id,
-        "features": [
-            "Presentation Management (7 tools)",
-            "Content Management (6 tools)", 
-            "Template Operations (7 tools)",
-            "Structural Elements (4 tools)",
-            "Professional Design (3 tools)",
-            "Specialized Features (5 tools)"
-        ],
+        "current_presentation": get_current_presentation_id(),
+        "total_loaded_presentations": len(loaded_presentations),
+        "executor": tool_executor.get_stats(),
+        "presentation_store": loaded_presentations.get_stats(),
+        "template_cache": template_package_cache.get_stats(),
+        "save_jobs": save_jobs.get_stats(),
+        "exports": export_cache.get_stats(),
+        "image_cache": image_cache.get_stats(),
+        "features": [f"{group} ({count} tool{'s' if count != 1 else ''})" for group, count in feature_counts.items()],
         "improvements": [
-            "32 specialized tools organized into 11 focused modules",
+            f"{len(tool_registry.functions)} specialized tools organized into {len(tool_modules)} focused modules",
             "68+ utility functions across 7 organized utility modules",
             "Enhanced parameter handling and validation",
             "Unified operation interfaces with comprehensive coverage",
@@ -0,0 +1,177 @@
+import io
+import os
+import zipfile
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+from utils.package_utils import (
+    LAZY_LOADING_SUPPORTED,
+    close_presentation_package,
+    get_mapped_source_paths,
+    get_package_load_stats,
+    open_mapped_presentation,
+    open_read_only_presentation,
+)
+from utils.presentation_utils import save_presentation
+
+lazy_only = pytest.mark.skipif(not LAZY_LOADING_SUPPORTED, reason="lazy loading not supported by this python-pptx")
+
+
+def image_bytes(color):
+    buffer = io.BytesIO()
+    Image.new('RGB', (64, 48), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def deck_path(tmp_path):
+    presentation = Presentation()
+    for index in range(3):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[5])
+        slide.shapes.title.text = f"Slide {index}"
+        slide.shapes.add_picture(io.BytesIO(image_bytes((index * 80, 0, 0))), Inches(1), Inches(2))
+    path = tmp_path / "deck.pptx"
+    presentation.save(path)
+    return str(path)
+
+
+def read_members(path):
+    with zipfile.ZipFile(path) as zip_file:
+        return {info.filename: zip_file.read(info) for info in zip_file.infolist()}
+
+
+def read_raw_members(path):
+    """Compressed bytes of each member as stored in the archive."""
+    members = {}
+    with zipfile.ZipFile(path) as zip_file, open(path, 'rb') as f:
+        for info in zip_file.infolist():
+            f.seek(info.header_offset + 26)
+            name_length, extra_length = int.from_bytes(f.read(2), 'little'), int.from_bytes(f.read(2), 'little')
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+            members[info.filename] = f.read(info.compress_size)
+    return members
+
+
+def slide_titles(presentation):
+    return [slide.shapes.title.text for slide in presentation.slides]
+
+
+def test_unchanged_save_and_reload_keeps_member_bytes(deck_path, tmp_path):
+    presentation = open_mapped_presentation(deck_path)
+    saved_path = str(tmp_path / "saved.pptx")
+    presentation.save(saved_path)
+    close_presentation_package(presentation)
+
+    assert read_members(saved_path) == read_members(deck_path)
+    if LAZY_LOADING_SUPPORTED:
+        # Nothing was loaded, so every part is copied without recompressing it
+        assert read_raw_members(saved_path) == read_raw_members(deck_path)
+        stats = presentation.part.package.last_save_stats
+        assert stats["members_written"] == 2  # [Content_Types].xml and the package rels
+        assert stats["members_copied"] == len(read_members(deck_path)) - 2
+
+    reloaded = open_mapped_presentation(saved_path)
+    assert slide_titles(reloaded) == ["Slide 0", "Slide 1", "Slide 2"]
+    resaved_path = str(tmp_path / "resaved.pptx")
+    reloaded.save(resaved_path)
+    close_presentation_package(reloaded)
+    assert read_members(resaved_path) == read_members(deck_path)
+
+
+def test_edited_save_keeps_other_members(deck_path, tmp_path):
+    presentation = open_mapped_presentation(deck_path)
+    presentation.slides[1].shapes.title.text = "Edited"
+    presentation.slides[2].shapes.add_picture(io.BytesIO(image_bytes((0, 0, 255))), Inches(5), Inches(2))
+    saved_path = str(tmp_path / "saved.pptx")
+    presentation.save(saved_path)
+    close_presentation_package(presentation)
+
+    original, saved = read_members(deck_path), read_members(saved_path)
+    for membername in ("ppt/slides/slide1.xml", "ppt/media/image1.png", "ppt/media/image2.png",
+                       "ppt/media/image3.png", "ppt/slideLayouts/slideLayout6.xml"):
+        assert saved[membername] == original[membername]
+    assert saved["ppt/slides/slide2.xml"] != original["ppt/slides/slide2.xml"]
+    assert saved["ppt/media/image4.png"] == image_bytes((0, 0, 255))
+
+    reloaded = Presentation(saved_path)
+    assert slide_titles(reloaded) == ["Slide 0", "Edited", "Slide 2"]
+    assert len(reloaded.slides[2].shapes) == 3
+
+
+def test_save_over_own_mapped_file(deck_path):
+    presentation = open_mapped_presentation(deck_path)
+    original = read_members(deck_path)
+    presentation.slides[0].shapes.title.text = "Edited"
+    save_presentation(presentation, deck_path)
+
+    # Parts not loaded yet still read from the original content
+    assert slide_titles(presentation) == ["Edited", "Slide 1", "Slide 2"]
+    close_presentation_package(presentation)
+
+    saved = read_members(deck_path)
+    assert saved["ppt/media/image2.png"] == original["ppt/media/image2.png"]
+    assert slide_titles(Presentation(deck_path)) == ["Edited", "Slide 1", "Slide 2"]
+
+
+def test_read_only_presentation_cannot_save_over_its_file(deck_path):
+    presentation = open_read_only_presentation(deck_path)
+    try:
+        with pytest.raises(ValueError):
+            save_presentation(presentation, deck_path)
+    finally:
+        close_presentation_package(presentation)
+
+
+@lazy_only
+def test_parts_load_on_first_access(deck_path):
+    presentation = open_mapped_presentation(deck_path)
+    try:
+        loaded_at_open = get_package_load_stats(presentation)["parts_loaded"]
+        slide_titles(presentation)
+        assert get_package_load_stats(presentation)["parts_loaded"] > loaded_at_open
+        assert deck_path in get_mapped_source_paths()
+    finally:
+        close_presentation_package(presentation)
+    assert deck_path not in get_mapped_source_paths()
+
+
+@lazy_only
+def test_image_sha1_follows_blob_changes(deck_path):
+    presentation = open_mapped_presentation(deck_path)
+    try:
+        picture = presentation.slides[0].shapes[1]
+        image_part = picture.part.related_part(picture._element.blip_rId)
+        sha1 = image_part.sha1
+        assert sha1 == image_part.sha1
+
+        image_part._blob = image_bytes((1, 2, 3))
+        assert image_part.sha1 != sha1
+
+        # Adding the same image again reuses the part found by its hash
+        slide = presentation.slides[1]
+        parts_before = len(list(presentation.part.package.iter_parts()))
+        slide.shapes.add_picture(io.BytesIO(image_bytes((1, 2, 3))), Inches(5), Inches(2))
+        assert len(list(presentation.part.package.iter_parts())) == parts_before
+    finally:
+        close_presentation_package(presentation)
+
+
+@pytest.mark.parametrize("read_only", [False, True])
+@pytest.mark.parametrize("move", ["delete", "rename"])
+def test_save_over_other_file_after_source_is_moved(deck_path, tmp_path, read_only, move):
+    presentation = open_read_only_presentation(deck_path) if read_only else open_mapped_presentation(deck_path)
+    try:
+        if move == "delete":
+            os.remove(deck_path)
+        else:
+            os.rename(deck_path, str(tmp_path / "moved.pptx"))
+        other_path = str(tmp_path / "other.pptx")
+        Presentation().save(other_path)
+
+        save_presentation(presentation, other_path)
+    finally:
+        close_presentation_package(presentation)
+    assert slide_titles(Presentation(other_path)) == ["Slide 0", "Slide 1", "Slide 2"]
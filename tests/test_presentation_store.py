@@ -0,0 +1,252 @@
+import os
+import threading
+from collections import defaultdict
+
+import pytest
+from pptx import Presentation
+
+from utils.package_utils import LAZY_LOADING_SUPPORTED, get_mapped_source_paths
+from utils.presentation_utils import PresentationStore, open_presentation, save_presentation
+
+
+def make_deck(*titles):
+    presentation = Presentation()
+    for title in titles:
+        presentation.slides.add_slide(presentation.slide_layouts[5]).shapes.title.text = title
+    return presentation
+
+
+def slide_titles(presentation):
+    return [slide.shapes.title.text for slide in presentation.slides]
+
+
+def spill_files(store):
+    if store._spill_dir is None:
+        return []
+    return os.listdir(store._spill_dir)
+
+
+@pytest.fixture
+def store():
+    store = PresentationStore(max_presentations=1, max_memory_mb=0)
+    yield store
+    for key in list(store):
+        del store[key]
+
+
+def test_spill_and_reload_round_trip(store):
+    store['a'] = make_deck("A1", "A2")
+    store['a'].slides[1].shapes.title.text = "A2 edited"
+    store['b'] = make_deck("B1")
+
+    assert not store.is_loaded('a')
+    assert store.get_slide_count('a') == 2
+    assert len(spill_files(store)) == 1
+    assert sorted(store) == ['a', 'b']
+
+    assert slide_titles(store['a']) == ["A1", "A2 edited"]
+    assert store.is_loaded('a') and not store.is_loaded('b')
+    assert slide_titles(store['b']) == ["B1"]
+
+    stats = store.get_stats()
+    assert stats["evictions"] == 3
+    assert stats["reloads"] == 2
+    assert stats["loaded_in_memory"] == 1 and stats["spilled_to_disk"] == 1
+    assert len(spill_files(store)) == 1  # Reloaded decks' spill files are removed
+
+
+def test_spill_and_reload_opened_file(store, tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    make_deck("original", "second").save(path)
+
+    store['a'] = open_presentation(path)
+    store['a'].slides[0].shapes.title.text = "edited"
+    store['b'] = make_deck("B1")
+    assert not store.is_loaded('a')
+
+    assert slide_titles(store['a']) == ["edited", "second"]
+    assert slide_titles(Presentation(path)) == ["original", "second"]
+
+
+def test_delete_spilled_deck_removes_spill_file(store):
+    store['a'] = make_deck("A1")
+    store['b'] = make_deck("B1")
+    assert len(spill_files(store)) == 1
+
+    del store['a']
+    assert 'a' not in store
+    assert spill_files(store) == []
+    with pytest.raises(KeyError):
+        store['a']
+
+
+def test_read_only_deck_keeps_content_when_file_is_replaced(store, tmp_path):
+    path = str(tmp_path / "demo.pptx")
+    make_deck("original").save(path)
+
+    store['r'] = open_presentation(path, mode="read")
+    store['m'] = make_deck("other")  # Evicts 'r'
+    assert not store.is_loaded('r')
+    assert store.is_read_only('r')
+    assert spill_files(store) == []  # Read-only decks are never written out
+
+    save_presentation(store['m'], path)
+    assert slide_titles(Presentation(path)) == ["other"]
+
+    assert slide_titles(store['r']) == ["original"]
+    assert store.is_read_only('r')
+
+
+@pytest.mark.skipif(not LAZY_LOADING_SUPPORTED, reason="lazy loading not supported by this python-pptx")
+def test_read_only_deck_modified_in_place_fails_to_reload(store, tmp_path):
+    path = str(tmp_path / "demo.pptx")
+    make_deck("original").save(path)
+
+    store['r'] = open_presentation(path, mode="read")
+    store['m'] = make_deck("other")
+    with open(path, "r+b") as f:
+        f.seek(0, os.SEEK_END)
+        f.write(b"x")
+
+    with pytest.raises(IOError, match="was modified after it was opened"):
+        store['r']
+    assert 'r' in store
+
+
+def test_failed_spill_keeps_deck_in_memory(store, monkeypatch):
+    store['a'] = make_deck("A1")
+
+    def save(path):
+        raise OSError(28, "No space left on device")
+    monkeypatch.setattr(store['a'], 'save', save)
+
+    store['b'] = make_deck("B1")
+    assert store.is_loaded('a') and store.is_loaded('b')
+    assert spill_files(store) == []
+
+    stats = store.get_stats()
+    assert stats["evictions"] == 0
+    assert stats["failed_evictions"] == 1
+    assert "No space left on device" in stats["last_eviction_error"]
+
+
+def test_decks_in_use_are_not_evicted():
+    locks = defaultdict(threading.RLock)
+    in_use = set()
+    store = PresentationStore(max_presentations=1, max_memory_mb=0,
+                              lock_for=locks.__getitem__, in_use=in_use.__contains__)
+
+    in_use.add('a')
+    store['a'] = make_deck("A1")
+    store['b'] = make_deck("B1")
+    assert store.is_loaded('a')
+    in_use.clear()
+
+    # Held by another thread
+    acquired, release = threading.Event(), threading.Event()
+
+    def hold():
+        with locks['a']:
+            acquired.set()
+            release.wait()
+    thread = threading.Thread(target=hold)
+    thread.start()
+    acquired.wait()
+    try:
+        store['b'] = make_deck("B2")
+        assert store.is_loaded('a')
+    finally:
+        release.set()
+        thread.join()
+
+    store['c'] = make_deck("C1")
+    assert not store.is_loaded('a') and not store.is_loaded('b')
+    assert slide_titles(store['a']) == ["A1"]
+
+
+def test_spilled_large_deck_saves_over_its_source(store, tmp_path, monkeypatch):
+    monkeypatch.setenv('PPT_MMAP_THRESHOLD_MB', '0.0001')  # Memory-map every deck opened for editing
+    path = str(tmp_path / "deck.pptx")
+    make_deck("original").save(path)
+
+    store['a'] = open_presentation(path)
+    store['b'] = make_deck("B1")
+    assert not store.is_loaded('a')
+
+    store['a'].slides.add_slide(store['a'].slide_layouts[5]).shapes.title.text = "added"
+    assert len(spill_files(store)) == 1  # Only 'b', evicted by the reload
+    # The reloaded deck doesn't keep the removed spill file mapped (which Windows wouldn't even delete)
+    assert not any(os.path.dirname(mapped) == store._spill_dir for mapped in get_mapped_source_paths())
+    save_presentation(store['a'], path)
+    assert slide_titles(Presentation(path)) == ["original", "added"]
+
+
+def blocking_reloads(store, monkeypatch):
+    """Make reloads wait for the returned event; the other event is set once one has started."""
+    started, proceed = threading.Event(), threading.Event()
+    reload = store._reload
+
+    def blocked_reload(spilled, read_only):
+        started.set()
+        assert proceed.wait(10)
+        return reload(spilled, read_only)
+    monkeypatch.setattr(store, '_reload', blocked_reload)
+    return started, proceed
+
+
+def test_reload_does_not_block_other_decks(store, monkeypatch):
+    store['a'] = make_deck("A1")
+    store['b'] = make_deck("B1")
+    started, proceed = blocking_reloads(store, monkeypatch)
+
+    results = []
+    readers = [threading.Thread(target=lambda: results.append(store['a'])) for _ in range(2)]
+    for reader in readers:
+        reader.start()
+    try:
+        assert started.wait(10)
+        # The store stays usable while 'a' is read from disk
+        assert 'a' in store and len(store) == 2
+        assert slide_titles(store['b']) == ["B1"]
+        assert store.get_slide_count('a') == 1
+    finally:
+        proceed.set()
+        for reader in readers:
+            reader.join()
+
+    assert len(results) == 2 and results[0] is results[1]
+    assert slide_titles(results[0]) == ["A1"]
+    assert store.get_stats()["reloads"] == 1
+
+
+@pytest.mark.parametrize("change", ["delete", "replace"])
+def test_deck_changed_while_reloading(store, monkeypatch, change):
+    store['a'] = make_deck("A1")
+    store['b'] = make_deck("B1")
+    started, proceed = blocking_reloads(store, monkeypatch)
+
+    results = []
+
+    def read():
+        try:
+            results.append(store['a'])
+        except KeyError as e:
+            results.append(e)
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        assert started.wait(10)
+        if change == "delete":
+            del store['a']
+        else:
+            store['a'] = make_deck("A2")
+    finally:
+        proceed.set()
+        reader.join()
+
+    if change == "delete":
+        assert isinstance(results[0], KeyError) and 'a' not in store
+    else:
+        assert slide_titles(results[0]) == ["A2"]
+    assert len(spill_files(store)) == (0 if change == "delete" else 1)  # Only 'b' (evicted for 'A2') stays spilled
+    assert store.get_stats()["reloads"] == 0
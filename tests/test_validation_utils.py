@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from utils.validation_utils import (
+    _SMALL_SWEEP_SIZE,
+    check_slide_snapshot,
+    check_slide_snapshots,
+    find_overlapping_shapes,
+    minimum_shape_spacing,
+)
+
+
+def overlapping_pairs_baseline(bounds):
+    pairs = []
+    for i, box1 in enumerate(bounds):
+        for j in range(i + 1, len(bounds)):
+            box2 = bounds[j]
+            if box1 is None or box2 is None:
+                continue
+            left1, top1, width1, height1 = box1
+            left2, top2, width2, height2 = box2
+            if not (left1 + width1 <= left2 or left2 + width2 <= left1 or
+                    top1 + height1 <= top2 or top2 + height2 <= top1):
+                pairs.append((i, j))
+    return pairs
+
+
+def minimum_spacing_baseline(bounds):
+    spacing = float('inf')
+    for i, box1 in enumerate(bounds):
+        for box2 in bounds[i + 1:]:
+            left1, top1, width1, height1 = box1
+            left2, top2, width2, height2 = box2
+            gap_x = max(0, max(left1, left2) - min(left1 + width1, left2 + width2))
+            gap_y = max(0, max(top1, top2) - min(top1 + height1, top2 + height2))
+            spacing = min(spacing, gap_x, gap_y)
+    return spacing
+
+
+def random_bounds(rng, count, extent, max_size, allow_missing=True):
+    bounds = []
+    for _ in range(count):
+        if allow_missing and rng.random() < 0.05:
+            bounds.append(None)
+            continue
+        # Coarse coordinates so shared edges and zero-size boxes come up often
+        bounds.append((rng.randrange(extent), rng.randrange(extent),
+                       rng.randrange(max_size), rng.randrange(max_size)))
+    return bounds
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 5, _SMALL_SWEEP_SIZE - 1, _SMALL_SWEEP_SIZE,
+                                   _SMALL_SWEEP_SIZE + 1, _SMALL_SWEEP_SIZE + 2, 300])
+@pytest.mark.parametrize("max_size", [3, 20, 80])
+def test_find_overlapping_shapes_matches_baseline(count, max_size):
+    rng = random.Random(count * 1000 + max_size)
+    for _ in range(5):
+        bounds = random_bounds(rng, count, 100, max_size)
+        assert find_overlapping_shapes(bounds) == overlapping_pairs_baseline(bounds)
+
+
+def test_find_overlapping_shapes_cutover_counts_only_positioned_shapes():
+    # More entries than the cutover, but fewer positioned boxes, and the reverse
+    rng = random.Random(7)
+    for count, missing in [(_SMALL_SWEEP_SIZE + 10, 20), (_SMALL_SWEEP_SIZE + 1, 0)]:
+        bounds = random_bounds(rng, count, 50, 30, allow_missing=False)
+        for index in rng.sample(range(count), missing):
+            bounds[index] = None
+        assert find_overlapping_shapes(bounds) == overlapping_pairs_baseline(bounds)
+
+
+@pytest.mark.parametrize("count", [_SMALL_SWEEP_SIZE, 2 * _SMALL_SWEEP_SIZE])
+def test_find_overlapping_shapes_rows_and_grids(count):
+    # Side-by-side rows sharing edges, plus one box across all of them
+    bounds = [(i * 10, (i % 4) * 10, 10, 10) for i in range(count)]
+    bounds.append((5, 5, count * 10, 10))
+    assert find_overlapping_shapes(bounds) == overlapping_pairs_baseline(bounds)
+
+    identical = [(0, 0, 10, 10)] * count
+    assert find_overlapping_shapes(identical) == overlapping_pairs_baseline(identical)
+
+
+@pytest.mark.parametrize("count", [2, 10, 150])
+def test_minimum_shape_spacing_matches_baseline(count):
+    rng = random.Random(count)
+    for _ in range(20):
+        bounds = random_bounds(rng, count, 10000, 300, allow_missing=False)
+        assert minimum_shape_spacing(bounds) == minimum_spacing_baseline(bounds)
+
+
+def test_minimum_shape_spacing_missing_bounds():
+    assert minimum_shape_spacing([(0, 0, 10, 10)]) == 0
+    assert minimum_shape_spacing([(0, 0, 10, 10), None]) == 0
+
+
+def test_check_slide_snapshots_matches_serial_checks():
+    rng = random.Random(3)
+    snapshots = []
+    for slide in range(12):
+        shapes = []
+        for index, box in enumerate(random_bounds(rng, 8, 9144000, 4000000)):
+            has_text = index % 2 == 0
+            shapes.append({
+                'name': f'Shape {slide}.{index}',
+                'bounds': box,
+                'text': ('Lorem ipsum dolor sit amet ' * (index + 1)) if has_text else None,
+                'font': None,
+                'empty_paragraphs': index % 4 if has_text else 0
+            })
+        snapshots.append({'shapes': shapes})
+
+    expected = [check_slide_snapshot(snapshot) for snapshot in snapshots]
+    assert check_slide_snapshots(snapshots, max_workers=4) == expected
+    assert check_slide_snapshots(snapshots, max_workers=1) == expected
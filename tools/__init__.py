@@ -13,6 +13,7 @@ from .chart_tools import register_chart_tools
 from .connector_tools import register_connector_tools
 from .master_tools import register_master_tools
 from .transition_tools import register_transition_tools
+from .media_tools import register_media_tools
 
 __all__ = [
     "register_presentation_tools",
@@ -24,5 +25,6 @@ __all__ = [
     "register_chart_tools",
     "register_connector_tools",
     "register_master_tools",
-    "register_transition_tools"
+    "register_transition_tools",
+    "register_media_tools"
 ]
\ No newline at end of file
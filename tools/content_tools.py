@@ -5,8 +5,7 @@ Handles slides, text, images, and content manipulation.
 from typing import Dict, List, Optional, Any, Union
 from mcp.server.fastmcp import FastMCP
 import utils as ppt_utils
-import tempfile
-import base64
+import io
 import os
 
 
@@ -123,8 +122,33 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
             }
 
     @app.tool()
-    def extract_presentation_text(presentation_id: Optional[str] = None, include_slide_info: bool = True) -> Dict:
-        """Extract all text content from all slides in the presentation."""
+    def extract_presentation_text(
+        presentation_id: Optional[str] = None,
+        include_slide_info: bool = True,
+        start_slide: int = 0,
+        end_slide: Optional[int] = None,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_combined_text: bool = True,
+        text_only: bool = False
+    ) -> Dict:
+        """
+        Extract all text content from all slides in the presentation.
+        
+        Large decks can be read page by page: set page_size, then pass the
+        returned next_cursor back (with the same options) until it is None.
+        Statistics then cover the slides of the returned page.
+        
+        Args:
+            presentation_id: Presentation ID (uses current if None)
+            include_slide_info: Whether to include layout name and text statistics per slide
+            start_slide: First slide index to extract
+            end_slide: Last slide index to extract, inclusive (last slide if None)
+            page_size: Maximum number of slides to return (all slides in the range if None)
+            cursor: next_cursor from a previous page (overrides start_slide, end_slide and page_size)
+            include_combined_text: Whether to include all_presentation_text_combined
+            text_only: Return only the combined text of each slide instead of the text broken down by shape
+        """
         pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
         
         if pres_id is None or pres_id not in presentations:
@@ -133,6 +157,34 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
             }
         
         pres = presentations[pres_id]
+        slides = pres.slides
+        slide_count = len(slides)
+        
+        if cursor is not None:
+            try:
+                position = ppt_utils.decode_text_cursor(cursor)
+            except ValueError as e:
+                return {"error": str(e)}
+            if position["presentation_id"] != pres_id:
+                return {"error": "Cursor belongs to a different presentation"}
+            if position["slide_count"] != slide_count:
+                return {
+                    "error": "Presentation slides changed since the cursor was issued; restart the extraction"
+                }
+            start_slide = position["next_slide"]
+            end_slide = position["end_slide"]
+            page_size = position["page_size"]
+        
+        if end_slide is None:
+            end_slide = slide_count - 1
+        if slide_count and (start_slide < 0 or start_slide > end_slide or end_slide >= slide_count):
+            return {
+                "error": f"Invalid slide range: {start_slide}-{end_slide}. Available slides: 0-{slide_count - 1}"
+            }
+        if page_size is not None and page_size < 1:
+            return {"error": "page_size must be at least 1"}
+        
+        page_end = end_slide if page_size is None else min(end_slide, start_slide + page_size - 1)
         
         try:
             slides_text = []
@@ -141,14 +193,21 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
             slides_with_titles = 0
             all_presentation_text = []
             
-            for slide_index, slide in enumerate(pres.slides):
+            for slide_index in range(start_slide, page_end + 1):
+                slide = slides[slide_index]
                 slide_text_result = ppt_utils.extract_slide_text_content(slide)
                 
                 if slide_text_result["success"]:
-                    slide_data = {
-                        "slide_index": slide_index,
-                        "text_content": slide_text_result["text_content"]
-                    }
+                    if text_only:
+                        slide_data = {
+                            "slide_index": slide_index,
+                            "text": slide_text_result["text_content"]["all_text_combined"]
+                        }
+                    else:
+                        slide_data = {
+                            "slide_index": slide_index,
+                            "text_content": slide_text_result["text_content"]
+                        }
                     
                     if include_slide_info:
                         # Add basic slide info
@@ -167,7 +226,7 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                         slides_with_titles += 1
                     
                     # Collect all text for combined output
-                    if slide_text_result["text_content"]["all_text_combined"]:
+                    if include_combined_text and slide_text_result["text_content"]["all_text_combined"]:
                         all_presentation_text.append(f"=== SLIDE {slide_index + 1} ===")
                         all_presentation_text.append(slide_text_result["text_content"]["all_text_combined"])
                         all_presentation_text.append("")  # Empty line separator
@@ -175,20 +234,36 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                     slides_text.append({
                         "slide_index": slide_index,
                         "error": slide_text_result.get("error", "Unknown error"),
-                        "text_content": None
+                        "text" if text_only else "text_content": None
                     })
             
-            return {
+            result = {
                 "success": True,
                 "presentation_id": pres_id,
-                "total_slides": len(pres.slides),
-                "slides_with_text": len([s for s in slides_text if s.get("text_content") is not None]),
+                "total_slides": slide_count,
+                "slides_with_text": len([
+                    s for s in slides_text if s.get("text" if text_only else "text_content") is not None
+                ]),
                 "total_text_shapes": total_text_shapes,
                 "slides_with_titles": slides_with_titles,
                 "slides_with_tables": slides_with_tables,
-                "slides_text": slides_text,
-                "all_presentation_text_combined": "\n".join(all_presentation_text)
+                "slides_text": slides_text
             }
+            if include_combined_text:
+                result["all_presentation_text_combined"] = "\n".join(all_presentation_text)
+            
+            if page_size is not None or cursor is not None or start_slide != 0 or end_slide != slide_count - 1:
+                has_more = page_end < end_slide
+                result["page"] = {
+                    "start_slide": start_slide,
+                    "end_slide": page_end,
+                    "has_more": has_more,
+                    "next_cursor": ppt_utils.encode_text_cursor(
+                        pres_id, page_end + 1, end_slide, page_size or (end_slide - start_slide + 1), slide_count
+                    ) if has_more else None
+                }
+            
+            return result
             
         except Exception as e:
             return {
@@ -471,11 +546,132 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                 "error": f"Failed to {operation} text: {str(e)}"
             }
 
+    @app.tool()
+    def validate_presentation(
+        slide_indices: Optional[List[int]] = None,
+        auto_fix: bool = False,
+        min_font_size: int = 8,
+        max_font_size: int = 72,
+        include_passed_slides: bool = False,
+        presentation_id: Optional[str] = None
+    ) -> Dict:
+        """
+        Validate every slide of a presentation in one call.
+        
+        Each slide's shape geometry and text are copied into plain data first,
+        then text fit, overlap, out-of-bounds and spacing checks run across
+        slides on a worker pool. With auto_fix, the suggested font sizes are
+        applied afterwards, one slide at a time.
+        
+        Args:
+            slide_indices: Slides to validate (all slides if None)
+            auto_fix: Whether to apply suggested font sizes to text that may not fit
+            min_font_size: Minimum font size for auto-fix
+            max_font_size: Maximum font size for auto-fix
+            include_passed_slides: Whether to include slides without issues or warnings in the report
+            presentation_id: Presentation ID (uses current if None)
+        """
+        pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+        
+        if pres_id is None or pres_id not in presentations:
+            return {
+                "error": "No presentation is currently loaded or the specified ID is invalid"
+            }
+        
+        pres = presentations[pres_id]
+        if auto_fix and ppt_utils.is_read_only_presentation(pres):
+            return {
+                "error": f"Presentation '{pres_id}' was opened read-only; reopen it with mode='edit' to auto-fix"
+            }
+        slides = list(pres.slides)
+        
+        if slide_indices is None:
+            slide_indices = list(range(len(slides)))
+        invalid_indices = [index for index in slide_indices if index < 0 or index >= len(slides)]
+        if invalid_indices:
+            return {
+                "error": f"Invalid slide indices: {invalid_indices}. Available slides: 0-{len(slides) - 1}"
+            }
+        
+        try:
+            geometry = ppt_utils.get_slide_geometry(pres)
+            snapshots = [ppt_utils.snapshot_slide(slides[index]) for index in slide_indices]
+            checks = ppt_utils.check_slide_snapshots(snapshots, geometry)
+            
+            slide_reports = []
+            totals = {
+                "text_issues": 0,
+                "overlapping_shapes": 0,
+                "shapes_outside": 0,
+                "fixes_applied": 0
+            }
+            
+            for slide_index, check in zip(slide_indices, checks):
+                layout = check["layout"]
+                fixes_applied = []
+                
+                # Auto-fix serially, after all checks are done
+                if auto_fix:
+                    shapes = list(slides[slide_index].shapes)
+                    for fix in check["font_fixes"]:
+                        suggested_size = max(min_font_size, min(fix["suggested_font_size"], max_font_size))
+                        try:
+                            for paragraph in shapes[fix["shape_index"]].text_frame.paragraphs:
+                                for run in paragraph.runs:
+                                    run.font.size = suggested_size * 12700  # Convert to EMU
+                            fixes_applied.append(f"Shape {fix['shape_index']}: Adjusted font size to {suggested_size}pt")
+                        except Exception as e:
+                            check["warnings"].append(
+                                f"Shape {fix['shape_index']}: Could not auto-fix font size: {str(e)}"
+                            )
+                
+                issues = check["text_issues"] + layout["issues"]
+                totals["text_issues"] += len(check["text_issues"])
+                totals["overlapping_shapes"] += len(layout["overlapping_shapes"])
+                totals["shapes_outside"] += len(layout["shapes_outside"])
+                totals["fixes_applied"] += len(fixes_applied)
+                
+                passed = not issues
+                if passed and not check["warnings"] and not layout["suggestions"] and not include_passed_slides:
+                    continue
+                
+                slide_reports.append({
+                    "slide_index": slide_index,
+                    "validation_passed": passed,
+                    "issues": issues,
+                    "warnings": check["warnings"],
+                    "suggestions": layout["suggestions"],
+                    "overlapping_shapes": layout["overlapping_shapes"],
+                    "shapes_outside": layout["shapes_outside"],
+                    "fixes_applied": fixes_applied
+                })
+            
+            slides_with_issues = sum(1 for report in slide_reports if not report["validation_passed"])
+            summary = f"Validated {len(slide_indices)} slides: {slides_with_issues} with issues"
+            if auto_fix:
+                summary += f", applied {totals['fixes_applied']} fixes"
+            
+            return {
+                "presentation_id": pres_id,
+                "validation_passed": slides_with_issues == 0,
+                "summary": summary,
+                "slide_size": geometry.to_dict(),
+                "slides_checked": len(slide_indices),
+                "slides_with_issues": slides_with_issues,
+                "totals": totals,
+                "slides": slide_reports
+            }
+            
+        except Exception as e:
+            return {
+                "error": f"Failed to validate presentation: {str(e)}"
+            }
+
     @app.tool()
     def manage_image(
         slide_index: int,
         operation: str,  # "add", "enhance"
-        image_source: str,  # file path or base64 string
+        image_source: str,  # file path, or base64 string / data URI
         source_type: str = "file",  # "file" or "base64"
         left: float = 1.0,
         top: float = 1.0,
@@ -490,9 +686,19 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
         blur_radius: float = 0,
         filter_type: Optional[str] = None,
         output_path: Optional[str] = None,
+        # Insertion optimization options
+        optimize: bool = False,
+        target_dpi: float = 150,
+        convert_photos: bool = False,
+        jpeg_quality: int = 85,
         presentation_id: Optional[str] = None
     ) -> Dict:
-        """Unified image management tool for adding and enhancing images."""
+        """Unified image management tool for adding and enhancing images.
+        
+        With optimize=True, added images are downscaled to target_dpi at their placed
+        size, stripped of metadata, and (with convert_photos) opaque photographic PNGs
+        are re-encoded as JPEG at jpeg_quality; the response reports the bytes saved.
+        """
         pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
         
         if pres_id is None or pres_id not in presentations:
@@ -500,6 +706,16 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
+        if optimize and target_dpi <= 0:
+            return {
+                "error": f"Invalid target_dpi: {target_dpi}. Must be greater than 0"
+            }
+        
+        if optimize and not 1 <= jpeg_quality <= 95:
+            return {
+                "error": f"Invalid jpeg_quality: {jpeg_quality}. Must be between 1 and 95"
+            }
+        
         pres = presentations[pres_id]
         
         if slide_index < 0 or slide_index >= len(pres.slides):
@@ -512,23 +728,23 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
         try:
             if operation == "add":
                 if source_type == "base64":
-                    # Handle base64 image
+                    # Decode straight into memory; python-pptx reads the image from the stream
                     try:
-                        image_data = base64.b64decode(image_source)
-                        with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
-                            temp_file.write(image_data)
-                            temp_path = temp_file.name
-                        
-                        # Add image from temporary file
-                        shape = ppt_utils.add_image(slide, temp_path, left, top, width, height)
-                        
-                        # Clean up temporary file
-                        os.unlink(temp_path)
-                        
-                        return {
+                        image_data, image_format = ppt_utils.decode_image_data(image_source)
+                        result = {
                             "message": f"Added image from base64 to slide {slide_index}",
-                            "shape_index": len(slide.shapes) - 1
+                            "image_format": image_format
                         }
+                        if optimize:
+                            shape, result["optimization"] = ppt_utils.add_optimized_image(
+                                slide, io.BytesIO(image_data), left, top, width, height,
+                                target_dpi, convert_photos, jpeg_quality
+                            )
+                        else:
+                            shape = ppt_utils.add_image(slide, io.BytesIO(image_data), left, top, width, height)
+                        result["shape_index"] = len(slide.shapes) - 1
+                        
+                        return result
                     except Exception as e:
                         return {
                             "error": f"Failed to process base64 image: {str(e)}"
@@ -540,12 +756,19 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                             "error": f"Image file not found: {image_source}"
                         }
                     
-                    shape = ppt_utils.add_image(slide, image_source, left, top, width, height)
-                    return {
+                    result = {
                         "message": f"Added image to slide {slide_index}",
-                        "shape_index": len(slide.shapes) - 1,
                         "image_path": image_source
                     }
+                    if optimize:
+                        shape, result["optimization"] = ppt_utils.add_optimized_image(
+                            slide, image_source, left, top, width, height,
+                            target_dpi, convert_photos, jpeg_quality
+                        )
+                    else:
+                        shape = ppt_utils.add_image(slide, image_source, left, top, width, height)
+                    result["shape_index"] = len(slide.shapes) - 1
+                    return result
             
             elif operation == "enhance":
                 # Enhance existing image file
@@ -590,4 +813,121 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
         except Exception as e:
             return {
                 "error": f"Failed to {operation} image: {str(e)}"
-            }
\ No newline at end of file
+            }
+    
+    @app.tool()
+    def add_images(
+        images: List[Dict[str, Any]],
+        stop_on_error: bool = False,
+        optimize: bool = False,
+        target_dpi: float = 150,
+        convert_photos: bool = False,
+        jpeg_quality: int = 85,
+        presentation_id: Optional[str] = None
+    ) -> Dict:
+        """
+        Add many images to many slides in one call.
+        
+        Each distinct image source is read or decoded once per call, and identical
+        images are stored once in the package however many slides use them.
+        
+        Args:
+            images: Images to add, each {"slide_index": int, "image_source": file path or
+                base64 string / data URI, "source_type": "file" (default) or "base64",
+                "left": inches (default 1.0), "top": inches (default 1.0),
+                "width": inches, "height": inches}. When only one of width and height
+                is given the aspect ratio is kept; with neither the native size is used.
+            stop_on_error: Stop at the first image that fails instead of continuing
+            optimize: Downscale each image to target_dpi at its placed size and strip its metadata
+            target_dpi: Resolution to keep when optimizing
+            convert_photos: When optimizing, re-encode opaque photographic PNGs as JPEG
+            jpeg_quality: JPEG quality (1-95) for images re-encoded when optimizing
+            presentation_id: Presentation ID (uses current if None)
+        """
+        pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+        
+        if pres_id is None or pres_id not in presentations:
+            return {
+                "error": "No presentation is currently loaded or the specified ID is invalid"
+            }
+        
+        if not images:
+            return {
+                "error": "Images list cannot be empty"
+            }
+        
+        if optimize and target_dpi <= 0:
+            return {
+                "error": f"Invalid target_dpi: {target_dpi}. Must be greater than 0"
+            }
+        
+        if optimize and not 1 <= jpeg_quality <= 95:
+            return {
+                "error": f"Invalid jpeg_quality: {jpeg_quality}. Must be between 1 and 95"
+            }
+        
+        pres = presentations[pres_id]
+        slides = list(pres.slides)
+        sources = {}  # (source_type, image_source) -> CachedImage
+        results = []
+        added = 0
+        bytes_saved = 0
+        
+        for index, image in enumerate(images):
+            entry = {"index": index}
+            try:
+                slide_index = image["slide_index"]
+                image_source = image["image_source"]
+                source_type = image.get("source_type", "file")
+                entry["slide_index"] = slide_index
+                
+                if slide_index < 0 or slide_index >= len(slides):
+                    raise ValueError(f"Invalid slide index: {slide_index}. Available slides: 0-{len(slides) - 1}")
+                if source_type not in ("file", "base64"):
+                    raise ValueError(f"Invalid source_type: {source_type}. Must be 'file' or 'base64'")
+                
+                key = (source_type, image_source)
+                if key not in sources:
+                    if source_type == "base64":
+                        image_data, _ = ppt_utils.decode_image_data(image_source)
+                        sources[key] = ppt_utils.image_cache.get(image_data)
+                    else:
+                        if not os.path.exists(image_source):
+                            raise ValueError(f"Image file not found: {image_source}")
+                        sources[key] = ppt_utils.image_cache.get(image_source)
+                cached_image = sources[key]
+                
+                slide = slides[slide_index]
+                # File images go in by path so the picture keeps the file name as its description
+                placement = (
+                    slide, image_source if source_type == "file" else cached_image,
+                    image.get("left", 1.0), image.get("top", 1.0), image.get("width"), image.get("height")
+                )
+                if optimize:
+                    _, report = ppt_utils.add_optimized_image(*placement, target_dpi, convert_photos, jpeg_quality)
+                    entry["bytes_saved"] = report["bytes_saved"]
+                    bytes_saved += report["bytes_saved"]
+                else:
+                    ppt_utils.add_image(*placement)
+                entry["shape_index"] = len(slide.shapes) - 1
+                entry["image_format"] = cached_image.format
+                added += 1
+            except KeyError as e:
+                entry["error"] = f"Missing required field: {str(e)}"
+            except Exception as e:
+                entry["error"] = f"Failed to add image: {str(e)}"
+            
+            results.append(entry)
+            if "error" in entry and stop_on_error:
+                break
+        
+        result = {
+            "message": f"Added {added} of {len(images)} images",
+            "added": added,
+            "failed": len(results) - added,
+            "distinct_images": len(sources),
+            "results": results
+        }
+        if optimize:
+            result["bytes_saved"] = bytes_saved
+        return result
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+Media optimization tools for PowerPoint MCP Server.
+Shrinks the images and media embedded in a presentation.
+"""
+import time
+from typing import Dict, Optional
+from mcp.server.fastmcp import FastMCP
+import utils as ppt_utils
+
+
+def register_media_tools(app: FastMCP, presentations: Dict, get_current_presentation_id):
+    """Register media optimization tools with the FastMCP app"""
+
+    @app.tool()
+    def optimize_presentation_media(
+        target_dpi: float = 150,
+        convert_photos: bool = False,
+        jpeg_quality: int = 85,
+        deduplicate: bool = True,
+        presentation_id: Optional[str] = None
+    ) -> Dict:
+        """
+        Shrink oversized and duplicate media in a presentation.
+
+        Identical images and media files are merged into one part, and every image with
+        more pixels than target_dpi needs at the largest size it is shown at (after
+        cropping and group scaling) is downsampled and recompressed, in parallel worker
+        threads. Slides look the same; shapes keep their size and position. Save the
+        presentation afterwards to write the smaller file.
+
+        Args:
+            target_dpi: Resolution to keep at each image's largest displayed size
+            convert_photos: Re-encode opaque photographic PNG, BMP and TIFF images as JPEG
+            jpeg_quality: JPEG quality (1-95) for re-encoded images
+            deduplicate: Merge image and media parts with identical content
+            presentation_id: Presentation ID (uses current if None)
+
+        Returns:
+            Before/after report: media bytes, bytes saved, duplicates merged, images
+            optimized and skipped, and per-image pixel and byte sizes
+        """
+        pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+
+        if pres_id is None or pres_id not in presentations:
+            return {
+                "error": "No presentation is currently loaded or the specified ID is invalid"
+            }
+
+        if target_dpi <= 0:
+            return {
+                "error": f"Invalid target_dpi: {target_dpi}. Must be greater than 0"
+            }
+
+        if not 1 <= jpeg_quality <= 95:
+            return {
+                "error": f"Invalid jpeg_quality: {jpeg_quality}. Must be between 1 and 95"
+            }
+
+        try:
+            started = time.perf_counter()
+            report = ppt_utils.optimize_presentation_images(
+                presentations[pres_id],
+                target_dpi=target_dpi,
+                convert_photos=convert_photos,
+                jpeg_quality=jpeg_quality,
+                deduplicate=deduplicate
+            )
+            report["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+            return {
+                "message": (
+                    f"Optimized {report['images_optimized']} images and merged {report['duplicates_merged']} "
+                    f"duplicates, saving {report['bytes_saved'] / (1024 * 1024):.1f} MB"
+                ),
+                "presentation_id": pres_id,
+                **report
+            }
+        except Exception as e:
+            return {
+                "error": f"Failed to optimize presentation media: {str(e)}"
+            }
@@ -3,7 +3,10 @@ Presentation management tools for PowerPoint MCP Server.
 Handles presentation creation, opening, saving, and core properties.
 """
 from typing import Dict, List, Optional, Any
+import base64
+import hashlib
 import os
+import time
 from mcp.server.fastmcp import FastMCP
 import utils as ppt_utils
 
@@ -11,6 +14,16 @@ import utils as ppt_utils
 def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, get_template_search_directories):
     """Register presentation management tools with the FastMCP app"""
     
+    def generate_presentation_id() -> str:
+        """Generate a presentation ID not used by any loaded presentation."""
+        number = len(presentations) + 1
+        while f"presentation_{number}" in presentations:
+            number += 1
+        return f"presentation_{number}"
+    
+    # Name -> path index of the template files in the search directories
+    template_index = ppt_utils.TemplateFileIndex(get_template_search_directories)
+    
     @app.tool()
     def create_presentation(id: Optional[str] = None) -> Dict:
         """Create a new PowerPoint presentation."""
@@ -19,7 +32,7 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
         
         # Generate an ID if not provided
         if id is None:
-            id = f"presentation_{len(presentations) + 1}"
+            id = generate_presentation_id()
         
         # Store the presentation
         presentations[id] = pres
@@ -36,16 +49,12 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
         """Create a new PowerPoint presentation from a template file."""
         # Check if template file exists
         if not os.path.exists(template_path):
-            # Try to find the template by searching in configured directories
-            search_dirs = get_template_search_directories()
-            template_name = os.path.basename(template_path)
-            
-            for directory in search_dirs:
-                potential_path = os.path.join(directory, template_name)
-                if os.path.exists(potential_path):
-                    template_path = potential_path
-                    break
+            # Try to find the template in the configured directories
+            indexed_path = template_index.resolve(template_path)
+            if indexed_path is not None:
+                template_path = indexed_path
             else:
+                search_dirs = get_template_search_directories()
                 env_path_info = f" (PPT_TEMPLATE_PATH: {os.environ.get('PPT_TEMPLATE_PATH', 'not set')})" if os.environ.get('PPT_TEMPLATE_PATH') else ""
                 return {
                     "error": f"Template file not found: {template_path}. Searched in {', '.join(search_dirs)}{env_path_info}"
@@ -61,7 +70,7 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
         
         # Generate an ID if not provided
         if id is None:
-            id = f"presentation_{len(presentations) + 1}"
+            id = generate_presentation_id()
         
         # Store the presentation
         presentations[id] = pres
@@ -75,8 +84,23 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
         }
 
     @app.tool()
-    def open_presentation(file_path: str, id: Optional[str] = None) -> Dict:
-        """Open an existing PowerPoint presentation from a file."""
+    def open_presentation(file_path: str, id: Optional[str] = None, mode: str = "edit") -> Dict:
+        """
+        Open an existing PowerPoint presentation from a file.
+        
+        Args:
+            file_path: Path to the .pptx file
+            id: Optional ID for the presentation (generated if not provided)
+            mode: "edit" (default) loads the whole file. "read" opens it read-only:
+                slides, images and chart workbooks are only loaded when a tool reads
+                them, so info, slide counts and text extraction respond much sooner
+                on large decks. Tools that modify presentations are refused.
+        """
+        if mode not in ("edit", "read"):
+            return {
+                "error": f"Invalid mode '{mode}'. Use 'edit' or 'read'"
+            }
+        
         # Check if file exists
         if not os.path.exists(file_path):
             return {
@@ -84,8 +108,9 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
             }
         
         # Open the presentation
+        start = time.perf_counter()
         try:
-            pres = ppt_utils.open_presentation(file_path)
+            pres = ppt_utils.open_presentation(file_path, mode=mode)
         except Exception as e:
             return {
                 "error": f"Failed to open presentation: {str(e)}"
@@ -93,20 +118,39 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
         
         # Generate an ID if not provided
         if id is None:
-            id = f"presentation_{len(presentations) + 1}"
+            id = generate_presentation_id()
         
         # Store the presentation
         presentations[id] = pres
+        slide_count = len(pres.slides)
+        open_time_ms = round((time.perf_counter() - start) * 1000, 1)
         
-        return {
+        result = {
             "presentation_id": id,
             "message": f"Opened presentation from {file_path} with ID: {id}",
-            "slide_count": len(pres.slides)
+            "slide_count": slide_count
         }
+        if mode == "read":
+            result.update({
+                "mode": mode,
+                "open_time_ms": open_time_ms,
+                "estimated_memory_mb": round(ppt_utils.estimate_presentation_memory(pres) / (1024 * 1024), 2),
+                **ppt_utils.get_package_load_stats(pres)
+            })
+        return result
 
     @app.tool()
-    def save_presentation(file_path: str, presentation_id: Optional[str] = None) -> Dict:
-        """Save a presentation to a file."""
+    def save_presentation(file_path: str, presentation_id: Optional[str] = None, async_mode: bool = False) -> Dict:
+        """
+        Save a presentation to a file.
+        
+        Args:
+            file_path: Path where the file should be saved
+            presentation_id: Presentation to save (uses current if not provided)
+            async_mode: Return at once with a job ID and write the file in the
+                background; poll get_save_status for progress. The presentation
+                is saved as it is at the time of the call.
+        """
         # Use the specified presentation or the current one
         pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
         
@@ -115,6 +159,20 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
+        if async_mode:
+            try:
+                job_id = ppt_utils.save_jobs.submit(presentations[pres_id], file_path, owner=presentations.namespace())
+                return {
+                    "message": f"Saving presentation to {file_path} in the background",
+                    "job_id": job_id,
+                    "file_path": file_path,
+                    "status": "pending"
+                }
+            except Exception as e:
+                return {
+                    "error": f"Failed to save presentation: {str(e)}"
+                }
+        
         # Save the presentation
         try:
             saved_path = ppt_utils.save_presentation(presentations[pres_id], file_path)
@@ -127,6 +185,98 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
                 "error": f"Failed to save presentation: {str(e)}"
             }
 
+    @app.tool()
+    def get_save_status(job_id: str) -> Dict:
+        """
+        Get the progress of a background save started with save_presentation(async_mode=True).
+        
+        Args:
+            job_id: Job ID returned by save_presentation
+        """
+        status = ppt_utils.save_jobs.get_status(job_id, owner=presentations.namespace())
+        if status is None:
+            return {
+                "error": f"Unknown save job: {job_id}"
+            }
+        return status
+
+    @app.tool()
+    def export_presentation(
+        presentation_id: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        chunk_index: int = 0,
+        export_id: Optional[str] = None
+    ) -> Dict:
+        """
+        Get a presentation as base64-encoded .pptx content, without writing a file on the server.
+        
+        Args:
+            presentation_id: Presentation to export (uses current if not provided)
+            chunk_size: Return the file in chunks of this many bytes. The call returns
+                chunk_index and an export_id; fetch the remaining chunks with export_id
+                and chunk_index (the deck isn't serialized again). Whole file if not provided.
+            chunk_index: Chunk to return
+            export_id: Export from an earlier chunked call to read another chunk of
+        """
+        if chunk_size is not None and chunk_size <= 0:
+            return {
+                "error": "chunk_size must be positive"
+            }
+        
+        if export_id is not None:
+            export = ppt_utils.export_cache.get(export_id, owner=presentations.namespace())
+            if export is None:
+                return {
+                    "error": f"Unknown or expired export: {export_id}. Export the presentation again."
+                }
+        else:
+            pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+            
+            if pres_id is None or pres_id not in presentations:
+                return {
+                    "error": "No presentation is currently loaded or the specified ID is invalid"
+                }
+            
+            try:
+                data = ppt_utils.export_presentation_bytes(presentations[pres_id])
+            except Exception as e:
+                return {
+                    "error": f"Failed to export presentation: {str(e)}"
+                }
+            
+            if chunk_size is None or chunk_size >= len(data):
+                return {
+                    "presentation_id": pres_id,
+                    "mime_type": ppt_utils.PPTX_MIME_TYPE,
+                    "encoding": "base64",
+                    "size_bytes": len(data),
+                    "sha256": hashlib.sha256(data).hexdigest(),
+                    "data": base64.b64encode(data).decode('ascii')
+                }
+            export_id = ppt_utils.export_cache.add(data, chunk_size, owner=presentations.namespace())
+            export = ppt_utils.export_cache.get(export_id, owner=presentations.namespace())
+        
+        data, chunk_size = export["data"], export["chunk_size"]
+        total_chunks = (len(data) + chunk_size - 1) // chunk_size
+        if chunk_index < 0 or chunk_index >= total_chunks:
+            return {
+                "error": f"Invalid chunk_index: {chunk_index}. Available chunks: 0-{total_chunks - 1}"
+            }
+        
+        start = chunk_index * chunk_size
+        return {
+            "export_id": export_id,
+            "mime_type": ppt_utils.PPTX_MIME_TYPE,
+            "encoding": "base64",
+            "size_bytes": len(data),
+            "sha256": export["sha256"],
+            "chunk_size": chunk_size,
+            "chunk_index": chunk_index,
+            "total_chunks": total_chunks,
+            "has_more": chunk_index + 1 < total_chunks,
+            "data": base64.b64encode(data[start:start + chunk_size]).decode('ascii')
+        }
+
     @app.tool()
     def get_presentation_info(presentation_id: Optional[str] = None) -> Dict:
         """Get information about a presentation."""
@@ -153,16 +303,12 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
         """Get information about a template file including layouts and properties."""
         # Check if template file exists
         if not os.path.exists(template_path):
-            # Try to find the template by searching in configured directories
-            search_dirs = get_template_search_directories()
-            template_name = os.path.basename(template_path)
-            
-            for directory in search_dirs:
-                potential_path = os.path.join(directory, template_name)
-                if os.path.exists(potential_path):
-                    template_path = potential_path
-                    break
+            # Try to find the template in the configured directories
+            indexed_path = template_index.resolve(template_path)
+            if indexed_path is not None:
+                template_path = indexed_path
             else:
+                search_dirs = get_template_search_directories()
                 return {
                     "error": f"Template file not found: {template_path}. Searched in {', '.join(search_dirs)}"
                 }
@@ -174,6 +320,21 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
                 "error": f"Failed to get template info: {str(e)}"
             }
 
+    @app.tool()
+    def list_available_template_files() -> Dict:
+        """List the template files (.pptx/.potx) found in the template search directories."""
+        try:
+            templates = template_index.list_files()
+            return {
+                "templates": templates,
+                "total_templates": len(templates),
+                "search_directories": template_index.get_directories()
+            }
+        except Exception as e:
+            return {
+                "error": f"Failed to list template files: {str(e)}"
+            }
+
     @app.tool()
     def set_core_properties(
         title: Optional[str] = None,
@@ -245,7 +245,7 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
             template_id: ID of the template to get information about
         """
         try:
-            templates_data = template_utils.load_slide_templates()
+            templates_data = template_utils.get_slide_templates()
             
             if template_id not in templates_data.get('templates', {}):
                 available_templates = list(templates_data.get('templates', {}).keys())
@@ -262,7 +262,7 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
                 element_info = {
                     "type": element.get('type'),
                     "role": element.get('role'),
-                    "position": element.get('position'),
+                    "position": template_utils.thaw_template_data(element.get('position')),
                     "placeholder_text": element.get('placeholder_text', ''),
                     "styling_options": list(element.get('styling', {}).keys())
                 }
@@ -443,6 +443,8 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
             manager = template_utils.get_enhanced_template_manager()
             
             # Analyze each text shape on the slide
+            text_shapes = []
+            wrap_requests = []
             for i, shape in enumerate(slide.shapes):
                 if hasattr(shape, 'text_frame') and shape.text_frame.text:
                     text = shape.text_frame.text
@@ -451,12 +453,21 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
                     container_width = shape.width.inches
                     container_height = shape.height.inches
                     
+                    # Measure with the font of the first run (heuristic if unset or not installed)
+                    first_font = None
+                    if shape.text_frame.paragraphs and shape.text_frame.paragraphs[0].runs:
+                        first_font = shape.text_frame.paragraphs[0].runs[0].font
+                    font_name = first_font.name if first_font is not None else None
+                    bold = bool(first_font.bold) if first_font is not None else False
+                    italic = bool(first_font.italic) if first_font is not None else False
+                    
                     shape_optimizations = []
                     
                     # Apply auto-resize if enabled
                     if auto_resize:
                         optimal_size = template_utils.calculate_dynamic_font_size(
-                            text, container_width, container_height
+                            text, container_width, container_height,
+                            font_name=font_name, bold=bold, italic=italic
                         )
                         optimal_size = max(min_font_size, min(max_font_size, optimal_size))
                         
@@ -467,41 +478,53 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
                         
                         shape_optimizations.append(f"Font resized to {optimal_size}pt")
                     
-                    # Apply auto-wrap if enabled
+                    # Collect auto-wrap requests, wrapped below in one batch
                     if auto_wrap:
                         current_font_size = 14  # Default assumption
-                        if shape.text_frame.paragraphs and shape.text_frame.paragraphs[0].runs:
-                            if shape.text_frame.paragraphs[0].runs[0].font.size:
-                                current_font_size = shape.text_frame.paragraphs[0].runs[0].font.size.pt
-                        
-                        wrapped_text = template_utils.wrap_text_automatically(
-                            text, container_width, current_font_size
-                        )
+                        if first_font is not None and first_font.size:
+                            current_font_size = first_font.size.pt
                         
-                        if wrapped_text != text:
-                            shape.text_frame.text = wrapped_text
-                            shape_optimizations.append("Text wrapped automatically")
+                        wrap_requests.append({
+                            "text": text,
+                            "container_width": container_width,
+                            "font_size": current_font_size,
+                            "font_name": font_name,
+                            "bold": bold,
+                            "italic": italic
+                        })
                     
-                    # Optimize spacing if enabled
-                    if optimize_spacing:
-                        text_length = len(text)
-                        if text_length > 300:
-                            line_spacing = 1.4
-                        elif text_length > 150:
-                            line_spacing = 1.3
-                        else:
-                            line_spacing = 1.2
-                        
-                        for paragraph in shape.text_frame.paragraphs:
-                            paragraph.line_spacing = line_spacing
-                        
-                        shape_optimizations.append(f"Line spacing set to {line_spacing}")
+                    text_shapes.append((i, shape, text, shape_optimizations))
+            
+            wrapped_texts = template_utils.wrap_texts_automatically(wrap_requests) if auto_wrap else []
+            
+            for position, (i, shape, text, shape_optimizations) in enumerate(text_shapes):
+                # Apply auto-wrap if enabled
+                if auto_wrap:
+                    wrapped_text = wrapped_texts[position]
+                    if wrapped_text != text:
+                        shape.text_frame.text = wrapped_text
+                        shape_optimizations.append("Text wrapped automatically")
+                
+                # Optimize spacing if enabled
+                if optimize_spacing:
+                    text_length = len(text)
+                    if text_length > 300:
+                        line_spacing = 1.4
+                    elif text_length > 150:
+                        line_spacing = 1.3
+                    else:
+                        line_spacing = 1.2
                     
-                    if shape_optimizations:
-                        optimizations_applied.append({
-                            "shape_index": i,
-                            "optimizations": shape_optimizations
-                        })
+                    for paragraph in shape.text_frame.paragraphs:
+                        paragraph.line_spacing = line_spacing
+                    
+                    shape_optimizations.append(f"Line spacing set to {line_spacing}")
+                
+                if shape_optimizations:
+                    optimizations_applied.append({
+                        "shape_index": i,
+                        "optimizations": shape_optimizations
+                    })
             
             return {
                 "message": f"Optimized {len(optimizations_applied)} text elements on slide {slide_index}",
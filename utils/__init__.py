@@ -5,6 +5,8 @@ Organized utility functions for PowerPoint manipulation.
 
 from .core_utils import *
 from .presentation_utils import *
+from .package_utils import *
+from .media_utils import *
 from .content_utils import *
 from .design_utils import *
 from .validation_utils import *
@@ -24,6 +26,19 @@ __all__ = [
     "set_core_properties",
     "get_core_properties",
     
+    # Package utilities
+    "open_read_only_presentation",
+    "is_read_only_presentation",
+    "get_package_load_stats",
+    
+    # Media utilities
+    "CachedImage",
+    "ImageBlobCache",
+    "image_cache",
+    "add_cached_picture",
+    "optimize_image_for_slide",
+    "optimize_presentation_images",
+    
     # Content utilities
     "add_slide",
     "get_slide_info",
@@ -34,6 +49,9 @@ __all__ = [
     "format_text",
     "format_text_advanced",
     "add_image",
+    "add_optimized_image",
+    "sniff_image_format",
+    "decode_image_data",
     "add_table",
     "format_table_cell",
     "add_chart",
@@ -65,5 +83,9 @@ __all__ = [
     
     # Validation utilities
     "validate_text_fit",
-    "validate_and_fix_slide"
+    "validate_and_fix_slide",
+    "snapshot_slide",
+    "check_slide_snapshots",
+    "SlideGeometry",
+    "get_slide_geometry"
 ]
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+Concurrency utilities for PowerPoint MCP Server.
+Per-presentation locking and a bounded thread pool for running tool bodies.
+"""
+import asyncio
+import contextlib
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+# Lock key used to serialize tools that create presentations without an explicit ID
+# (ID generation reads the size of the presentations dict).
+PRESENTATION_CREATION_LOCK = "__presentation_creation__"
+
+
+class PresentationLockManager:
+    """Hand out one re-entrant lock per presentation ID and track which IDs are in use."""
+
+    def __init__(self):
+        self._locks: Dict[Hashable, threading.RLock] = {}
+        self._holds: Dict[Hashable, int] = {}
+        self._guard = threading.Lock()
+
+    def lock_for(self, key: Hashable) -> threading.RLock:
+        """Get (creating on first use) the lock for a presentation ID."""
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.RLock()
+            return lock
+
+    @contextlib.contextmanager
+    def hold(self, key: Hashable):
+        """Hold the lock for a presentation ID and mark it in use until the block exits."""
+        with self.lock_for(key):
+            with self._guard:
+                self._holds[key] = self._holds.get(key, 0) + 1
+            try:
+                yield
+            finally:
+                with self._guard:
+                    if self._holds[key] == 1:
+                        del self._holds[key]
+                    else:
+                        self._holds[key] -= 1
+
+    def in_use(self, key: Hashable) -> bool:
+        """Check whether a tool call (in any thread, including this one) holds a presentation ID."""
+        with self._guard:
+            return key in self._holds
+
+    def discard(self, key: Hashable) -> None:
+        """Forget the lock for a presentation that is no longer loaded."""
+        with self._guard:
+            self._locks.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+class ToolExecutor:
+    """
+    Run synchronous tool bodies on a bounded thread pool.
+
+    Calls that target the same presentation are serialized through its lock,
+    calls on different presentations (or on no presentation) run in parallel,
+    and the event loop is never blocked by python-pptx work.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = int(os.environ.get('PPT_MAX_WORKERS', '0')) or min(32, (os.cpu_count() or 1) + 4)
+        self.max_workers = max_workers
+        self.locks = PresentationLockManager()
+        self._executor = None
+        self._executor_guard = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The worker pool, created on first use."""
+        if self._executor is None:
+            with self._executor_guard:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="ppt-tool"
+                    )
+        return self._executor
+
+    def call(self, lock_key: Optional[Hashable], fn: Callable, kwargs: Dict[str, Any]) -> Any:
+        """Call fn(**kwargs) in the current thread, holding the lock for lock_key if given."""
+        if lock_key is None:
+            return fn(**kwargs)
+        with self.locks.hold(lock_key):
+            return fn(**kwargs)
+
+    async def run(self, lock_key: Optional[Hashable], fn: Callable, kwargs: Dict[str, Any]) -> Any:
+        """Run fn(**kwargs) on the worker pool and await its result.
+
+        The caller's context variables (e.g. the active MCP session) are
+        carried over to the worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.executor, context.run, functools.partial(self.call, lock_key, fn, kwargs)
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool (a new one is created on next use)."""
+        with self._executor_guard:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+    def get_stats(self) -> Dict:
+        """Get executor statistics."""
+        return {
+            "max_workers": self.max_workers,
+            "tracked_presentation_locks": len(self.locks)
+        }
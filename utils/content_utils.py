@@ -5,6 +5,7 @@ Functions for slides, text, images, tables, charts, and shapes.
 from pptx import Presentation
 from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE
+from pptx.enum.shapes import MSO_SHAPE_TYPE
 from pptx.enum.text import PP_ALIGN
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
@@ -12,6 +13,12 @@ from typing import Dict, List, Tuple, Optional, Any
 import tempfile
 import os
 import base64
+import binascii
+import hashlib
+import hmac
+import json
+from lxml import etree
+from .media_utils import CachedImage, add_cached_picture, image_cache, optimize_image_for_slide
 
 
 def add_slide(presentation: Presentation, layout_index: int = 1) -> Tuple:
@@ -282,13 +289,85 @@ def format_text_advanced(text_frame, font_size: int = None, font_name: str = Non
         return result
 
 
-def add_image(slide, image_path: str, left: float, top: float, width: float = None, height: float = None) -> Any:
+# Leading bytes of the image formats python-pptx can embed
+_IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'\xff\xd8\xff', 'jpeg'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+    (b'BM', 'bmp'),
+    (b'II*\x00', 'tiff'),
+    (b'MM\x00*', 'tiff'),
+    (b'\xd7\xcd\xc6\x9a', 'wmf'),
+)
+
+_URLSAFE_BASE64 = str.maketrans('-_', '+/')
+
+
+def sniff_image_format(image_data: bytes) -> Optional[str]:
+    """
+    Identify an image format from its leading bytes.
+    
+    Args:
+        image_data: Image file content (only the first bytes are looked at)
+        
+    Returns:
+        "png", "jpeg", "gif", "bmp", "tiff" or "wmf", or None if the data isn't
+        an image format PowerPoint slides can embed
+    """
+    for signature, image_format in _IMAGE_SIGNATURES:
+        if image_data.startswith(signature):
+            return image_format
+    return None
+
+
+def decode_image_data(image_data) -> Tuple[bytes, str]:
+    """
+    Decode image data passed inline and identify its format.
+    
+    Args:
+        image_data: Base64 text (standard or URL-safe alphabet, whitespace and
+            missing padding tolerated), a base64 data URI
+            ("data:image/png;base64,..."), or raw bytes
+        
+    Returns:
+        Tuple of (image bytes, format name from sniff_image_format)
+        
+    Raises:
+        ValueError: If the data isn't valid base64 or not a supported image format
+    """
+    if isinstance(image_data, (bytes, bytearray, memoryview)):
+        blob = bytes(image_data)
+    else:
+        text = image_data.strip()
+        if text.startswith('data:'):
+            header, separator, text = text.partition(',')
+            if not separator or not header.endswith(';base64'):
+                raise ValueError("Only base64-encoded data URIs are supported")
+        text = ''.join(text.split()).translate(_URLSAFE_BASE64)
+        try:
+            blob = base64.b64decode(text + '=' * (-len(text) % 4), validate=True)
+        except (binascii.Error, ValueError) as e:
+            raise ValueError(f"Invalid base64 image data: {str(e)}")
+    
+    image_format = sniff_image_format(blob)
+    if image_format is None:
+        raise ValueError("Unsupported image format; expected PNG, JPEG, GIF, BMP, TIFF or WMF data")
+    return blob, image_format
+
+
+def add_image(slide, image_path, left: float, top: float, width: float = None, height: float = None) -> Any:
     """
     Add an image to a slide.
     
+    The image goes through the process-wide image cache, so the same image
+    added again (to any slide of any presentation) is neither re-read from
+    disk nor decoded again.
+    
     Args:
         slide: The slide object
-        image_path: Path to the image file
+        image_path: Path to the image file, a binary file-like object (e.g. io.BytesIO),
+            or a CachedImage from image_cache
         left: Left position in inches
         top: Top position in inches
         width: Width in inches (optional)
@@ -297,22 +376,53 @@ def add_image(slide, image_path: str, left: float, top: float, width: float = No
     Returns:
         The created image shape
     """
-    if width is not None and height is not None:
-        return slide.shapes.add_picture(
-            image_path, Inches(left), Inches(top), Inches(width), Inches(height)
-        )
-    elif width is not None:
-        return slide.shapes.add_picture(
-            image_path, Inches(left), Inches(top), Inches(width)
-        )
-    elif height is not None:
-        return slide.shapes.add_picture(
-            image_path, Inches(left), Inches(top), height=Inches(height)
-        )
-    else:
-        return slide.shapes.add_picture(
-            image_path, Inches(left), Inches(top)
-        )
+    image = image_path if isinstance(image_path, CachedImage) else image_cache.get(image_path)
+    filename = os.path.basename(image_path) if isinstance(image_path, str) else None
+    return add_cached_picture(
+        slide, image, Inches(left), Inches(top),
+        Inches(width) if width is not None else None,
+        Inches(height) if height is not None else None,
+        filename
+    )
+
+
+def add_optimized_image(slide, image_path, left: float, top: float, width: float = None, height: float = None,
+                        target_dpi: float = 150, convert_photos: bool = False, jpeg_quality: int = 85,
+                        strip_metadata: bool = True) -> Tuple[Any, Dict]:
+    """
+    Add an image to a slide, downscaled and recompressed for the size it is placed at.
+    
+    The picture is placed exactly where and as large as add_image would place
+    it, but embeds at most target_dpi worth of pixels (see optimize_image_for_slide).
+    
+    Args:
+        slide: The slide object
+        image_path: Path to the image file, a binary file-like object, or a CachedImage
+        left: Left position in inches
+        top: Top position in inches
+        width: Width in inches (optional)
+        height: Height in inches (optional)
+        target_dpi: Resolution to keep at the placed size
+        convert_photos: Re-encode opaque photographic PNG, BMP and TIFF images as JPEG
+        jpeg_quality: JPEG quality (1-95) for re-encoded images
+        strip_metadata: Drop metadata that doesn't affect how the image is shown
+        
+    Returns:
+        Tuple of (created image shape, optimization report with bytes_saved)
+    """
+    image = image_path if isinstance(image_path, CachedImage) else image_cache.get(image_path)
+    filename = os.path.basename(image_path) if isinstance(image_path, str) else None
+    placed_width, placed_height = image.scale(
+        Inches(width) if width is not None else None,
+        Inches(height) if height is not None else None
+    )
+    optimized, report = optimize_image_for_slide(
+        image, width, height, target_dpi, convert_photos, jpeg_quality, strip_metadata
+    )
+    shape = add_cached_picture(
+        slide, optimized, Inches(left), Inches(top), placed_width, placed_height, filename
+    )
+    return shape, report
 
 
 def add_table(slide, rows: int, cols: int, left: float, top: float, width: float, height: float) -> Any:
@@ -473,16 +583,201 @@ def format_chart(chart, has_legend: bool = True, legend_position: str = 'right',
         pass  # Graceful degradation for chart formatting
 
 
-def extract_slide_text_content(slide) -> Dict:
+def extract_slide_text_content(slide, use_xml: bool = True) -> Dict:
     """
     Extract all text content from a slide including placeholders and text shapes.
     
+    By default the text is read straight from the slide's XML with precompiled
+    XPath queries; slides with shapes python-pptx can't classify fall back to
+    reading through the shape proxies, which gives the same result.
+    
     Args:
         slide: The slide object to extract text from
+        use_xml: Whether to use the direct XML reader
         
     Returns:
         Dictionary containing all text content organized by source type
     """
+    if use_xml:
+        try:
+            return _extract_slide_text_from_xml(slide._element)
+        except Exception:
+            pass  # Unsupported or malformed XML: let the proxies decide
+    return _extract_slide_text_with_proxies(slide)
+
+
+_NAMESPACES = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'
+}
+_SHAPE_TREE = etree.XPath('./p:cSld/p:spTree', namespaces=_NAMESPACES)
+_SHAPE_NAME = etree.XPath('./*[1]/p:cNvPr/@name', namespaces=_NAMESPACES)
+_PLACEHOLDER = etree.XPath('./*[1]/p:nvPr/p:ph', namespaces=_NAMESPACES)
+_SHAPE_GEOMETRY = etree.XPath('./p:spPr/a:custGeom | ./p:spPr/a:prstGeom', namespaces=_NAMESPACES)
+_TEXT_BOX_FLAG = etree.XPath('./p:nvSpPr/p:cNvSpPr/@txBox', namespaces=_NAMESPACES)
+_SHAPE_PARAGRAPHS = etree.XPath('./p:txBody/a:p', namespaces=_NAMESPACES)
+_GRAPHIC_DATA_URI = etree.XPath('./a:graphic/a:graphicData/@uri', namespaces=_NAMESPACES)
+_TABLE_ROWS = etree.XPath('./a:graphic/a:graphicData/a:tbl/a:tr', namespaces=_NAMESPACES)
+_TABLE_CELLS = etree.XPath('./a:tc', namespaces=_NAMESPACES)
+_CELL_PARAGRAPHS = etree.XPath('./a:txBody/a:p', namespaces=_NAMESPACES)
+
+_A = '{' + _NAMESPACES['a'] + '}'
+_P = '{' + _NAMESPACES['p'] + '}'
+_SHAPE_TAGS = frozenset(_P + tag for tag in ('sp', 'grpSp', 'graphicFrame', 'cxnSp', 'pic', 'contentPart'))
+_TABLE_URI = 'http://schemas.openxmlformats.org/drawingml/2006/table'
+
+_SHAPE_TYPE_NAMES = {
+    'placeholder': str(MSO_SHAPE_TYPE.PLACEHOLDER),
+    'freeform': str(MSO_SHAPE_TYPE.FREEFORM),
+    'auto_shape': str(MSO_SHAPE_TYPE.AUTO_SHAPE),
+    'text_box': str(MSO_SHAPE_TYPE.TEXT_BOX)
+}
+
+
+class _UnsupportedSlideXml(Exception):
+    """Raised by the XML text reader for slides it leaves to the shape proxies."""
+
+
+def _paragraphs_text(paragraphs: List) -> str:
+    """Join paragraph texts like TextFrame.text (runs and fields, "\v" for line breaks)."""
+    texts = []
+    for paragraph in paragraphs:
+        parts = []
+        for child in paragraph:
+            tag = child.tag
+            if tag == _A + 'r':
+                t = child.find(_A + 't')
+                if t is None:
+                    raise _UnsupportedSlideXml("run without text element")
+                parts.append(t.text or "")
+            elif tag == _A + 'br':
+                parts.append("\v")
+            elif tag == _A + 'fld':
+                t = child.find(_A + 't')
+                parts.append(t.text or "" if t is not None else "")
+        texts.append("".join(parts))
+    return "\n".join(texts)
+
+
+def _sp_shape_type(shape_elm, placeholder) -> str:
+    """Get str(shape.shape_type) of a p:sp element, as python-pptx classifies it."""
+    if placeholder is not None:
+        return _SHAPE_TYPE_NAMES['placeholder']
+    geometry = _SHAPE_GEOMETRY(shape_elm)
+    text_box = _TEXT_BOX_FLAG(shape_elm)
+    is_text_box = bool(text_box) and text_box[0] in ('1', 'true')
+    if any(elm.tag == _A + 'custGeom' for elm in geometry):
+        return _SHAPE_TYPE_NAMES['freeform']
+    if geometry and not is_text_box:
+        return _SHAPE_TYPE_NAMES['auto_shape']
+    if is_text_box:
+        return _SHAPE_TYPE_NAMES['text_box']
+    raise _UnsupportedSlideXml("shape of unrecognized type")
+
+
+def _extract_slide_text_from_xml(slide_elm) -> Dict:
+    """Extract slide text straight from the slide XML (see extract_slide_text_content)."""
+    shape_tree = _SHAPE_TREE(slide_elm)
+    if not shape_tree:
+        raise _UnsupportedSlideXml("slide without shape tree")
+    
+    text_content = {
+        "slide_title": "",
+        "placeholders": [],
+        "text_shapes": [],
+        "table_text": [],
+        "all_text_combined": ""
+    }
+    all_texts = []
+    shapes = []
+    title_elm = None
+    
+    for shape_elm in shape_tree[0]:
+        if shape_elm.tag not in _SHAPE_TAGS:
+            continue
+        placeholder = _PLACEHOLDER(shape_elm)
+        placeholder = placeholder[0] if placeholder else None
+        if title_elm is None and placeholder is not None and placeholder.idx == 0:
+            title_elm = shape_elm
+        shapes.append((shape_elm, placeholder))
+    
+    # Title placeholder (only text shapes have a text frame)
+    if title_elm is not None and title_elm.tag == _P + 'sp':
+        title_text = _paragraphs_text(_SHAPE_PARAGRAPHS(title_elm)).strip()
+        if title_text:
+            text_content["slide_title"] = title_text
+            all_texts.append(title_text)
+    
+    for i, (shape_elm, placeholder) in enumerate(shapes):
+        tag = shape_elm.tag
+        name = _SHAPE_NAME(shape_elm)
+        if not name:
+            raise _UnsupportedSlideXml("shape without name")
+        name = name[0]
+        
+        if tag == _P + 'sp':
+            shape_type = _sp_shape_type(shape_elm, placeholder)
+            text = _paragraphs_text(_SHAPE_PARAGRAPHS(shape_elm)).strip()
+            if text:
+                shape_text_info = {
+                    "shape_index": i,
+                    "shape_name": name,
+                    "shape_type": shape_type,
+                    "text": text
+                }
+                all_texts.append(text)
+                
+                if placeholder is not None:
+                    placeholder_info = shape_text_info.copy()
+                    placeholder_info["placeholder_type"] = str(placeholder.type)
+                    placeholder_info["placeholder_idx"] = placeholder.idx
+                    text_content["placeholders"].append(placeholder_info)
+                else:
+                    text_content["text_shapes"].append(shape_text_info)
+        
+        elif tag == _P + 'graphicFrame':
+            uri = _GRAPHIC_DATA_URI(shape_elm)
+            if not uri:
+                raise _UnsupportedSlideXml("graphic frame without graphic data")
+            if uri[0] == _TABLE_URI:
+                table_texts = []
+                for row_idx, row in enumerate(_TABLE_ROWS(shape_elm)):
+                    row_texts = []
+                    for cell in _TABLE_CELLS(row):
+                        cell_text = _paragraphs_text(_CELL_PARAGRAPHS(cell)).strip()
+                        if cell_text:
+                            row_texts.append(cell_text)
+                            all_texts.append(cell_text)
+                    if row_texts:
+                        table_texts.append({
+                            "row": row_idx,
+                            "cells": row_texts
+                        })
+                
+                if table_texts:
+                    text_content["table_text"].append({
+                        "shape_index": i,
+                        "shape_name": name,
+                        "table_content": table_texts
+                    })
+        
+        elif tag == _P + 'contentPart':
+            raise _UnsupportedSlideXml("content part")
+    
+    # Combine all text
+    text_content["all_text_combined"] = "\n".join(all_texts)
+    
+    return {
+        "success": True,
+        "text_content": text_content,
+        "total_text_shapes": len(text_content["placeholders"]) + len(text_content["text_shapes"]),
+        "has_title": bool(text_content["slide_title"]),
+        "has_tables": len(text_content["table_text"]) > 0
+    }
+
+
+def _extract_slide_text_with_proxies(slide) -> Dict:
+    """Extract slide text through the python-pptx shape proxies (see extract_slide_text_content)."""
     try:
         text_content = {
             "slide_title": "",
@@ -522,7 +817,7 @@ def extract_slide_text_content(slide) -> Dict:
                         all_texts.append(text)
                         
                         # Categorize by shape type
-                        if hasattr(shape, 'placeholder_format'):
+                        if shape.is_placeholder:
                             # This is a placeholder
                             placeholder_info = shape_text_info.copy()
                             placeholder_info["placeholder_type"] = str(shape.placeholder_format.type)
@@ -576,4 +871,66 @@ def extract_slide_text_content(slide) -> Dict:
             "success": False,
             "error": f"Failed to extract text content: {str(e)}",
             "text_content": None
-        }
\ No newline at end of file
+        }
+
+# Key signing text extraction cursors; cursors are only valid within the process that issued them
+_TEXT_CURSOR_KEY = os.urandom(32)
+
+
+def _sign_text_cursor(payload: bytes) -> bytes:
+    return hmac.new(_TEXT_CURSOR_KEY, payload, hashlib.sha256).digest()[:16]
+
+
+def encode_text_cursor(presentation_id: str, next_slide: int, end_slide: int, page_size: int,
+                       slide_count: int) -> str:
+    """
+    Encode the position of a paginated text extraction into an opaque cursor token.
+    
+    The token is signed with a per-process key, so clients can't forge or alter it.
+    
+    Args:
+        presentation_id: ID of the presentation being extracted
+        next_slide: Index of the first slide of the next page
+        end_slide: Index of the last slide to extract (inclusive)
+        page_size: Number of slides per page
+        slide_count: Number of slides in the presentation when the cursor was issued
+        
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([presentation_id, next_slide, end_slide, page_size, slide_count],
+                         separators=(',', ':')).encode('utf-8')
+    return (base64.urlsafe_b64encode(payload).decode('ascii') + '.'
+            + base64.urlsafe_b64encode(_sign_text_cursor(payload)).decode('ascii'))
+
+
+def decode_text_cursor(cursor: str) -> Dict:
+    """
+    Decode a cursor token from encode_text_cursor.
+    
+    Args:
+        cursor: Cursor string
+        
+    Returns:
+        Dictionary with presentation_id, next_slide, end_slide, page_size and slide_count
+        
+    Raises:
+        ValueError: If the cursor is malformed, wasn't issued by this process or was altered
+    """
+    try:
+        encoded_payload, encoded_signature = cursor.split('.')
+        payload = base64.urlsafe_b64decode(encoded_payload.encode('ascii'))
+        signature = base64.urlsafe_b64decode(encoded_signature.encode('ascii'))
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if not hmac.compare_digest(signature, _sign_text_cursor(payload)):
+        raise ValueError("Invalid cursor: not issued by this server, or it has restarted since; restart the extraction")
+    
+    presentation_id, next_slide, end_slide, page_size, slide_count = json.loads(payload.decode('utf-8'))
+    return {
+        "presentation_id": presentation_id,
+        "next_slide": next_slide,
+        "end_slide": end_slide,
+        "page_size": page_size,
+        "slide_count": slide_count
+    }
@@ -7,6 +7,8 @@ from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from typing import Dict, List, Tuple, Optional, Any
 from PIL import Image, ImageEnhance, ImageFilter, ImageDraw
+import functools
+import io
 import tempfile
 import os
 from fontTools.ttLib import TTFont
@@ -279,27 +281,38 @@ def set_slide_gradient_background(slide, start_color: Tuple[int, int, int],
         direction: Gradient direction ('horizontal', 'vertical', 'diagonal')
     """
     try:
-        # Create gradient image
+        # Create gradient image (rendered once per color pair and direction)
         width, height = 1920, 1080  # Standard slide dimensions
-        gradient_img = create_gradient_image(width, height, start_color, end_color, direction)
-        
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
-            gradient_img.save(temp_file.name, 'PNG')
-            temp_path = temp_file.name
+        gradient_png = render_gradient_png(width, height, tuple(start_color), tuple(end_color), direction)
         
         # Add as background image (simplified - actual implementation would need XML manipulation)
-        try:
-            slide.shapes.add_picture(temp_path, 0, 0, Inches(10), Inches(7.5))
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        slide.shapes.add_picture(io.BytesIO(gradient_png), 0, 0, Inches(10), Inches(7.5))
                 
     except Exception:
         pass  # Graceful fallback
 
 
+@functools.lru_cache(maxsize=32)
+def render_gradient_png(width: int, height: int, start_color: Tuple[int, int, int],
+                        end_color: Tuple[int, int, int], direction: str = 'horizontal') -> bytes:
+    """
+    Render a gradient image to PNG bytes, caching the result.
+    
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        start_color: Starting RGB color tuple
+        end_color: Ending RGB color tuple
+        direction: Gradient direction
+        
+    Returns:
+        PNG-encoded image bytes
+    """
+    buffer = io.BytesIO()
+    create_gradient_image(width, height, start_color, end_color, direction).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
 def create_professional_gradient_background(slide, color_scheme: str = 'modern_blue', 
                                           style: str = 'subtle', direction: str = 'diagonal') -> None:
     """
@@ -311,18 +324,28 @@ def create_professional_gradient_background(slide, color_scheme: str = 'modern_b
         style: Gradient style ('subtle', 'bold', 'accent')
         direction: Gradient direction ('horizontal', 'vertical', 'diagonal')
     """
-    # Get colors based on style
+    start_color, end_color = get_professional_gradient_colors(color_scheme, style)
+    set_slide_gradient_background(slide, start_color, end_color, direction)
+
+
+def get_professional_gradient_colors(color_scheme: str = 'modern_blue',
+                                     style: str = 'subtle') -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+    """
+    Get the start and end colors of a professional gradient.
+    
+    Args:
+        color_scheme: Professional color scheme to use
+        style: Gradient style ('subtle', 'bold', 'accent')
+        
+    Returns:
+        Tuple of (start_color, end_color) RGB tuples
+    """
     if style == 'subtle':
-        start_color = get_professional_color(color_scheme, 'light')
-        end_color = get_professional_color(color_scheme, 'secondary')
+        return get_professional_color(color_scheme, 'light'), get_professional_color(color_scheme, 'secondary')
     elif style == 'bold':
-        start_color = get_professional_color(color_scheme, 'primary')
-        end_color = get_professional_color(color_scheme, 'accent1')
+        return get_professional_color(color_scheme, 'primary'), get_professional_color(color_scheme, 'accent1')
     else:  # accent
-        start_color = get_professional_color(color_scheme, 'accent1')
-        end_color = get_professional_color(color_scheme, 'accent2')
-    
-    set_slide_gradient_background(slide, start_color, end_color, direction)
+        return get_professional_color(color_scheme, 'accent1'), get_professional_color(color_scheme, 'accent2')
 
 
 def create_gradient_image(width: int, height: int, start_color: Tuple[int, int, int], 
@@ -0,0 +1,297 @@
+"""
+Font metrics utilities for PowerPoint MCP Server.
+Text measurement from real font advance widths (via fontTools), with a font file index and an LRU cache of per-font width tables.
+"""
+import os
+import platform
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from fontTools.ttLib import TTCollection, TTFont
+
+
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc', '.otc')
+
+
+def get_font_search_directories() -> List[str]:
+    """
+    Get list of directories to search for font files.
+    Directories in the PPT_FONT_PATH environment variable (os.pathsep separated)
+    come first, followed by the platform's standard font directories.
+
+    Returns:
+        List of existing directories
+    """
+    directories = []
+    env_path = os.environ.get('PPT_FONT_PATH')
+    if env_path:
+        directories.extend(path.strip() for path in env_path.split(os.pathsep) if path.strip())
+
+    system = platform.system()
+    if system == "Windows":
+        windir = os.environ.get('WINDIR', r'C:\Windows')
+        directories.append(os.path.join(windir, 'Fonts'))
+        local_app_data = os.environ.get('LOCALAPPDATA')
+        if local_app_data:
+            directories.append(os.path.join(local_app_data, 'Microsoft', 'Windows', 'Fonts'))
+    elif system == "Darwin":
+        directories.extend(['/System/Library/Fonts', '/Library/Fonts', '~/Library/Fonts'])
+    else:
+        directories.extend(['/usr/share/fonts', '/usr/local/share/fonts', '~/.local/share/fonts', '~/.fonts'])
+
+    result = []
+    for directory in directories:
+        expanded = os.path.expanduser(directory)
+        if os.path.isdir(expanded) and expanded not in result:
+            result.append(expanded)
+    return result
+
+
+def _normalize_font_name(name: str) -> str:
+    """Normalize a font name for matching ("Segoe UI-Light" -> "segoeuilight")."""
+    return ''.join(char for char in name.lower() if char.isalnum())
+
+
+def _get_name(name_table, *name_ids: int) -> str:
+    """Get the first available name record among the given IDs."""
+    for name_id in name_ids:
+        value = name_table.getDebugName(name_id)
+        if value:
+            return value
+    return ""
+
+
+class FontMetrics:
+    """Advance widths of one font face, for kerning-free text measurement."""
+
+    def __init__(self, font_path: str, font_number: int = 0):
+        """
+        Args:
+            font_path: Path to the font file
+            font_number: Face index within a font collection (.ttc)
+        """
+        font = TTFont(font_path, fontNumber=font_number, lazy=True)
+        try:
+            self.font_path = font_path
+            self.units_per_em = font['head'].unitsPerEm
+            hmtx = font['hmtx'].metrics
+            cmap = font.getBestCmap() or {}
+
+            # Width of unmapped characters: the .notdef glyph, like a renderer would draw
+            self.default_width = hmtx.get('.notdef', (self.units_per_em // 2, 0))[0]
+            self.advance_widths = _AdvanceWidths(self.default_width)
+            for codepoint, glyph_name in cmap.items():
+                metrics = hmtx.get(glyph_name)
+                if metrics is not None:
+                    self.advance_widths[chr(codepoint)] = metrics[0]
+
+            # Line breaks and tabs take no horizontal space of their own
+            for char in '\n\r\v\t':
+                self.advance_widths[char] = 0
+        finally:
+            font.close()
+
+    def measure(self, text: str) -> float:
+        """
+        Measure text as the sum of its advance widths.
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            Width in ems (multiply by the font size in points for points)
+        """
+        return sum(map(self.advance_widths.__getitem__, text)) / self.units_per_em
+
+
+class _AdvanceWidths(dict):
+    """Character -> advance width map that falls back to the default width."""
+
+    def __init__(self, default_width: int):
+        super().__init__()
+        self.default_width = default_width
+
+    def __missing__(self, char: str) -> int:
+        return self.default_width
+
+
+class FontMetricsProvider:
+    """
+    Find font files by name and measure text with their advance widths.
+
+    The font directories are indexed (family, style and full names from each
+    font's name table) on first use. Loaded width tables are kept in an LRU
+    cache; fonts that can't be found are remembered too, so callers can fall
+    back to a heuristic without repeated lookups.
+    """
+
+    def __init__(self, font_directories: Optional[List[str]] = None, cache_size: int = 32):
+        """
+        Args:
+            font_directories: Directories to index (defaults to get_font_search_directories())
+            cache_size: Maximum number of font width tables kept in memory
+        """
+        self._font_directories = font_directories
+        self.cache_size = cache_size
+        self._index = None
+        self._metrics = OrderedDict()  # (name, bold, italic) -> FontMetrics or None
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def _build_index(self) -> Dict:
+        """Index every font face in the font directories by family/style and full name."""
+        by_style = {}      # (family, bold, italic) -> (path, font_number)
+        by_full_name = {}  # full name -> (path, font_number)
+
+        directories = self._font_directories if self._font_directories is not None else get_font_search_directories()
+        for directory in directories:
+            for root, _, files in os.walk(os.path.expanduser(directory)):
+                for file_name in sorted(files):
+                    if not file_name.lower().endswith(FONT_EXTENSIONS):
+                        continue
+                    path = os.path.join(root, file_name)
+                    for font_number, name_table in self._read_name_tables(path):
+                        location = (path, font_number)
+                        family = _normalize_font_name(_get_name(name_table, 16, 1))
+                        legacy_family = _normalize_font_name(_get_name(name_table, 1))
+                        style = _get_name(name_table, 17, 2).lower()
+                        bold = 'bold' in style
+                        italic = 'italic' in style or 'oblique' in style
+
+                        for family_key in {family, legacy_family}:
+                            if family_key:
+                                by_style.setdefault((family_key, bold, italic), location)
+                        full_name = _normalize_font_name(_get_name(name_table, 4))
+                        if full_name:
+                            by_full_name.setdefault(full_name, location)
+
+        return {"by_style": by_style, "by_full_name": by_full_name}
+
+    @staticmethod
+    def _read_name_tables(path: str):
+        """Yield (font_number, name table) for each face in a font file; unreadable files are skipped."""
+        try:
+            if path.lower().endswith(('.ttc', '.otc')):
+                collection = TTCollection(path, lazy=True)
+                try:
+                    for font_number, font in enumerate(collection.fonts):
+                        yield font_number, font['name']
+                finally:
+                    collection.close()
+            else:
+                font = TTFont(path, lazy=True)
+                try:
+                    yield 0, font['name']
+                finally:
+                    font.close()
+        except Exception:
+            return
+
+    def find_font_file(self, font_name: str, bold: bool = False, italic: bool = False) -> Optional[Tuple[str, int]]:
+        """
+        Find the font file of a font by name.
+
+        Args:
+            font_name: Font family or full name (e.g. "Segoe UI", "Segoe UI Light")
+            bold: Prefer the bold face
+            italic: Prefer the italic face
+
+        Returns:
+            Tuple of (font file path, face index), or None if the font isn't installed
+        """
+        if not font_name:
+            return None
+
+        with self._lock:
+            if self._index is None:
+                self._index = self._build_index()
+            index = self._index
+
+        key = _normalize_font_name(font_name)
+        by_style = index["by_style"]
+        for style in ((bold, italic), (bold, False), (False, italic), (False, False)):
+            location = by_style.get((key,) + style)
+            if location is not None:
+                return location
+        return index["by_full_name"].get(key)
+
+    def get_metrics(self, font_name: str, bold: bool = False, italic: bool = False) -> Optional[FontMetrics]:
+        """
+        Get the (cached) advance widths of a font.
+
+        Returns:
+            FontMetrics, or None if the font isn't installed or can't be read
+        """
+        key = (font_name, bool(bold), bool(italic))
+        with self._lock:
+            if key in self._metrics:
+                self._metrics.move_to_end(key)
+                self._hits += 1
+                return self._metrics[key]
+            self._misses += 1
+
+        metrics = None
+        location = self.find_font_file(font_name, bold, italic)
+        if location is not None:
+            try:
+                metrics = FontMetrics(*location)
+            except Exception:
+                metrics = None
+
+        with self._lock:
+            self._metrics[key] = metrics
+            while len(self._metrics) > self.cache_size:
+                self._metrics.popitem(last=False)
+        return metrics
+
+    def measure_text(self, text: str, font_size: float, font_name: str,
+                     bold: bool = False, italic: bool = False) -> Optional[float]:
+        """
+        Measure the width of text set in a font, without kerning.
+
+        Args:
+            text: Text to measure
+            font_size: Font size in points
+            font_name: Font family or full name
+            bold: Whether the text is bold
+            italic: Whether the text is italic
+
+        Returns:
+            Width in points, or None if the font isn't available
+        """
+        metrics = self.get_metrics(font_name, bold, italic)
+        if metrics is None:
+            return None
+        return metrics.measure(text) * font_size
+
+    def clear(self) -> None:
+        """Drop the font index and cached width tables (e.g. after installing fonts)."""
+        with self._lock:
+            self._index = None
+            self._metrics.clear()
+
+    def get_stats(self) -> Dict:
+        """Get font index and cache statistics."""
+        with self._lock:
+            return {
+                "indexed_fonts": len(self._index["by_full_name"]) if self._index is not None else None,
+                "cached_fonts": sum(1 for metrics in self._metrics.values() if metrics is not None),
+                "unavailable_fonts": sum(1 for metrics in self._metrics.values() if metrics is None),
+                "hits": self._hits,
+                "misses": self._misses
+            }
+
+
+_font_metrics_provider = None
+_font_metrics_provider_lock = threading.Lock()
+
+
+def get_font_metrics_provider() -> FontMetricsProvider:
+    """Get the shared font metrics provider."""
+    global _font_metrics_provider
+    if _font_metrics_provider is None:
+        with _font_metrics_provider_lock:
+            if _font_metrics_provider is None:
+                _font_metrics_provider = FontMetricsProvider()
+    return _font_metrics_provider
@@ -0,0 +1,672 @@
+"""
+Media utilities for PowerPoint MCP Server.
+A process-wide, content-addressed cache of image blobs, picture insertion
+that reuses the cached image properties instead of re-reading and re-probing,
+and downscaling/recompression of images to the resolution they are shown at,
+both on insertion and across a whole presentation.
+"""
+import hashlib
+import io
+import math
+import os
+import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+from PIL import Image as PIL_Image
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import XmlPart
+from pptx.oxml.ns import qn
+from pptx.parts.chart import ChartPart
+from pptx.parts.image import Image, ImagePart
+from pptx.parts.media import MediaPart
+from pptx.util import Emu, Inches, Length
+
+
+class CachedImage:
+    """An image blob with its hashes and the properties python-pptx needs to place it."""
+
+    def __init__(self, blob: bytes, sha256: str):
+        """
+        Args:
+            blob: Image file content
+            sha256: SHA-256 hex digest of blob
+
+        Raises:
+            ValueError: If the data isn't an image format PowerPoint slides can embed
+        """
+        image = Image(blob, None)
+        self.blob = blob
+        self.sha256 = sha256
+        self.sha1 = image.sha1  # Key python-pptx uses to find an existing image part
+        self.ext = image.ext
+        self.content_type = image.content_type
+        self.format = image._format.lower()  # e.g. "png", "jpeg"
+        self.size = image.size  # (width, height) in pixels
+        self.dpi = image.dpi
+
+    @property
+    def native_size(self) -> Tuple[Length, Length]:
+        """Size of the image at its own DPI (72 if unspecified), in EMU."""
+        horz_dpi, vert_dpi = self.dpi
+        width_px, height_px = self.size
+        return Emu(int(914400 * width_px / horz_dpi)), Emu(int(914400 * height_px / vert_dpi))
+
+    def scale(self, width: Optional[Length], height: Optional[Length]) -> Tuple[Length, Length]:
+        """
+        Get the placed size of the image, the way python-pptx's ImagePart.scale() computes it.
+
+        Args:
+            width: Requested width in EMU (None to derive it from height)
+            height: Requested height in EMU (None to derive it from width)
+
+        Returns:
+            Tuple of (width, height) in EMU; the native size if neither is given
+        """
+        image_cx, image_cy = self.native_size
+        if width and height:
+            return width, height
+        if width:
+            return width, Emu(int(round(image_cy * float(width) / float(image_cx))))
+        if height:
+            return Emu(int(round(image_cx * float(height) / float(image_cy)))), height
+        return image_cx, image_cy
+
+    def get_info(self) -> Dict:
+        """Get the format, pixel size, DPI, byte size and SHA-256 of the image."""
+        return {
+            "format": self.format,
+            "width_px": self.size[0],
+            "height_px": self.size[1],
+            "dpi": list(self.dpi),
+            "bytes": len(self.blob),
+            "sha256": self.sha256
+        }
+
+
+class ImageBlobCache:
+    """
+    Process-wide image cache keyed by the SHA-256 of the image content.
+
+    Every insertion of the same bytes - on any slide of any presentation -
+    shares one blob and one set of probed properties. Image files are also
+    remembered by path, modification time and size, so inserting an unchanged
+    file again skips reading it. Beyond max_memory_mb the least recently used
+    images are dropped.
+    """
+
+    def __init__(self, max_memory_mb: Optional[float] = None, max_files: int = 4096):
+        """
+        Args:
+            max_memory_mb: Memory budget in MB (env PPT_IMAGE_CACHE_MB, default 256; 0 disables caching)
+            max_files: Maximum number of image file paths remembered
+        """
+        if max_memory_mb is None:
+            max_memory_mb = float(os.environ.get('PPT_IMAGE_CACHE_MB', '256'))
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self.max_files = max_files
+        self._images = OrderedDict()  # SHA-256 -> CachedImage, least recently used first
+        self._files = OrderedDict()  # (path, mtime_ns, size) -> SHA-256
+        self._derived = OrderedDict()  # (source SHA-256, transform...) -> CachedImage
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._file_hits = 0
+        self._misses = 0
+        self._bytes_deduplicated = 0
+
+    def get(self, image_source) -> CachedImage:
+        """
+        Get the cached image for a file or image data, adding it on first use.
+
+        Args:
+            image_source: Path to an image file, image bytes, or a binary file-like object
+
+        Returns:
+            The CachedImage
+
+        Raises:
+            ValueError: If the data isn't an image format PowerPoint slides can embed
+        """
+        if not isinstance(image_source, str):
+            if isinstance(image_source, (bytes, bytearray, memoryview)):
+                return self._get_blob(bytes(image_source))
+            if callable(getattr(image_source, 'seek', None)):
+                image_source.seek(0)
+            return self._get_blob(image_source.read())
+
+        stat = os.stat(image_source)
+        file_key = (os.path.abspath(image_source), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            image = self._images.get(self._files.get(file_key))
+            if image is not None:
+                self._images.move_to_end(image.sha256)
+                self._files.move_to_end(file_key)
+                self._file_hits += 1
+                self._bytes_deduplicated += len(image.blob)
+                return image
+
+        with open(image_source, 'rb') as image_file:
+            image = self._get_blob(image_file.read())
+        if self.max_memory_bytes > 0:
+            with self._lock:
+                self._files[file_key] = image.sha256
+                while len(self._files) > self.max_files:
+                    self._files.popitem(last=False)
+        return image
+
+    def _get_blob(self, blob: bytes) -> CachedImage:
+        sha256 = hashlib.sha256(blob).hexdigest()
+        with self._lock:
+            image = self._images.get(sha256)
+            if image is not None:
+                self._images.move_to_end(sha256)
+                self._hits += 1
+                self._bytes_deduplicated += len(blob)
+                return image
+            self._misses += 1
+
+        image = CachedImage(blob, sha256)
+        if self.max_memory_bytes <= 0:
+            return image
+        with self._lock:
+            # Another thread may have added the same image meanwhile; keep the first
+            existing = self._images.setdefault(sha256, image)
+            if existing is image:
+                self._memory_bytes += len(blob)
+                while self._memory_bytes > self.max_memory_bytes and len(self._images) > 1:
+                    _, evicted = self._images.popitem(last=False)
+                    self._memory_bytes -= len(evicted.blob)
+            return existing
+
+    def get_derived(self, key: Tuple) -> Optional[CachedImage]:
+        """Get the result of a transform of a cached image (key starts with the source SHA-256)."""
+        with self._lock:
+            image = self._derived.get(key)
+            if image is not None:
+                self._derived.move_to_end(key)
+            return image
+
+    def add_derived(self, key: Tuple, image: CachedImage) -> None:
+        """Remember the result of a transform of a cached image, so it is done once per process."""
+        if self.max_memory_bytes <= 0:
+            return
+        with self._lock:
+            self._derived[key] = image
+            while len(self._derived) > self.max_files:
+                self._derived.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached image, file and transform entry."""
+        with self._lock:
+            self._images.clear()
+            self._files.clear()
+            self._derived.clear()
+            self._memory_bytes = 0
+
+    def get_stats(self) -> Dict:
+        """Get cache size and deduplication statistics."""
+        with self._lock:
+            return {
+                "images": len(self._images),
+                "files": len(self._files),
+                "derived": len(self._derived),
+                "memory_mb": round(self._memory_bytes / (1024 * 1024), 1),
+                "max_memory_mb": round(self.max_memory_bytes / (1024 * 1024), 1),
+                "hits": self._hits,
+                "file_hits": self._file_hits,
+                "misses": self._misses,
+                "bytes_deduplicated": self._bytes_deduplicated
+            }
+
+
+image_cache = ImageBlobCache()
+
+
+def add_cached_picture(slide, image: CachedImage, left: Length, top: Length,
+                       width: Optional[Length] = None, height: Optional[Length] = None,
+                       filename: Optional[str] = None):
+    """
+    Add a picture of a cached image to a slide, like slide.shapes.add_picture().
+
+    The image part already in the presentation with the same content is reused,
+    otherwise a new one is created; the placed size comes from the cached
+    properties, so the image is never decoded again.
+
+    Args:
+        slide: The slide object
+        image: Image from image_cache
+        left: Left position in EMU
+        top: Top position in EMU
+        width: Width in EMU (optional)
+        height: Height in EMU (optional)
+        filename: File name used as the picture description, if the image came from a file
+
+    Returns:
+        The created picture shape
+    """
+    package = slide.part.package
+    image_part = package._image_parts._find_by_sha1(image.sha1)
+    if image_part is None:
+        image_part = ImagePart(
+            package.next_image_partname(image.ext), image.content_type, package, image.blob, filename
+        )
+        image_part.__dict__['sha1'] = image.sha1  # Prime the lazyproperty so it's never recomputed
+    rId = slide.part.relate_to(image_part, RT.IMAGE)
+
+    shapes = slide.shapes
+    # With both dimensions given, ImagePart.scale() returns them without probing the image
+    width, height = image.scale(width, height)
+    pic = shapes._add_pic_from_image_part(image_part, rId, left, top, width, height)
+    shapes._recalculate_extents()
+    return shapes._shape_factory(pic)
+
+
+# Only images with more than this fraction of the needed pixels along each axis are downscaled
+_DOWNSCALE_THRESHOLD = 0.9
+
+_EXIF_ORIENTATION = 0x0112
+
+
+def optimize_image_for_slide(image: CachedImage, width: Optional[float] = None, height: Optional[float] = None,
+                             target_dpi: float = 150, convert_photos: bool = False,
+                             jpeg_quality: int = 85, strip_metadata: bool = True) -> Tuple[CachedImage, Dict]:
+    """
+    Downscale and recompress an image for the size it will be placed at on a slide.
+
+    The image is resampled to target_dpi at its placed size if it has more
+    pixels than that, metadata (EXIF, XMP, comments) is dropped except the
+    orientation and color profile, and with convert_photos, opaque PNG/BMP/TIFF
+    photographs are re-encoded as JPEG. GIF and WMF images are left as they
+    are. The original is kept whenever the result wouldn't be smaller. Results
+    are cached, so the same image placed at the same size is processed once.
+
+    Args:
+        image: Image from image_cache
+        width: Placed width in inches (None to derive it from height / the native size)
+        height: Placed height in inches (None to derive it from width / the native size)
+        target_dpi: Resolution to keep at the placed size
+        convert_photos: Re-encode opaque photographic PNG, BMP and TIFF images as JPEG
+        jpeg_quality: JPEG quality (1-95) for re-encoded images
+        strip_metadata: Drop metadata that doesn't affect how the image is shown
+
+    Returns:
+        Tuple of (image to insert, report). The report has the placed width and
+        height in inches, original and optimized byte and pixel sizes, formats
+        and bytes_saved. The optimized image's native size differs from the
+        original's, so it must be placed with an explicit width and height.
+    """
+    placed_cx, placed_cy = image.scale(
+        Inches(width) if width is not None else None, Inches(height) if height is not None else None
+    )
+    placed_width, placed_height = placed_cx / 914400, placed_cy / 914400
+    target_size = (max(1, math.ceil(placed_width * target_dpi)), max(1, math.ceil(placed_height * target_dpi)))
+
+    key = (image.sha256, target_size, convert_photos, jpeg_quality, strip_metadata)
+    optimized = image_cache.get_derived(key)
+    if optimized is None:
+        blob = _optimize_image_blob(image.blob, target_size, (placed_width, placed_height),
+                                    convert_photos, jpeg_quality, strip_metadata)
+        optimized = image_cache.get(blob) if blob is not None and len(blob) < len(image.blob) else image
+        image_cache.add_derived(key, optimized)
+
+    return optimized, {
+        "width": round(placed_width, 3),
+        "height": round(placed_height, 3),
+        "original_bytes": len(image.blob),
+        "optimized_bytes": len(optimized.blob),
+        "bytes_saved": len(image.blob) - len(optimized.blob),
+        "original_size_px": list(image.size),
+        "optimized_size_px": list(optimized.size),
+        "original_format": image.format,
+        "format": optimized.format
+    }
+
+
+def _optimize_image_blob(blob: bytes, target_size: Tuple[int, int], placed_size: Tuple[float, float],
+                         convert_photos: bool, jpeg_quality: int, strip_metadata: bool) -> Optional[bytes]:
+    """Re-encode an image at (at most) target_size pixels; None if there is nothing to do.
+
+    Touches no shared state, so it can run on any worker thread; Pillow releases
+    the GIL while decoding, resizing and encoding.
+    """
+    try:
+        pil_image = PIL_Image.open(io.BytesIO(blob))
+    except Exception:
+        return None  # Not a raster format Pillow reads (e.g. EMF, SVG)
+
+    with pil_image:
+        image_format = (pil_image.format or '').lower()
+        if image_format not in ('png', 'jpeg', 'bmp', 'tiff'):
+            return None
+        if getattr(pil_image, 'n_frames', 1) > 1:
+            return None  # Animated PNG or multi-page TIFF
+
+        width_px, height_px = pil_image.size
+        factor = max(target_size[0] / width_px, target_size[1] / height_px)
+        resize = factor < _DOWNSCALE_THRESHOLD
+
+        output_format = 'JPEG' if image_format == 'jpeg' else 'PNG'
+        if (convert_photos and output_format == 'PNG'
+                and not _has_transparency(pil_image) and _is_photographic(pil_image)):
+            output_format = 'JPEG'
+
+        if not resize and output_format == 'JPEG' and image_format == 'jpeg':
+            # Recompressing would only lose quality; drop the metadata segments losslessly
+            return _strip_jpeg_metadata(blob) if strip_metadata else None
+        if not resize and output_format == 'PNG' and image_format == 'png' and not strip_metadata:
+            return None
+
+        orientation = pil_image.getexif().get(_EXIF_ORIENTATION)
+        icc_profile = pil_image.info.get('icc_profile')
+        exif = pil_image.info.get('exif')
+
+        converted = pil_image
+        if output_format == 'JPEG' and converted.mode not in ('L', 'RGB', 'CMYK'):
+            converted = converted.convert('RGB')
+        elif converted.mode not in ('1', 'L', 'LA', 'RGB', 'RGBA') and (resize or output_format == 'PNG'):
+            converted = converted.convert('RGBA' if _has_transparency(converted) else 'RGB')
+        if resize:
+            new_size = (max(1, round(width_px * factor)), max(1, round(height_px * factor)))
+            converted = converted.resize(new_size, PIL_Image.LANCZOS)
+
+        options = {
+            "dpi": (round(converted.size[0] / placed_size[0]), round(converted.size[1] / placed_size[1]))
+        }
+        if icc_profile:
+            options["icc_profile"] = icc_profile
+        if not strip_metadata and exif:
+            options["exif"] = exif
+        elif orientation not in (None, 1):
+            # Keep the rotation viewers apply, whatever else is stripped
+            orientation_exif = PIL_Image.Exif()
+            orientation_exif[_EXIF_ORIENTATION] = orientation
+            options["exif"] = orientation_exif.tobytes()
+        if output_format == 'JPEG':
+            options.update(quality=jpeg_quality, optimize=True)
+
+        output = io.BytesIO()
+        converted.save(output, output_format, **options)
+        return output.getvalue()
+
+
+def _has_transparency(pil_image) -> bool:
+    """Check whether any pixel of an image is not fully opaque."""
+    if pil_image.mode in ('RGBA', 'LA', 'PA'):
+        return pil_image.getchannel('A').getextrema()[0] < 255
+    if 'transparency' in pil_image.info:
+        return pil_image.convert('RGBA').getchannel('A').getextrema()[0] < 255
+    return False
+
+
+def _is_photographic(pil_image) -> bool:
+    """Guess whether an image is a photograph (many distinct colors) rather than a logo, chart or screenshot."""
+    sample = pil_image.convert('RGB')
+    sample.thumbnail((128, 128))
+    colors = sample.getcolors(maxcolors=4096)
+    if colors is None:
+        return True
+    # A grayscale photo has at most 256 colors: look for a continuous range of gray levels instead
+    return len(colors) > 128 and all(red == green == blue for _, (red, green, blue) in colors)
+
+
+# APPn segments kept when stripping JPEG metadata: JFIF (APP0), ICC profile (APP2), Adobe color transform (APP14)
+_JPEG_KEPT_APP_MARKERS = (0xE0, 0xE2, 0xEE)
+
+
+def _strip_jpeg_metadata(blob: bytes) -> bytes:
+    """Drop EXIF/XMP/IPTC and comment segments from a JPEG without re-encoding it (keeps a non-default orientation)."""
+    if not blob.startswith(b'\xff\xd8'):
+        return blob
+    segments = [blob[:2]]
+    position = 2
+    while position + 4 <= len(blob):
+        if blob[position] != 0xFF:
+            return blob  # Not a marker where one is expected: leave the file alone
+        marker = blob[position + 1]
+        if marker == 0xFF:
+            position += 1  # Fill byte
+            continue
+        if marker in (0xDA, 0xD9):
+            # Start of scan: the rest is image data
+            segments.append(blob[position:])
+            return b''.join(segments)
+        length = struct.unpack_from('>H', blob, position + 2)[0]
+        segment = blob[position:position + 2 + length]
+        if marker == 0xE1 and segment[4:10] == b'Exif\x00\x00':
+            orientation = PIL_Image.open(io.BytesIO(blob)).getexif().get(_EXIF_ORIENTATION)
+            if orientation not in (None, 1):
+                orientation_exif = PIL_Image.Exif()
+                orientation_exif[_EXIF_ORIENTATION] = orientation
+                data = orientation_exif.tobytes()
+                segments.append(b'\xff\xe1' + struct.pack('>H', len(data) + 2) + data)
+        elif marker != 0xFE and not (0xE0 <= marker <= 0xEF and marker not in _JPEG_KEPT_APP_MARKERS):
+            segments.append(segment)
+        position += 2 + length
+    return blob
+
+
+_RELATIONSHIP_ATTRIBUTE_PREFIX = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+# Images per worker thread below which optimize_presentation_images doesn't add another worker
+_MIN_JOBS_PER_WORKER = 2
+
+
+def optimize_presentation_images(presentation, target_dpi: float = 150, convert_photos: bool = False,
+                                 jpeg_quality: int = 85, strip_metadata: bool = True,
+                                 deduplicate: bool = True, max_workers: Optional[int] = None) -> Dict:
+    """
+    Shrink the media of a presentation in place.
+
+    Identical image and media parts are merged into one first. Then each image
+    is downscaled to target_dpi at the largest size it is shown at anywhere in
+    the deck (taking group scaling and cropping into account) and recompressed
+    as optimize_image_for_slide does, in parallel on a thread pool. Images whose
+    display size can't be determined (tiled fills, images used by charts or
+    legacy VML drawings, images that aren't shown at all) are left untouched, as
+    are images that wouldn't get smaller. Shapes keep their size and position.
+
+    Args:
+        presentation: The Presentation object
+        target_dpi: Resolution to keep at the largest displayed size
+        convert_photos: Re-encode opaque photographic PNG, BMP and TIFF images as JPEG
+        jpeg_quality: JPEG quality (1-95) for re-encoded images
+        strip_metadata: Drop metadata that doesn't affect how images are shown
+        deduplicate: Merge parts with identical content
+        max_workers: Worker threads (env PPT_MEDIA_WORKERS, default the number of CPUs);
+            at most one per two images, and none (optimized in the calling thread) below four
+
+    Returns:
+        Report with media byte totals before and after, duplicates merged,
+        counts of optimized and skipped images, and one entry per optimized image
+    """
+    package = presentation.part.package
+    media_parts = [part for part in package.iter_parts() if isinstance(part, (ImagePart, MediaPart))]
+    bytes_before = sum(len(part.blob) for part in media_parts)
+
+    duplicates = _merge_duplicate_parts(package, media_parts) if deduplicate else 0
+
+    display_sizes = _image_display_sizes(presentation)
+    image_parts = [part for part in package.iter_parts() if isinstance(part, ImagePart)]
+    skipped = {"display_size_unknown": 0, "not_displayed": 0, "no_gain": 0}
+    jobs = []
+    for part in image_parts:
+        if part not in display_sizes:
+            skipped["not_displayed"] += 1
+        elif display_sizes[part] is None:
+            skipped["display_size_unknown"] += 1
+        else:
+            width, height = display_sizes[part]
+            target_size = (max(1, math.ceil(width * target_dpi)), max(1, math.ceil(height * target_dpi)))
+            jobs.append((part, target_size, (width, height)))
+
+    if max_workers is None:
+        max_workers = int(os.environ.get('PPT_MEDIA_WORKERS', '0')) or os.cpu_count() or 1
+    max_workers = min(max_workers, len(jobs) // _MIN_JOBS_PER_WORKER)
+    job_args = [(part.blob, target_size, displayed, convert_photos, jpeg_quality, strip_metadata)
+                for part, target_size, displayed in jobs]
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ppt-media") as executor:
+            blobs = list(executor.map(_optimize_image_blob, *zip(*job_args)))
+    else:
+        blobs = [_optimize_image_blob(*args) for args in job_args]
+
+    optimized = []
+    renamed = set()
+    for (part, _, displayed), (original, *_), blob in zip(jobs, job_args, blobs):
+        if blob is None or len(blob) >= len(original):
+            skipped["no_gain"] += 1
+            continue
+        original_image = Image(original, None)
+        partname = part.partname
+        image = _replace_image_blob(package, part, blob)
+        if part.partname != partname:
+            renamed.add(part)
+        optimized.append({
+            "partname": str(part.partname),
+            "displayed_size_in": [round(displayed[0], 2), round(displayed[1], 2)],
+            "original_size_px": list(original_image.size),
+            "optimized_size_px": list(image.size),
+            "original_format": original_image._format.lower(),
+            "format": image._format.lower(),
+            "original_bytes": len(original),
+            "optimized_bytes": len(blob),
+            "bytes_saved": len(original) - len(blob)
+        })
+
+    if renamed:
+        # Relationships cache the path of their target
+        for rel in package.iter_rels():
+            if not rel.is_external and rel._target in renamed:
+                _set_relationship_target(rel, rel._target)
+
+    bytes_after = sum(len(part.blob) for part in package.iter_parts() if isinstance(part, (ImagePart, MediaPart)))
+    return {
+        "media_parts_before": len(media_parts),
+        "media_bytes_before": bytes_before,
+        "media_bytes_after": bytes_after,
+        "bytes_saved": bytes_before - bytes_after,
+        "duplicates_merged": duplicates,
+        "images_optimized": len(optimized),
+        "images_skipped": skipped,
+        "workers": max(max_workers, 1),
+        "images": optimized
+    }
+
+
+def _merge_duplicate_parts(package, parts: List) -> int:
+    """Point every relationship to a media part at the first part with the same content; returns the number merged."""
+    canonical = {}
+    replacements = {}
+    for part in parts:
+        key = (part.content_type, hashlib.sha256(part.blob).digest())
+        first = canonical.setdefault(key, part)
+        if first is not part:
+            replacements[part] = first
+    if replacements:
+        for rel in list(package.iter_rels()):
+            if not rel.is_external and rel._target in replacements:
+                _set_relationship_target(rel, replacements[rel._target])
+    return len(replacements)
+
+
+def _set_relationship_target(rel, part) -> None:
+    """Point a relationship at a part, dropping the target properties python-pptx caches."""
+    rel._target = part
+    for name in ('target_part', 'target_partname', 'target_ref'):
+        rel.__dict__.pop(name, None)
+
+
+def _image_display_sizes(presentation) -> Dict:
+    """
+    Find the largest width and height (in inches) each image part is shown at.
+
+    Returns:
+        Dictionary of image part -> (width, height), or None when an image is used
+        somewhere its size can't be determined; images never shown are absent
+    """
+    slide_size = (presentation.slide_width / 914400, presentation.slide_height / 914400)
+    sizes = {}
+    unknown = set()
+    for part in presentation.part.package.iter_parts():
+        image_rels = {
+            rId: rel.target_part for rId, rel in part.rels.items()
+            if not rel.is_external and isinstance(rel.target_part, ImagePart)
+        }
+        if not image_rels:
+            continue
+        if not isinstance(part, XmlPart) or isinstance(part, ChartPart):
+            unknown.update(image_rels.values())  # e.g. VML drawings, chart fills sized by the chart layout
+            continue
+
+        for element in part._element.iter(tag=etree.Element):
+            for name, value in element.attrib.items():
+                if value not in image_rels or not name.startswith(_RELATIONSHIP_ATTRIBUTE_PREFIX):
+                    continue
+                image_part = image_rels[value]
+                size = _blip_display_size(element, slide_size) if element.tag == qn('a:blip') else None
+                if size is None:
+                    unknown.add(image_part)
+                else:
+                    width, height = sizes.get(image_part, (0, 0))
+                    sizes[image_part] = (max(width, size[0]), max(height, size[1]))
+
+    for image_part in unknown:
+        sizes[image_part] = None
+    return sizes
+
+
+def _blip_display_size(blip, slide_size: Tuple[float, float]) -> Optional[Tuple[float, float]]:
+    """Size in inches an a:blip's whole image is drawn at, or None if it's tiled or unknown."""
+    blip_fill = blip.getparent()
+    if blip_fill is None or blip_fill.find(qn('a:tile')) is not None:
+        return None
+
+    extent = None
+    scale_x = scale_y = 1.0
+    for ancestor in blip_fill.iterancestors():
+        if extent is None:
+            # The picture's own size: p:pic/p:spPr/a:xfrm, a shape fill's p:spPr/a:xfrm, a table's p:xfrm
+            for path in (qn('a:xfrm'), '{*}spPr/' + qn('a:xfrm'), qn('p:xfrm')):
+                ext = ancestor.find(path + '/' + qn('a:ext'))
+                if ext is not None:
+                    extent = (int(ext.get('cx', 0)), int(ext.get('cy', 0)))
+                    break
+            continue
+        # Shapes in a group are drawn scaled by the group's extent over its child extent
+        group_xfrm = ancestor.find('{*}grpSpPr/' + qn('a:xfrm'))
+        if group_xfrm is not None:
+            ext, child_ext = group_xfrm.find(qn('a:ext')), group_xfrm.find(qn('a:chExt'))
+            if ext is not None and child_ext is not None and int(child_ext.get('cx', 0)) and int(child_ext.get('cy', 0)):
+                scale_x *= int(ext.get('cx', 0)) / int(child_ext.get('cx'))
+                scale_y *= int(ext.get('cy', 0)) / int(child_ext.get('cy'))
+
+    if extent is None:
+        # Backgrounds and placeholders inheriting their size: the slide is the upper bound
+        width, height = slide_size
+    else:
+        width, height = extent[0] * scale_x / 914400, extent[1] * scale_y / 914400
+
+    # Only the part of the image inside a:srcRect is shown, stretched over the extent
+    src_rect = blip_fill.find(qn('a:srcRect'))
+    if src_rect is not None:
+        def crop(edge):
+            value = src_rect.get(edge, '0')
+            return float(value[:-1]) / 100 if value.endswith('%') else int(value) / 100000
+        width /= max(1 - crop('l') - crop('r'), 0.01)
+        height /= max(1 - crop('t') - crop('b'), 0.01)
+    return width, height
+
+
+def _replace_image_blob(package, part: ImagePart, blob: bytes) -> Image:
+    """Swap the content of an image part, renaming it if its format changed."""
+    image = Image(blob, None)
+    if image.ext != part.partname.ext:
+        part.partname = package.next_image_partname(image.ext)
+        part._content_type = image.content_type
+    part._blob = blob
+    part.__dict__.pop('sha1', None)  # Cached by python-pptx's lazyproperty
+    return image
@@ -0,0 +1,569 @@
+"""
+Package utilities for PowerPoint MCP Server.
+Lazy loading of .pptx packages from a memory-mapped file (parts are read and
+parsed only when python-pptx first touches them), and saving that copies
+unchanged parts from the source file without recompressing them.
+"""
+import hashlib
+import io
+import mmap
+import os
+import struct
+import threading
+import weakref
+import zipfile
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pptx import Presentation
+from pptx.opc.package import Part, PartFactory, XmlPart
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from pptx.package import Package
+from pptx.util import lazyproperty
+
+# The lazy loader builds on python-pptx internals (_is_pptx_package, _PackageLoader,
+# _ContentTypesItem) as found in python-pptx 1.0.x, which pyproject.toml pins, and on
+# zipfile internals for copying compressed members. If any of them is missing,
+# presentations are loaded and saved the regular way instead.
+try:
+    from pptx.api import _is_pptx_package
+    from pptx.opc.oxml import parse_xml, serialize_part_xml
+    from pptx.opc.package import _PackageLoader
+    from pptx.opc.serialized import _ContentTypesItem
+    LAZY_LOADING_SUPPORTED = (
+        all(hasattr(_PackageLoader, name) for name in ('load', '_content_types', '_package_reader', '_parts', '_xml_rels'))
+        and hasattr(_ContentTypesItem, 'xml_for')
+        and hasattr(PartFactory, '_part_cls_for')
+        and hasattr(zipfile.ZipFile, '_writecheck')
+        and hasattr(zipfile.ZipInfo, 'FileHeader')
+        and hasattr(zipfile, 'stringFileHeader')
+        and hasattr(zipfile, 'sizeFileHeader')
+    )
+except ImportError:
+    _PackageLoader = object
+    LAZY_LOADING_SUPPORTED = False
+
+
+# Readers whose file is still mapped, for checking save targets against
+_open_readers = weakref.WeakSet()
+_open_readers_lock = threading.Lock()
+
+
+class _MappedZipReader:
+    """
+    Package reader over a memory-mapped .pptx file, reading ZIP members on demand.
+
+    The file stays mapped until the package is closed and no unwritten snapshot
+    still refers to it, so member data is read straight from the page cache
+    rather than copied into memory at open. Reads fail if the file is modified
+    in place after opening; replacing it (as save_presentation does for every
+    file that is still mapped) is safe, the mapping keeps the original.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._zip = zipfile.ZipFile(self._file)
+        except Exception:
+            self._file.close()
+            raise
+        self._signature = self._stat()
+        self._members = {PackURI("/%s" % info.filename): info for info in self._zip.infolist()}
+        self._lock = threading.Lock()
+        self._users = 1   # The package, plus each snapshot not yet written
+        self._closed = False
+        with _open_readers_lock:
+            _open_readers.add(self)
+
+    def _stat(self):
+        stat = os.fstat(self._file.fileno())
+        return stat.st_mtime_ns, stat.st_size
+
+    def __contains__(self, pack_uri) -> bool:
+        return pack_uri in self._members
+
+    def check_unchanged(self) -> None:
+        """Raise IOError if the file was modified in place since it was opened."""
+        if self._stat() != self._signature:
+            raise IOError(f"'{self.path}' was modified after it was opened")
+
+    def __getitem__(self, pack_uri: PackURI) -> bytes:
+        info = self._members.get(pack_uri)
+        if info is None:
+            raise KeyError("no member '%s' in package" % pack_uri)
+        self.check_unchanged()
+
+        if info.flag_bits & 0x1 or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            # Encrypted or unusual compression: let zipfile handle (or reject) it
+            with self._lock:
+                return self._zip.read(info)
+
+        data = self._member_data(info)
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            blob = zlib.decompress(data, -zlib.MAX_WBITS, max(info.file_size, 1))
+        else:
+            blob = bytes(data)
+        if zlib.crc32(blob) != info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for member '{info.filename}' in '{self.path}'")
+        return blob
+
+    def _member_data(self, info: zipfile.ZipInfo) -> memoryview:
+        """Get a view of a member's (compressed) data in the mapped file."""
+        offset = info.header_offset
+        if self._map[offset:offset + 4] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Bad local file header for member '{info.filename}' in '{self.path}'")
+        name_length, extra_length = struct.unpack_from('<HH', self._map, offset + 26)
+        start = offset + zipfile.sizeFileHeader + name_length + extra_length
+        return memoryview(self._map)[start:start + info.compress_size]
+
+    def rels_xml_for(self, partname: PackURI) -> Optional[bytes]:
+        uri = partname.rels_uri
+        return self[uri] if uri in self._members else None
+
+    def copy_member(self, zip_file: zipfile.ZipFile, pack_uri: PackURI, membername: str,
+                    blob: Optional[bytes] = None) -> bool:
+        """
+        Copy a member's compressed data into another archive without recompressing it.
+
+        Args:
+            zip_file: Archive open for writing
+            pack_uri: Member to copy
+            membername: Name to store it under
+            blob: Current content of the part; when given, the member is only
+                copied if it still holds exactly these bytes
+
+        Returns:
+            True if the member was copied
+        """
+        info = self._members.get(pack_uri)
+        if info is None or info.flag_bits & 0x1:
+            return False
+        if blob is not None and (len(blob) != info.file_size or zlib.crc32(blob) != info.CRC):
+            return False
+        self.check_unchanged()
+        _write_raw_member(zip_file, info, membername, self._member_data(info))
+        return True
+
+    def retain(self) -> None:
+        """Keep the file mapped until a matching close()."""
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"'{self.path}' is no longer open")
+            self._users += 1
+
+    def close(self) -> None:
+        """Release one user; the file is unmapped and closed once the last one is done."""
+        with self._lock:
+            if self._closed:
+                return
+            self._users -= 1
+            if self._users > 0:
+                return
+            self._closed = True
+        with _open_readers_lock:
+            _open_readers.discard(self)
+        self._zip.close()
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # Views of the mapping are still alive; it is unmapped when they go away
+        self._file.close()
+
+
+def _write_raw_member(zip_file: zipfile.ZipFile, source_info: zipfile.ZipInfo, membername: str, data) -> None:
+    """Append already-compressed member data to an archive open for writing."""
+    info = zipfile.ZipInfo(membername, date_time=source_info.date_time)
+    info.compress_type = source_info.compress_type
+    info.flag_bits = source_info.flag_bits & ~0x08  # Sizes go in the local header, no data descriptor
+    info.external_attr = source_info.external_attr
+    info.CRC = source_info.CRC
+    info.compress_size = source_info.compress_size
+    info.file_size = source_info.file_size
+
+    # zipfile has no public API for pre-compressed data; this mirrors what ZipFile.write() does
+    with zip_file._lock:
+        zip_file._writecheck(info)
+        zip_file._didModify = True
+        info.header_offset = zip_file.fp.tell()
+        zip_file.fp.write(info.FileHeader())
+        zip_file.fp.write(data)
+        zip_file.filelist.append(info)
+        zip_file.NameToInfo[info.filename] = info
+        zip_file.start_dir = zip_file.fp.tell()
+
+
+def snapshot_package(package: Package) -> List[Tuple]:
+    """
+    Capture the current content of every member of a package, for writing later.
+
+    XML is serialized right away. Binary blobs are immutable bytes and are only
+    referenced, and parts never loaded from a mapped source file are referenced
+    in that file, so a snapshot stays valid while the presentation keeps changing.
+    The source files stay mapped, even if the package is closed meanwhile, until
+    the snapshot is passed to write_package_snapshot.
+
+    Args:
+        package: The python-pptx package (presentation.part.package)
+
+    Returns:
+        List of (member name, bytes or None, source reader, source member) tuples
+    """
+    if not LAZY_LOADING_SUPPORTED:
+        # Without the package internals, serialize the whole package and keep its members
+        buffer = io.BytesIO()
+        package.save(buffer)
+        with zipfile.ZipFile(buffer) as zip_file:
+            return [(info.filename, zip_file.read(info), None, None) for info in zip_file.infolist()]
+
+    parts = tuple(package.iter_parts())
+    members = [
+        (CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts)), None, None),
+        (PACKAGE_URI.rels_uri.membername, package._rels.xml, None, None)
+    ]
+    for part in parts:
+        reader = getattr(part, '_reader', None)
+        source_uri = getattr(part, '_source_partname', None)
+        blob = None if reader is not None and not part.is_loaded else part.blob
+        members.append((part.partname.membername, blob, reader, source_uri))
+        if part._rels:
+            members.append((part.partname.rels_uri.membername, part.rels.xml, reader,
+                            source_uri.rels_uri if source_uri is not None else None))
+    for reader in {member[2] for member in members if member[2] is not None}:
+        reader.retain()
+    return members
+
+
+def write_package_snapshot(members: List[Tuple], pkg_file,
+                           progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+    """
+    Write a package snapshot as a .pptx file, the way python-pptx's PackageWriter does.
+
+    Members that were never loaded, and members whose content still matches
+    their source, are copied from the source file byte-for-byte; everything
+    else is compressed and written.
+
+    Args:
+        members: Snapshot from snapshot_package
+        pkg_file: Path or writable binary file object
+        progress: Optional callable receiving (members done, bytes written) after each member
+
+    Returns:
+        Dictionary with the number of members copied and written
+    """
+    stats = {"members_copied": 0, "members_written": 0}
+    try:
+        with zipfile.ZipFile(pkg_file, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file:
+            for index, (membername, blob, reader, source_uri) in enumerate(members):
+                if reader is not None and reader.copy_member(zip_file, source_uri, membername, blob):
+                    stats["members_copied"] += 1
+                else:
+                    zip_file.writestr(membername, blob if blob is not None else reader[source_uri])
+                    stats["members_written"] += 1
+                if progress is not None:
+                    progress(index + 1, zip_file.fp.tell())
+    finally:
+        # Release the source files retained by snapshot_package
+        for reader in {member[2] for member in members if member[2] is not None}:
+            reader.close()
+    return stats
+
+
+class _LazyPart:
+    """Base of the lazy part mixins: a part whose content is still in the package file."""
+
+    _reader = None
+    _source_partname = None
+
+    @classmethod
+    def load_lazy(cls, partname, content_type, package, reader):
+        part = cls(partname, content_type, package, None)
+        part._reader = reader
+        # Slide parts get renamed when slides are reordered; remember the member holding the content
+        part._source_partname = partname
+        return part
+
+
+class _LazyXmlPart(_LazyPart):
+    """Mixin deferring the XML parse of a part until its element is first used."""
+
+    @property
+    def _element(self):
+        element = self.__dict__.get('_lazy_element')
+        if element is None and self._reader is not None:
+            element = self.__dict__['_lazy_element'] = parse_xml(self._reader[self._source_partname])
+        return element
+
+    @_element.setter
+    def _element(self, element):
+        self.__dict__['_lazy_element'] = element
+
+    @property
+    def blob(self) -> bytes:
+        if self.__dict__.get('_lazy_element') is None and self._reader is not None:
+            # Untouched: the original XML is still exact
+            return self._reader[self._source_partname]
+        return super().blob
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__.get('_lazy_element') is not None
+
+
+class _LazyBlobPart(_LazyPart):
+    """Mixin leaving a binary part (image, media, workbook) in the package file until its blob is replaced."""
+
+    @property
+    def _blob(self):
+        blob = self.__dict__.get('_lazy_blob')
+        if blob is None and self._reader is not None:
+            # Read from the mapped file on every use instead of kept, so media never piles up in memory
+            return self._reader[self._source_partname]
+        return blob
+
+    @_blob.setter
+    def _blob(self, blob):
+        self.__dict__['_lazy_blob'] = blob
+        self.__dict__.pop('sha1', None)  # Hash of the previous content
+
+    @property
+    def sha1(self) -> str:
+        """SHA-1 of the blob, computed once per content: python-pptx hashes every image part on each add_picture."""
+        sha1 = self.__dict__.get('sha1')
+        if sha1 is None:
+            sha1 = self.__dict__['sha1'] = hashlib.sha1(self._blob).hexdigest()
+        return sha1
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__.get('_lazy_blob') is not None
+
+
+_lazy_part_classes = {}
+_lazy_part_classes_lock = threading.Lock()
+
+
+def _lazy_part_class(part_class: type) -> type:
+    """Get the lazy subclass of a registered part class (created on first use)."""
+    lazy_class = _lazy_part_classes.get(part_class)
+    if lazy_class is None:
+        with _lazy_part_classes_lock:
+            lazy_class = _lazy_part_classes.get(part_class)
+            if lazy_class is None:
+                mixin = _LazyXmlPart if issubclass(part_class, XmlPart) else _LazyBlobPart
+                lazy_class = type(f"Lazy{part_class.__name__}", (mixin, part_class), {})
+                _lazy_part_classes[part_class] = lazy_class
+    return lazy_class
+
+
+class _LazyPackageLoader(_PackageLoader):
+    """Package loader that creates lazy parts; only the relationship items are read up front."""
+
+    @lazyproperty
+    def _package_reader(self):
+        if isinstance(self._pkg_file, _MappedZipReader):
+            # Reopened from a held source: share its mapping
+            reader = self._pkg_file
+            reader.retain()
+        else:
+            reader = _MappedZipReader(self._pkg_file)
+        self._package._reader = reader
+        return reader
+
+    @lazyproperty
+    def _parts(self):
+        content_types = self._content_types
+        package = self._package
+        package_reader = self._package_reader
+
+        parts = {}
+        for partname in self._xml_rels:
+            if partname == "/" or partname not in package_reader:
+                continue
+            content_type = content_types[partname]
+            part_class = _lazy_part_class(PartFactory._part_cls_for(content_type))
+            parts[partname] = part_class.load_lazy(partname, content_type, package, package_reader)
+        return parts
+
+
+class LazyPackage(Package):
+    """A python-pptx Package backed by a memory-mapped file, whose parts are loaded on first use."""
+
+    _reader = None
+    read_only = False
+    closed = False
+    last_save_stats = None
+
+    def _load(self):
+        pkg_xml_rels, parts = _LazyPackageLoader.load(self._pkg_file, self)
+        self._rels.load_from_xml(PACKAGE_URI, pkg_xml_rels, parts)
+        return self
+
+    @property
+    def source_path(self) -> str:
+        """Absolute path of the file the package was opened from."""
+        return self._reader.path
+
+    def save(self, pkg_file) -> None:
+        """Save the package, copying parts unchanged since open straight from the source file."""
+        self.last_save_stats = write_package_snapshot(snapshot_package(self), pkg_file)
+
+    def close(self) -> None:
+        """Unmap and close the source file (once pending snapshots are written); parts not loaded become unreadable."""
+        if not self.closed:
+            self.closed = True
+            self._reader.close()
+
+
+def _open_lazy_presentation(source, read_only: bool) -> Presentation:
+    if not LAZY_LOADING_SUPPORTED:
+        presentation = Presentation(source)
+        presentation.part.package.read_only = read_only
+        return presentation
+
+    if isinstance(source, _MappedZipReader):
+        source.check_unchanged()
+        file_path = source.path
+    else:
+        file_path = source
+        if os.path.isdir(file_path) or not zipfile.is_zipfile(file_path):
+            raise ValueError(f"file '{file_path}' is not a PowerPoint (.pptx) package")
+
+    package = LazyPackage(source)
+    package.read_only = read_only
+    presentation_part = package._load().main_document_part
+    if not _is_pptx_package(presentation_part):
+        raise ValueError(
+            f"file '{file_path}' is not a PowerPoint file, content type is '{presentation_part.content_type}'"
+        )
+    return presentation_part.presentation
+
+
+def open_read_only_presentation(file_path: str) -> Presentation:
+    """
+    Open a presentation read-only, loading parts lazily.
+
+    Only the relationship items, [Content_Types].xml and presentation.xml are
+    read at open; each slide, layout, image and chart workbook is read from
+    the file and parsed when first accessed. If LAZY_LOADING_SUPPORTED is
+    False, the file is loaded in full and only marked read-only.
+
+    Args:
+        file_path: Path to the .pptx file
+
+    Returns:
+        A Presentation object
+    """
+    return _open_lazy_presentation(file_path, read_only=True)
+
+
+def open_mapped_presentation(file_path: str) -> Presentation:
+    """
+    Open a presentation for editing from a memory-mapped file.
+
+    XML parts are parsed when first accessed. Binary parts (images, video,
+    audio, embedded workbooks) stay references into the mapped file until
+    they are replaced, so even very large decks open without reading their
+    media into memory. If LAZY_LOADING_SUPPORTED is False, the file is
+    loaded in full.
+
+    Args:
+        file_path: Path to the .pptx file
+
+    Returns:
+        A Presentation object
+    """
+    return _open_lazy_presentation(file_path, read_only=False)
+
+
+def is_read_only_presentation(presentation: Presentation) -> bool:
+    """Check whether a presentation was opened with open_read_only_presentation."""
+    return getattr(presentation.part.package, 'read_only', False)
+
+
+def get_presentation_source_path(presentation: Presentation) -> Optional[str]:
+    """Get the file a lazily opened presentation reads its parts from (None for fully loaded ones)."""
+    package = presentation.part.package
+    return package.source_path if isinstance(package, LazyPackage) else None
+
+
+def close_presentation_package(presentation: Presentation) -> None:
+    """
+    Release the file a lazily opened presentation reads from (no-op for fully loaded ones).
+
+    Call this once the presentation is dropped; otherwise the file stays open and
+    mapped (and, on Windows, locked) until the package is garbage collected.
+
+    Args:
+        presentation: The Presentation object
+    """
+    package = presentation.part.package
+    if isinstance(package, LazyPackage):
+        package.close()
+
+
+def hold_presentation_source(presentation: Presentation):
+    """
+    Keep the file a lazily opened presentation reads from mapped after its package is closed.
+
+    The held mapping keeps the file's content as it was at open, even if the
+    file is replaced meanwhile, and the file stays among get_mapped_source_paths().
+
+    Args:
+        presentation: The Presentation object
+
+    Returns:
+        Handle for reopen_held_presentation and release_presentation_source,
+        or None for fully loaded presentations
+    """
+    package = presentation.part.package
+    if not isinstance(package, LazyPackage):
+        return None
+    package._reader.retain()
+    return package._reader
+
+
+def reopen_held_presentation(source, read_only: bool = True) -> Presentation:
+    """
+    Open a new presentation from a source held with hold_presentation_source.
+
+    The source stays held; release it with release_presentation_source.
+
+    Raises:
+        IOError: If the file was modified in place since it was first opened
+    """
+    return _open_lazy_presentation(source, read_only)
+
+
+def release_presentation_source(source) -> None:
+    """Release a source held with hold_presentation_source."""
+    source.close()
+
+
+def get_mapped_source_paths() -> List[str]:
+    """Get the files still memory-mapped by open lazy presentations or pending snapshots."""
+    with _open_readers_lock:
+        return [reader.path for reader in _open_readers]
+
+
+def is_part_loaded(part: Part) -> bool:
+    """Check whether a part's content is in memory (always True for eagerly loaded parts)."""
+    return getattr(part, 'is_loaded', True)
+
+
+def get_package_load_stats(presentation: Presentation) -> Dict:
+    """
+    Count the parts of a presentation and how many of them are loaded in memory.
+
+    Args:
+        presentation: The Presentation object
+
+    Returns:
+        Dictionary with parts_total and parts_loaded
+    """
+    parts = list(presentation.part.package.iter_parts())
+    return {
+        "parts_total": len(parts),
+        "parts_loaded": sum(1 for part in parts if is_part_loaded(part))
+    }
@@ -3,8 +3,30 @@ Presentation management utilities for PowerPoint MCP Server.
 Functions for creating, opening, saving, and managing presentations.
 """
 from pptx import Presentation
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Hashable, List, Optional
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import atexit
+import copy
+import hashlib
+import io
+import logging
 import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from .package_utils import (
+    close_presentation_package, get_mapped_source_paths, get_presentation_source_path, hold_presentation_source,
+    is_part_loaded, is_read_only_presentation, open_mapped_presentation, open_read_only_presentation,
+    release_presentation_source, reopen_held_presentation, snapshot_package, write_package_snapshot
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 def create_presentation() -> Presentation:
@@ -17,16 +39,31 @@ def create_presentation() -> Presentation:
     return Presentation()
 
 
-def open_presentation(file_path: str) -> Presentation:
+def open_presentation(file_path: str, mode: str = "edit") -> Presentation:
     """
     Open an existing PowerPoint presentation.
     
+    Files of at least PPT_MMAP_THRESHOLD_MB (default 32, 0 disables) are
+    memory-mapped rather than read: their parts are loaded on first use and
+    media stays in the mapped file until saved.
+    
     Args:
         file_path: Path to the PowerPoint file
+        mode: "edit" opens the presentation for changes; "read" opens it
+            read-only and loads each slide, image and embedded workbook only
+            when first used
         
     Returns:
         A Presentation object
     """
+    if mode == "read":
+        return open_read_only_presentation(file_path)
+    if mode != "edit":
+        raise ValueError(f"Invalid mode '{mode}'. Use 'edit' or 'read'")
+    
+    threshold_mb = float(os.environ.get('PPT_MMAP_THRESHOLD_MB', '32'))
+    if threshold_mb > 0 and os.path.isfile(file_path) and os.path.getsize(file_path) >= threshold_mb * 1024 * 1024:
+        return open_mapped_presentation(file_path)
     return Presentation(file_path)
 
 
@@ -51,13 +88,240 @@ def create_presentation_from_template(template_path: str) -> Presentation:
         raise ValueError("Template file must be a .pptx or .potx file")
     
     try:
-        # Load the template file as a presentation
-        presentation = Presentation(template_path)
-        return presentation
+        # Clone the cached, pre-parsed template instead of re-reading the file
+        return template_package_cache.get_presentation(template_path)
     except Exception as e:
         raise Exception(f"Failed to load template file '{template_path}': {str(e)}")
 
 
+class TemplatePackageCache:
+    """
+    In-process cache of parsed template packages.
+    
+    Each template is parsed once and kept as a master copy, keyed by absolute
+    path and invalidated when the file's mtime or size changes. Callers get an
+    independent deep copy of the master, which is considerably cheaper than
+    unzipping and parsing the package again.
+    """
+    
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Args:
+            max_entries: Maximum templates kept (env PPT_TEMPLATE_CACHE_SIZE, default 8)
+        """
+        if max_entries is None:
+            max_entries = int(os.environ.get('PPT_TEMPLATE_CACHE_SIZE', '8'))
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # abspath -> (mtime_ns, size, master Presentation)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+    
+    def get_presentation(self, template_path: str) -> Presentation:
+        """
+        Get a new, independent Presentation built from a template file.
+        
+        Args:
+            template_path: Path to the template file
+            
+        Returns:
+            A new Presentation object based on the template
+        """
+        path = os.path.abspath(template_path)
+        stat = os.stat(path)
+        
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._entries.move_to_end(path)
+                self._hits += 1
+                master = entry[2]
+            else:
+                if entry is not None:
+                    self._invalidations += 1
+                self._misses += 1
+                with open(path, 'rb') as f:
+                    master = Presentation(io.BytesIO(f.read()))
+                if self.max_entries > 0:
+                    self._entries[path] = (stat.st_mtime_ns, stat.st_size, master)
+                    self._entries.move_to_end(path)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+        
+        # The master is never handed out or modified, so it can be copied without the lock
+        return copy.deepcopy(master)
+    
+    def clear(self) -> None:
+        """Drop all cached templates."""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict:
+        """Get cache hit/miss statistics."""
+        with self._lock:
+            return {
+                "cached_templates": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations
+            }
+
+
+template_package_cache = TemplatePackageCache()
+
+
+class TemplateFileIndex:
+    """
+    Index of template files (name -> absolute path) across the template search directories.
+    
+    A directory is only re-listed when its mtime changes, and directory mtimes are
+    checked at most once per TTL, so resolving a template name normally touches
+    the filesystem not at all. When names repeat across directories, the first
+    directory in search order wins.
+    """
+    
+    TEMPLATE_EXTENSIONS = ('.pptx', '.potx')
+    
+    def __init__(self, get_directories: Callable[[], List[str]], ttl: Optional[float] = None):
+        """
+        Args:
+            get_directories: Callable returning the directories to search, in priority order
+            ttl: Seconds between directory mtime checks (env PPT_TEMPLATE_INDEX_TTL, default 5)
+        """
+        if ttl is None:
+            ttl = float(os.environ.get('PPT_TEMPLATE_INDEX_TTL', '5'))
+        self.ttl = ttl
+        self._get_directories = get_directories
+        self._listings = {}   # abs directory -> (mtime_ns, {name: abs path})
+        self._index = {}      # name -> abs path
+        self._directories = []
+        self._last_checked = None
+        self._lock = threading.Lock()
+    
+    def resolve(self, template_name: str) -> Optional[str]:
+        """
+        Get the absolute path of a template by file name.
+        
+        Args:
+            template_name: Template file name (any directory part is ignored)
+            
+        Returns:
+            Absolute path, or None if no search directory contains the template
+        """
+        name = os.path.basename(template_name)
+        with self._lock:
+            self._refresh()
+            path = self._index.get(name)
+            if path is None and self._last_checked is not None:
+                # The template may have been added since the last check
+                self._refresh(force=True)
+                path = self._index.get(name)
+            return path
+    
+    def list_files(self) -> List[Dict]:
+        """
+        List all indexed template files.
+        
+        Returns:
+            List of dicts with name, path and directory of each template
+        """
+        with self._lock:
+            self._refresh()
+            return [
+                {"name": name, "path": path, "directory": os.path.dirname(path)}
+                for name, path in sorted(self._index.items())
+            ]
+    
+    def get_directories(self) -> List[str]:
+        """Get the directories covered by the index, in search order."""
+        with self._lock:
+            self._refresh()
+            return list(self._directories)
+    
+    def _refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and self._last_checked is not None and now - self._last_checked < self.ttl:
+            return
+        self._last_checked = now
+        
+        directories = []
+        for directory in self._get_directories():
+            abs_dir = os.path.abspath(os.path.expanduser(directory))
+            if abs_dir not in directories:
+                directories.append(abs_dir)
+        
+        changed = directories != self._directories
+        listings = {}
+        for abs_dir in directories:
+            try:
+                mtime = os.stat(abs_dir).st_mtime_ns
+            except OSError:
+                changed = changed or abs_dir in self._listings
+                continue
+            cached = self._listings.get(abs_dir)
+            if cached is not None and cached[0] == mtime:
+                listings[abs_dir] = cached
+                continue
+            listings[abs_dir] = (mtime, self._scan(abs_dir))
+            changed = True
+        
+        if changed:
+            index = {}
+            for abs_dir in directories:
+                for name, path in listings.get(abs_dir, (None, {}))[1].items():
+                    index.setdefault(name, path)
+            self._index = index
+        self._listings = listings
+        self._directories = directories
+    
+    def _scan(self, abs_dir: str) -> Dict[str, str]:
+        files = {}
+        try:
+            with os.scandir(abs_dir) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(self.TEMPLATE_EXTENSIONS) and entry.is_file():
+                        files[entry.name] = entry.path
+        except OSError:
+            pass
+        return files
+
+
+def _saves_over_mapped_file(presentation: Presentation, file_path: str) -> bool:
+    """Check whether file_path is a file that any memory-mapped presentation still reads its parts from."""
+    if not os.path.exists(file_path):
+        return False
+    source_path = get_presentation_source_path(presentation)
+    if source_path is not None and is_read_only_presentation(presentation):
+        try:
+            saves_over_source = os.path.samefile(file_path, source_path)
+        except OSError:
+            saves_over_source = False  # Source file since removed or renamed
+        if saves_over_source:
+            raise ValueError("A presentation opened read-only can't be saved over its own file")
+    for mapped_path in get_mapped_source_paths():
+        try:
+            if os.path.samefile(file_path, mapped_path):
+                return True
+        except OSError:
+            continue  # Mapped file since replaced or removed
+    return False
+
+
+def _write_replacing(file_path: str, write: Callable[[str], object]):
+    """Write a file through a temporary file next to it, swapped in once complete."""
+    temp_path = os.path.join(os.path.dirname(os.path.abspath(file_path)), f".{uuid.uuid4().hex}.pptx.tmp")
+    try:
+        result = write(temp_path)
+        os.replace(temp_path, file_path)
+        return result
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 def save_presentation(presentation: Presentation, file_path: str) -> str:
     """
     Save a PowerPoint presentation to a file.
@@ -69,10 +333,248 @@ def save_presentation(presentation: Presentation, file_path: str) -> str:
     Returns:
         The file path where the presentation was saved
     """
-    presentation.save(file_path)
+    if _saves_over_mapped_file(presentation, file_path):
+        # This or another open deck still reads parts from the mapped file: write a new file and swap it in
+        _write_replacing(file_path, presentation.save)
+    else:
+        presentation.save(file_path)
     return file_path
 
 
+class SaveJobManager:
+    """
+    Save presentations on background threads.
+    
+    submit() takes a snapshot of the presentation in the calling thread (its XML
+    is serialized, binary parts are shared rather than copied), so the deck can
+    be changed again as soon as it returns; compressing and writing the file
+    happen on a worker. Each file is written to a temporary file and swapped
+    in when complete, and saves to the same path finish in submission order.
+    Jobs belong to the owner (e.g. MCP session namespace) that submitted them
+    and are only visible to that owner.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, max_finished_jobs: Optional[int] = None):
+        """
+        Args:
+            max_workers: Saves written concurrently (env PPT_SAVE_WORKERS, default 2)
+            max_finished_jobs: Finished jobs kept for status polling (env PPT_SAVE_JOB_HISTORY, default 100)
+        """
+        if max_workers is None:
+            max_workers = int(os.environ.get('PPT_SAVE_WORKERS', '2'))
+        if max_finished_jobs is None:
+            max_finished_jobs = int(os.environ.get('PPT_SAVE_JOB_HISTORY', '100'))
+        self.max_workers = max(1, max_workers)
+        self.max_finished_jobs = max_finished_jobs
+        self._executor = None
+        self._jobs = OrderedDict()   # (owner, job ID) -> status dict, oldest first
+        self._path_tails = {}        # absolute path -> (job ID, future) of the last save to it
+        self._lock = threading.Lock()
+    
+    def submit(self, presentation: Presentation, file_path: str, owner: Hashable = None) -> str:
+        """
+        Snapshot a presentation and start writing it in the background.
+        
+        Must be called while the presentation isn't being modified (the tool
+        layer holds the presentation's lock).
+        
+        Args:
+            presentation: The Presentation object
+            file_path: Path where the file should be saved
+            owner: Who may query the job
+            
+        Returns:
+            Job ID for get_status
+        """
+        path = os.path.abspath(file_path)
+        if not os.path.isdir(os.path.dirname(path)):
+            raise FileNotFoundError(f"Directory not found: {os.path.dirname(path)}")
+        _saves_over_mapped_file(presentation, file_path)  # Rejects overwriting a read-only deck's file
+        members = snapshot_package(presentation.part.package)
+        job_id = uuid.uuid4().hex[:12]
+        job = {
+            "job_id": job_id,
+            "status": "pending",
+            "file_path": file_path,
+            "members_total": len(members),
+            "members_done": 0,
+            "bytes_written": 0,
+            "error": None
+        }
+        
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ppt-save")
+            previous = self._path_tails.get(path)
+            future = self._executor.submit(self._run, job, members, path, previous[1] if previous else None)
+            self._path_tails[path] = (job_id, future)
+            self._jobs[(owner, job_id)] = job
+            self._prune()
+        return job_id
+    
+    def _run(self, job: Dict, members, path: str, previous: Optional[Future]) -> None:
+        if previous is not None:
+            wait([previous])
+        job["status"] = "running"
+        start = time.perf_counter()
+        
+        def progress(members_done: int, bytes_written: int) -> None:
+            job["members_done"] = members_done
+            job["bytes_written"] = bytes_written
+        
+        try:
+            stats = _write_replacing(path, lambda temp_path: write_package_snapshot(members, temp_path, progress))
+            job.update(stats)
+            job["status"] = "completed"
+        except Exception as e:
+            job["error"] = str(e)
+            job["status"] = "failed"
+        finally:
+            job["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            with self._lock:
+                if self._path_tails.get(path, (None,))[0] == job["job_id"]:
+                    del self._path_tails[path]
+    
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond max_finished_jobs."""
+        finished = [job_key for job_key, job in self._jobs.items() if job["status"] in ("completed", "failed")]
+        for job_key in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_key]
+    
+    def get_status(self, job_id: str, owner: Hashable = None) -> Optional[Dict]:
+        """
+        Get the progress of a save job.
+        
+        Args:
+            job_id: Job ID returned by submit
+            owner: Owner the job was submitted by
+        
+        Returns:
+            Dictionary with status (pending/running/completed/failed), members_done,
+            members_total, bytes_written and error, or None for an unknown job
+            (or one submitted by another owner)
+        """
+        with self._lock:
+            job = self._jobs.get((owner, job_id))
+            return dict(job) if job is not None else None
+    
+    def get_stats(self) -> Dict:
+        """Get counts of save jobs by status."""
+        with self._lock:
+            counts = {"pending": 0, "running": 0, "completed": 0, "failed": 0}
+            for job in self._jobs.values():
+                counts[job["status"]] += 1
+            return {"max_workers": self.max_workers, **counts}
+
+
+save_jobs = SaveJobManager()
+
+
+PPTX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+
+def export_presentation_bytes(presentation: Presentation) -> bytes:
+    """
+    Serialize a presentation to .pptx bytes in memory, without touching the filesystem.
+    
+    Args:
+        presentation: The Presentation object
+        
+    Returns:
+        The .pptx file content
+    """
+    buffer = io.BytesIO()
+    presentation.save(buffer)
+    return buffer.getvalue()
+
+
+class PresentationExportCache:
+    """
+    Serialized presentations held in memory so clients can download them in chunks.
+    
+    Each export is kept for ttl seconds after its last access; beyond
+    max_memory_mb the least recently used exports are dropped first. Exports
+    are only visible to the owner (e.g. MCP session namespace) that added them.
+    """
+    
+    def __init__(self, ttl: Optional[float] = None, max_memory_mb: Optional[float] = None):
+        """
+        Args:
+            ttl: Seconds an export is kept after its last access (env PPT_EXPORT_TTL, default 600)
+            max_memory_mb: Memory budget in MB (env PPT_EXPORT_CACHE_MB, default 512)
+        """
+        if ttl is None:
+            ttl = float(os.environ.get('PPT_EXPORT_TTL', '600'))
+        if max_memory_mb is None:
+            max_memory_mb = float(os.environ.get('PPT_EXPORT_CACHE_MB', '512'))
+        self.ttl = ttl
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self._exports = OrderedDict()  # (owner, export ID) -> (export dict, last access), least recently used first
+        self._lock = threading.Lock()
+    
+    def add(self, data: bytes, chunk_size: int, owner: Hashable = None) -> str:
+        """
+        Store an export.
+        
+        Args:
+            data: The .pptx file content
+            chunk_size: Size of the chunks it is downloaded in
+            owner: Who may read the export
+            
+        Returns:
+            Export ID
+        """
+        export = {"data": data, "chunk_size": chunk_size, "sha256": hashlib.sha256(data).hexdigest()}
+        export_key = (owner, uuid.uuid4().hex[:12])
+        with self._lock:
+            self._exports[export_key] = (export, time.monotonic())
+            self._expire(keep=export_key)
+        return export_key[1]
+    
+    def get(self, export_id: str, owner: Hashable = None) -> Optional[Dict]:
+        """Get an export (data, chunk_size, sha256), refreshing its TTL; None if unknown, expired or another owner's."""
+        export_key = (owner, export_id)
+        with self._lock:
+            self._expire()
+            entry = self._exports.get(export_key)
+            if entry is None:
+                return None
+            self._exports[export_key] = (entry[0], time.monotonic())
+            self._exports.move_to_end(export_key)
+            return entry[0]
+    
+    def discard(self, export_id: str, owner: Hashable = None) -> None:
+        """Drop an export."""
+        with self._lock:
+            self._exports.pop((owner, export_id), None)
+    
+    def _expire(self, keep: Optional[tuple] = None) -> None:
+        now = time.monotonic()
+        for export_key, (_, last_access) in list(self._exports.items()):
+            if now - last_access > self.ttl:
+                del self._exports[export_key]
+        total = sum(len(export["data"]) for export, _ in self._exports.values())
+        for export_key in list(self._exports):
+            if total <= self.max_memory_bytes:
+                break
+            if export_key != keep:
+                total -= len(self._exports.pop(export_key)[0]["data"])
+    
+    def get_stats(self) -> Dict:
+        """Get the number and total size of held exports."""
+        with self._lock:
+            self._expire()
+            return {
+                "exports": len(self._exports),
+                "memory_mb": round(sum(len(export["data"]) for export, _ in self._exports.values()) / (1024 * 1024), 2),
+                "max_memory_mb": round(self.max_memory_bytes / (1024 * 1024), 2),
+                "ttl_seconds": self.ttl
+            }
+
+
+export_cache = PresentationExportCache()
+
+
 def get_template_info(template_path: str) -> Dict:
     """
     Get information about a template file.
@@ -214,4 +716,365 @@ def get_core_properties(presentation: Presentation) -> Dict:
         "created": core_props.created.isoformat() if core_props.created else None,
         "last_modified_by": core_props.last_modified_by,
         "modified": core_props.modified.isoformat() if core_props.modified else None
-    }
\ No newline at end of file
+    }
+
+
+# Rough in-memory cost of one parsed XML element (lxml node plus python-pptx bookkeeping)
+_XML_ELEMENT_BYTES = 300
+
+# Estimated size of each parsed XML part, keyed by its root element
+_xml_part_sizes = weakref.WeakKeyDictionary()
+_xml_part_sizes_lock = threading.Lock()
+
+
+def _estimate_xml_part(element) -> int:
+    with _xml_part_sizes_lock:
+        size = _xml_part_sizes.get(element)
+    if size is None:
+        size = (int(element.xpath('count(.//*)')) + 1) * _XML_ELEMENT_BYTES
+        with _xml_part_sizes_lock:
+            _xml_part_sizes[element] = size
+    return size
+
+
+def estimate_presentation_memory(presentation: Presentation) -> int:
+    """
+    Estimate the memory held by a loaded presentation.
+    
+    Binary parts (images, media, embedded workbooks) count with their blob size,
+    XML parts with a per-element estimate of the parsed tree. Each XML part is
+    measured once, when first seen, so repeated estimates cost one lookup per
+    part; later edits within a part aren't reflected. Parts of a lazily opened
+    presentation that haven't been loaded yet don't count.
+    
+    Args:
+        presentation: The Presentation object
+        
+    Returns:
+        Estimated size in bytes
+    """
+    total = 0
+    for part in presentation.part.package.iter_parts():
+        if not is_part_loaded(part):
+            continue
+        element = getattr(part, '_element', None)
+        if element is not None:
+            total += _estimate_xml_part(element)
+        else:
+            total += len(part.blob)
+    return total
+
+
+class PresentationStore(MutableMapping):
+    """
+    Dict-like store of loaded presentations with an LRU memory budget.
+    
+    When more than max_presentations decks are loaded, or their estimated memory
+    exceeds max_memory_mb, the least recently used decks are saved to a temporary
+    .pptx file and dropped from memory. Accessing an evicted deck transparently
+    reloads it, outside the store lock and once per deck however many threads
+    ask for it. Read-only decks are never saved; their file stays mapped while
+    they are evicted and they are reopened from that mapping, so replacing the
+    file meanwhile doesn't change them. A budget of 0 disables that limit.
+    
+    Decks that can't be saved (e.g. disk full) stay in memory; such failures
+    are logged and counted in get_stats().
+    """
+    
+    def __init__(self, max_presentations: Optional[int] = None, max_memory_mb: Optional[float] = None,
+                 lock_for: Optional[Callable[[Hashable], threading.RLock]] = None,
+                 in_use: Optional[Callable[[Hashable], bool]] = None):
+        """
+        Args:
+            max_presentations: Maximum decks kept in memory (env PPT_MAX_LOADED_PRESENTATIONS, default 20)
+            max_memory_mb: Memory budget in MB (env PPT_MAX_PRESENTATION_MEMORY_MB, default 1024)
+            lock_for: Optional callable returning the lock guarding a key; decks whose
+                lock is held by another thread are never evicted
+            in_use: Optional callable telling whether a tool call is using a key; such
+                decks are never evicted, even by the thread using them
+        """
+        if max_presentations is None:
+            max_presentations = int(os.environ.get('PPT_MAX_LOADED_PRESENTATIONS', '20'))
+        if max_memory_mb is None:
+            max_memory_mb = float(os.environ.get('PPT_MAX_PRESENTATION_MEMORY_MB', '1024'))
+        
+        self.max_presentations = max_presentations
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self._lock_for = lock_for
+        self._in_use = in_use
+        self._lock = threading.RLock()
+        self._loaded = OrderedDict()   # key -> Presentation, least recently used first
+        self._spilled = {}             # key -> path of the temporary .pptx, or held source of a lazily opened read-only deck
+        self._read_only = {}           # key -> source file of decks opened read-only (None if loaded in full)
+        self._sizes = {}               # key -> estimated memory in bytes
+        self._stale_sizes = set()      # keys accessed since their size was estimated
+        self._slide_counts = {}        # key -> slide count recorded at eviction
+        self._loading = {}             # key -> event set once a reload of the spilled deck finishes
+        self._spill_dir = None
+        self._evictions = 0
+        self._failed_evictions = 0
+        self._last_eviction_error = None
+        self._reloads = 0
+    
+    # ---- Mapping interface ----
+    
+    def __getitem__(self, key):
+        while True:
+            with self._lock:
+                if key in self._loaded:
+                    self._loaded.move_to_end(key)
+                    self._stale_sizes.add(key)
+                    return self._loaded[key]
+                if key not in self._spilled:
+                    raise KeyError(key)
+                loading = self._loading.get(key)
+                if loading is None:
+                    spilled = self._spilled[key]
+                    loading = self._loading[key] = threading.Event()
+                    read_only = key in self._read_only
+                    break
+            # Another thread is reloading this deck
+            loading.wait()
+        
+        # Reload outside the store lock, so lookups of other decks don't wait on the disk
+        try:
+            presentation = self._reload(spilled, read_only)
+            size = estimate_presentation_memory(presentation)
+        except BaseException:
+            with self._lock:
+                del self._loading[key]
+                discarded = self._spilled.get(key) is not spilled
+            loading.set()
+            if discarded:
+                self._release_spilled(spilled)
+            raise
+        
+        with self._lock:
+            del self._loading[key]
+            current = self._spilled.get(key) is spilled
+            if current:
+                del self._spilled[key]
+                self._slide_counts.pop(key, None)
+                self._loaded[key] = presentation
+                self._sizes[key] = size
+                self._reloads += 1
+        loading.set()
+        self._release_spilled(spilled)
+        
+        if not current:
+            # Replaced or removed while reloading
+            close_presentation_package(presentation)
+            return self[key]
+        self._enforce_budget(keep=key)
+        return presentation
+    
+    def __setitem__(self, key, presentation) -> None:
+        with self._lock:
+            replaced = self._loaded.get(key)
+            if key in self._spilled:
+                self._discard_spill(key)
+                self._slide_counts.pop(key, None)
+            if is_read_only_presentation(presentation):
+                self._read_only[key] = get_presentation_source_path(presentation)
+            else:
+                self._read_only.pop(key, None)
+            self._loaded[key] = presentation
+            self._loaded.move_to_end(key)
+            self._sizes[key] = estimate_presentation_memory(presentation)
+            self._stale_sizes.discard(key)
+        
+        if replaced is not None and replaced is not presentation:
+            close_presentation_package(replaced)
+        self._enforce_budget(keep=key)
+    
+    def __delitem__(self, key) -> None:
+        presentation = None
+        with self._lock:
+            if key in self._loaded:
+                presentation = self._loaded.pop(key)
+            elif key in self._spilled:
+                self._discard_spill(key)
+            else:
+                raise KeyError(key)
+            self._read_only.pop(key, None)
+            self._sizes.pop(key, None)
+            self._stale_sizes.discard(key)
+            self._slide_counts.pop(key, None)
+        
+        if presentation is not None:
+            # Release the file a lazily opened deck still maps
+            close_presentation_package(presentation)
+    
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._loaded or key in self._spilled
+    
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._loaded) + list(self._spilled))
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._loaded) + len(self._spilled)
+    
+    # ---- Store-specific operations ----
+    
+    def is_loaded(self, key) -> bool:
+        """Check whether a presentation is currently held in memory."""
+        with self._lock:
+            return key in self._loaded
+    
+    def is_read_only(self, key) -> bool:
+        """Check whether a presentation was opened read-only, without reloading it."""
+        with self._lock:
+            return key in self._read_only
+    
+    def get_slide_count(self, key) -> int:
+        """Get a presentation's slide count without reloading an evicted deck."""
+        with self._lock:
+            if key in self._loaded:
+                return len(self._loaded[key].slides)
+            if key in self._spilled:
+                return self._slide_counts.get(key, 0)
+            raise KeyError(key)
+    
+    def get_stats(self) -> Dict:
+        """Get memory and eviction statistics."""
+        with self._lock:
+            self._refresh_sizes()
+            return {
+                "loaded_in_memory": len(self._loaded),
+                "spilled_to_disk": len(self._spilled),
+                "read_only": len(self._read_only),
+                "estimated_memory_mb": round(sum(self._sizes.values()) / (1024 * 1024), 2),
+                "max_presentations": self.max_presentations,
+                "max_memory_mb": round(self.max_memory_bytes / (1024 * 1024), 2),
+                "evictions": self._evictions,
+                "failed_evictions": self._failed_evictions,
+                "last_eviction_error": self._last_eviction_error,
+                "reloads": self._reloads
+            }
+    
+    # ---- Eviction ----
+    
+    def _refresh_sizes(self) -> None:
+        """Re-estimate the memory of decks that may have changed since last estimated."""
+        for key in list(self._stale_sizes):
+            if key in self._loaded:
+                self._sizes[key] = estimate_presentation_memory(self._loaded[key])
+        self._stale_sizes.clear()
+    
+    def _over_budget(self) -> bool:
+        if self.max_presentations and len(self._loaded) > self.max_presentations:
+            return True
+        if self.max_memory_bytes and sum(self._sizes.values()) > self.max_memory_bytes:
+            return True
+        return False
+    
+    def _enforce_budget(self, keep=None) -> None:
+        """Evict least recently used decks until the store is within budget."""
+        skipped = set()
+        while True:
+            with self._lock:
+                if self._over_budget():
+                    self._refresh_sizes()
+                if not self._over_budget():
+                    return
+                candidates = [k for k in self._loaded if k != keep and k not in skipped]
+                if not candidates:
+                    return
+                key = candidates[0]
+            
+            if not self._spill(key):
+                skipped.add(key)
+    
+    def _spill(self, key) -> bool:
+        """Save one deck to the spill directory and drop it from memory."""
+        lock = self._lock_for(key) if self._lock_for else None
+        if lock is not None and not lock.acquire(blocking=False):
+            return False  # In use by another tool call
+        
+        try:
+            if self._in_use is not None and self._in_use(key):
+                return False  # In use by the current thread (re-entrant lock), e.g. a batch opening decks
+            
+            with self._lock:
+                presentation = self._loaded.get(key)
+                if presentation is None:
+                    return False
+                read_only = key in self._read_only
+            
+            # The deck's lock is held, so nothing can modify it while it is written out
+            spilled = hold_presentation_source(presentation) if read_only else None
+            if spilled is None:
+                spilled = os.path.join(self._get_spill_dir(), f"{uuid.uuid4().hex}.pptx")
+                try:
+                    presentation.save(spilled)
+                except OSError as e:
+                    self._remove_spill_file(spilled)
+                    logger.warning("Could not spill presentation %r to disk: %s", key, e)
+                    with self._lock:
+                        self._failed_evictions += 1
+                        self._last_eviction_error = str(e)
+                    return False
+                except Exception:
+                    self._remove_spill_file(spilled)
+                    raise
+
+            with self._lock:
+                if self._loaded.get(key) is not presentation:
+                    # Replaced or removed while saving
+                    self._release_spilled(spilled)
+                    return False
+                self._slide_counts[key] = len(presentation.slides)
+                del self._loaded[key]
+                self._sizes.pop(key, None)
+                self._stale_sizes.discard(key)
+                self._spilled[key] = spilled
+                self._evictions += 1
+            close_presentation_package(presentation)
+            return True
+        finally:
+            if lock is not None:
+                lock.release()
+    
+    def _get_spill_dir(self) -> str:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="ppt_mcp_spill_")
+            atexit.register(shutil.rmtree, self._spill_dir, True)
+        return self._spill_dir
+    
+    def _discard_spill(self, key) -> None:
+        """Forget a spilled deck, deleting its temporary file (never a read-only deck's own file)."""
+        spilled = self._spilled.pop(key)
+        if key not in self._loading:  # Otherwise the reload in progress releases it
+            self._release_spilled(spilled)
+    
+    @staticmethod
+    def _reload(spilled, read_only: bool) -> Presentation:
+        """Open a spilled deck from its temporary file or held source."""
+        if isinstance(spilled, str):
+            # Loaded in full, never memory-mapped, so the spill file can go right away
+            presentation = Presentation(spilled)
+            if read_only:
+                presentation.part.package.read_only = True
+            return presentation
+        try:
+            return reopen_held_presentation(spilled)
+        except IOError as e:
+            raise IOError(
+                f"Can't reload read-only presentation: its file {e}. Close it and open the file again"
+            ) from e
+    
+    def _release_spilled(self, spilled) -> None:
+        if isinstance(spilled, str):
+            self._remove_spill_file(spilled)
+        else:
+            release_presentation_source(spilled)
+    
+    @staticmethod
+    def _remove_spill_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -6,7 +6,10 @@ Combines features from both basic and enhanced template systems.
 import json
 import os
 import re
-from typing import Dict, List, Optional, Any, Tuple
+import sys
+import threading
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Any, Tuple
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
@@ -14,6 +17,193 @@ from pptx.enum.text import PP_ALIGN, MSO_VERTICAL_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 import utils.content_utils as content_utils
 import utils.design_utils as design_utils
+from utils.font_metrics_utils import get_font_metrics_provider
+
+
+# Default slide layout template file, at the repository root
+DEFAULT_TEMPLATE_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'slide_layout_templates.json'
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def thaw_template_data(value: Any) -> Any:
+    """
+    Convert (part of) the read-only template data back to plain dicts and lists.
+    
+    Use this before returning template data to a client or handing it to code
+    that needs to modify it.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw_template_data(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_template_data(item) for item in value]
+    return value
+
+
+class TemplateRegistry:
+    """
+    Shared, read-only slide layout template data loaded from a JSON file.
+    
+    The file is parsed once and re-parsed only when its mtime or size changes.
+    Without a watcher, every access checks the file with a single stat call;
+    with the hot-reload watcher running, a background thread polls the file
+    instead and accesses don't touch the filesystem at all.
+    """
+    
+    def __init__(self, template_file_path: str = None):
+        self.template_file_path = os.path.abspath(template_file_path or DEFAULT_TEMPLATE_FILE)
+        self.version = 0
+        self._data = None
+        self._signature = None
+        self._lock = threading.Lock()
+        self._watcher = None
+        self._stop_watching = threading.Event()
+    
+    def get(self) -> Mapping:
+        """
+        Get the current template data.
+        
+        Returns:
+            Read-only mapping (nested mappings and tuples) of the template file
+        """
+        if self._data is not None and self._watcher is not None:
+            return self._data
+        
+        signature = self._stat()
+        if self._data is not None and signature == self._signature:
+            return self._data
+        
+        with self._lock:
+            if self._data is None or signature != self._signature:
+                self._load(signature)
+            return self._data
+    
+    def reload(self) -> Mapping:
+        """Re-read the template file unconditionally."""
+        with self._lock:
+            self._load(self._stat())
+            return self._data
+    
+    def start_watcher(self, interval: float = 2.0) -> None:
+        """
+        Start a background thread that reloads the templates when the file changes.
+        
+        Args:
+            interval: Seconds between file checks
+        """
+        if self._watcher is not None:
+            return
+        self.get()
+        self._stop_watching.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name="template-registry-watcher", daemon=True
+        )
+        self._watcher.start()
+    
+    def stop_watcher(self) -> None:
+        """Stop the background watcher (accesses go back to checking the file)."""
+        watcher = self._watcher
+        if watcher is not None:
+            self._stop_watching.set()
+            watcher.join()
+            self._watcher = None
+    
+    def _watch(self, interval: float) -> None:
+        failed_signature = object()
+        while not self._stop_watching.wait(interval):
+            signature = None
+            try:
+                signature = self._stat()
+                if signature in (self._signature, failed_signature):
+                    continue
+                with self._lock:
+                    self._load(signature)
+            except (FileNotFoundError, ValueError) as e:
+                # Keep serving the last good templates until the file is fixed
+                if signature != failed_signature:
+                    failed_signature = signature
+                    print(f"Warning: Failed to reload slide templates: {str(e)}", file=sys.stderr)
+    
+    def _stat(self) -> Tuple[int, int]:
+        try:
+            stat = os.stat(self.template_file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template file not found: {self.template_file_path}")
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _load(self, signature: Tuple[int, int]) -> None:
+        try:
+            with open(self.template_file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template file not found: {self.template_file_path}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in template file: {str(e)}")
+        
+        self._data = _freeze(data)
+        self._signature = signature
+        self.version += 1
+
+
+_template_registries = {}
+_template_registries_lock = threading.Lock()
+
+
+def get_template_registry(template_file_path: str = None) -> TemplateRegistry:
+    """
+    Get the shared registry for a template file.
+    
+    Args:
+        template_file_path: Path to template JSON file (defaults to slide_layout_templates.json)
+        
+    Returns:
+        The TemplateRegistry shared by all callers using that file
+    """
+    path = os.path.abspath(template_file_path or DEFAULT_TEMPLATE_FILE)
+    with _template_registries_lock:
+        registry = _template_registries.get(path)
+        if registry is None:
+            registry = _template_registries[path] = TemplateRegistry(path)
+        return registry
+
+
+# Characters the text size heuristic measures as narrow or wide; all others count as normal
+NARROW_CHARACTERS = 'iltj'
+WIDE_CHARACTERS = 'mwMW'
+
+# Maps each ASCII byte to its width class: n(arrow), w(ide), s(pace) or . (normal)
+_CHARACTER_CLASSES = bytes(
+    ord('n') if chr(code) in NARROW_CHARACTERS else
+    ord('w') if chr(code) in WIDE_CHARACTERS else
+    ord('s') if code == ord(' ') else
+    ord('.')
+    for code in range(256)
+)
+
+_COUNT_MASK = (1 << 32) - 1
+
+
+class _WordWidthCache(dict):
+    """Text -> width map that measures each distinct text once; call it like the measure function."""
+    
+    def __init__(self, measure: Callable[[str], int]):
+        super().__init__()
+        self._measure = measure
+    
+    def __missing__(self, text: str) -> int:
+        width = self[text] = self._measure(text)
+        return width
+    
+    __call__ = dict.__getitem__
 
 
 class TextSizeCalculator:
@@ -26,73 +216,262 @@ class TextSizeCalculator:
             'wide': 1.3,    # m, w
             'space': 0.5    # space character
         }
+        # Measure with real font metrics when the font is installed (env PPT_USE_FONT_METRICS=0 disables)
+        self.use_font_metrics = os.environ.get('PPT_USE_FONT_METRICS', '1').lower() not in ('0', 'false', 'no')
+    
+    def measure_text_units(self, text: str, font_name: str = None, bold: bool = False, italic: bool = False) -> float:
+        """
+        Measure text width in character units, independent of font size.
+        
+        When font_name is given and the font is installed, the text is measured
+        with the font's advance widths; otherwise with the character-class
+        heuristic, classifying the string in one C-level pass (non-ASCII
+        characters are all normal width) and counting each class.
+        
+        Args:
+            text: Text to measure
+            font_name: Optional font the text is set in
+            bold: Whether the text is bold
+            italic: Whether the text is italic
+            
+        Returns:
+            Width in character units (estimated points = units * font_size * 0.6)
+        """
+        if font_name and self.use_font_metrics:
+            metrics = get_font_metrics_provider().get_metrics(font_name, bold, italic)
+            if metrics is not None:
+                return metrics.measure(text) / 0.6
+        
+        classes = text.encode('ascii', 'ignore').translate(_CHARACTER_CLASSES)
+        return self._character_class_units(
+            len(text), classes.count(b'n'), classes.count(b'w'), classes.count(b's')
+        )
     
-    def estimate_text_width(self, text: str, font_size: int) -> float:
-        """Estimate text width in points based on character analysis."""
+    def _character_class_units(self, length: int, narrow: int, wide: int, spaces: int) -> float:
+        """Width in character units of text with the given number of characters in each class."""
+        widths = self.character_widths
+        normal = widths['normal']
+        return (length * normal
+                + narrow * (widths['narrow'] - normal)
+                + wide * (widths['wide'] - normal)
+                + spaces * (widths['space'] - normal))
+    
+    def estimate_text_width(self, text: str, font_size: int, font_name: str = None,
+                            bold: bool = False, italic: bool = False) -> float:
+        """Estimate text width in points based on font metrics or character analysis."""
         if not text:
             return 0
         
-        width = 0
-        for char in text:
-            if char in 'iltj':
-                width += self.character_widths['narrow']
-            elif char in 'mwMW':
-                width += self.character_widths['wide']
-            elif char == ' ':
-                width += self.character_widths['space']
-            else:
-                width += self.character_widths['normal']
-        
-        return width * font_size * 0.6  # Approximation factor
+        return self.measure_text_units(text, font_name, bold, italic) * font_size * 0.6  # Approximation factor
     
     def estimate_text_height(self, text: str, font_size: int, line_spacing: float = 1.2) -> float:
         """Estimate text height based on line count and spacing."""
-        lines = len(text.split('\n'))
+        lines = text.count('\n') + 1
         return lines * font_size * line_spacing * 1.3  # Convert to points
     
     def calculate_optimal_font_size(self, text: str, container_width: float, 
                                   container_height: float, font_type: str = 'body',
-                                  min_size: int = 8, max_size: int = 36) -> int:
+                                  min_size: int = 8, max_size: int = 36, font_name: str = None,
+                                  bold: bool = False, italic: bool = False) -> int:
         """Calculate optimal font size to fit text in container."""
         container_width_pts = container_width * 72  # Convert inches to points
         container_height_pts = container_height * 72
-        
-        # Start with a reasonable size and adjust
-        for font_size in range(max_size, min_size - 1, -1):
-            estimated_width = self.estimate_text_width(text, font_size)
-            estimated_height = self.estimate_text_height(text, font_size)
-            
-            if estimated_width <= container_width_pts * 0.9 and estimated_height <= container_height_pts * 0.9:
-                return font_size
-        
-        return min_size
+        max_width = container_width_pts * 0.9
+        max_height = container_height_pts * 0.9
+        
+        if max_size < min_size:
+            return min_size
+        
+        # Width and height both grow linearly with the font size, so measure the
+        # text once and solve for the largest size that fits
+        text_units = self.measure_text_units(text, font_name, bold, italic) if text else 0
+        lines = text.count('\n') + 1
+        
+        limit = max_height / (lines * 1.2 * 1.3)
+        if text_units:
+            limit = min(limit, max_width / (text_units * 0.6))
+        if not limit >= min_size:
+            return min_size
+        font_size = max_size if limit >= max_size else int(limit)
+        
+        # Correct for floating-point rounding against the exact fit test
+        while font_size >= min_size and not (
+            text_units * font_size * 0.6 <= max_width and lines * font_size * 1.2 * 1.3 <= max_height
+        ):
+            font_size -= 1
+        while font_size < max_size and (
+            text_units * (font_size + 1) * 0.6 <= max_width and lines * (font_size + 1) * 1.2 * 1.3 <= max_height
+        ):
+            font_size += 1
+        
+        return max(font_size, min_size)
     
-    def wrap_text_intelligently(self, text: str, max_width: float, font_size: int) -> str:
-        """Intelligently wrap text to fit within specified width."""
+    def wrap_text_intelligently(self, text: str, max_width: float, font_size: int, font_name: str = None,
+                                bold: bool = False, italic: bool = False, break_long_words: bool = False,
+                                hyphenate: bool = False, preserve_line_breaks: bool = False) -> str:
+        """
+        Intelligently wrap text to fit within specified width.
+        
+        Each distinct word is measured once and line widths are kept as running
+        totals, so wrapping is linear in the length of the text.
+        
+        Args:
+            text: Text to wrap
+            max_width: Maximum line width in inches
+            font_size: Font size in points
+            font_name: Optional font the text is set in
+            bold: Whether the text is bold
+            italic: Whether the text is italic
+            break_long_words: Split words wider than a line across lines
+                (otherwise they are put on a line of their own)
+            hyphenate: End each part of a split word with a hyphen
+            preserve_line_breaks: Wrap each existing line separately instead of
+                reflowing the whole text
+            
+        Returns:
+            Text with line breaks inserted
+        """
         if not text:
             return text
         
-        max_width_pts = max_width * 72
-        words = text.split()
+        measure, to_units = self._get_additive_measurer(font_name, bold, italic)
+        return self._wrap_text(text, max_width * 72, font_size, measure, to_units,
+                               break_long_words, hyphenate, preserve_line_breaks)
+    
+    def wrap_texts(self, requests: List[Dict]) -> List[str]:
+        """
+        Wrap many texts in one call.
+        
+        Word widths are shared between all texts set in the same font, so words
+        that repeat across text frames are measured only once.
+        
+        Args:
+            requests: List of dicts with the wrap_text_intelligently arguments
+                ('text', 'max_width' and 'font_size' required; 'font_name', 'bold',
+                'italic', 'break_long_words', 'hyphenate' and 'preserve_line_breaks' optional)
+            
+        Returns:
+            List of wrapped texts, in request order
+        """
+        measurers = {}
+        results = []
+        for request in requests:
+            text = request['text']
+            if not text:
+                results.append(text)
+                continue
+            
+            font_key = (request.get('font_name'), bool(request.get('bold', False)), bool(request.get('italic', False)))
+            if font_key not in measurers:
+                measurers[font_key] = self._get_additive_measurer(*font_key)
+            measure, to_units = measurers[font_key]
+            
+            results.append(self._wrap_text(
+                text, request['max_width'] * 72, request['font_size'], measure, to_units,
+                request.get('break_long_words', False), request.get('hyphenate', False),
+                request.get('preserve_line_breaks', False)
+            ))
+        return results
+    
+    def _get_additive_measurer(self, font_name: str = None, bold: bool = False,
+                               italic: bool = False) -> Tuple[Callable[[str], int], Callable[[int], float]]:
+        """
+        Get a (measure, to_units) pair for measuring text piece by piece.
+        
+        measure(text) returns an integer width that can be summed across pieces
+        (and is cached per word); to_units(total) turns the sum into exactly the
+        value measure_text_units returns for the joined text, so running line
+        widths make the same wrapping decisions as re-measuring each line.
+        """
+        if font_name and self.use_font_metrics:
+            metrics = get_font_metrics_provider().get_metrics(font_name, bold, italic)
+            if metrics is not None:
+                advance_width = metrics.advance_widths.__getitem__
+                units_per_em = metrics.units_per_em
+                
+                def measure_advances(text: str) -> int:
+                    return sum(map(advance_width, text))
+                
+                def advances_to_units(total: int) -> float:
+                    return total / units_per_em / 0.6
+                
+                return _WordWidthCache(measure_advances), advances_to_units
+        
+        # Character-class counts packed into one integer (32 bits per count), so
+        # that widths of pieces add up like the counts of the joined text
+        def measure_classes(text: str) -> int:
+            classes = text.encode('ascii', 'ignore').translate(_CHARACTER_CLASSES)
+            return (len(text)
+                    | classes.count(b'n') << 32
+                    | classes.count(b'w') << 64
+                    | classes.count(b's') << 96)
+        
+        widths = self.character_widths
+        normal = widths['normal']
+        narrow, wide, space = widths['narrow'] - normal, widths['wide'] - normal, widths['space'] - normal
+        
+        def classes_to_units(total: int) -> float:
+            # Same expression as _character_class_units
+            return ((total & _COUNT_MASK) * normal
+                    + (total >> 32 & _COUNT_MASK) * narrow
+                    + (total >> 64 & _COUNT_MASK) * wide
+                    + (total >> 96) * space)
+        
+        return _WordWidthCache(measure_classes), classes_to_units
+    
+    def _wrap_text(self, text: str, max_width_pts: float, font_size: int, measure: Callable[[str], int],
+                   to_units: Callable[[int], float], break_long_words: bool, hyphenate: bool,
+                   preserve_line_breaks: bool) -> str:
+        """Wrap text with an additive measurer (see wrap_text_intelligently)."""
+        def fits(total: int) -> bool:
+            return to_units(total) * font_size * 0.6 <= max_width_pts
+        
+        space = measure(' ')
+        hyphen = measure('-') if hyphenate else 0
+        paragraphs = text.split('\n') if preserve_line_breaks else [text]
         wrapped_lines = []
-        current_line = []
         
-        for word in words:
-            test_line = current_line + [word]
-            test_text = ' '.join(test_line)
+        for paragraph in paragraphs:
+            paragraph_start = len(wrapped_lines)
+            current_line = []
+            current_width = 0
             
-            if self.estimate_text_width(test_text, font_size) <= max_width_pts:
-                current_line.append(word)
-            else:
+            for word in paragraph.split():
+                word_width = measure(word)
+                
                 if current_line:
+                    if fits(current_width + space + word_width):
+                        current_line.append(word)
+                        current_width += space + word_width
+                        continue
                     wrapped_lines.append(' '.join(current_line))
+                    current_line = []
+                
+                if fits(word_width):
                     current_line = [word]
+                    current_width = word_width
+                elif break_long_words and len(word) > 1:
+                    # Fill lines character by character, keeping the last part open
+                    part_start = 0
+                    part_width = 0
+                    for index, char in enumerate(word):
+                        char_width = measure(char)
+                        reserved = hyphen if index < len(word) - 1 else 0
+                        if index > part_start and not fits(part_width + char_width + reserved):
+                            wrapped_lines.append(word[part_start:index] + ('-' if hyphenate else ''))
+                            part_start = index
+                            part_width = 0
+                        part_width += char_width
+                    current_line = [word[part_start:]]
+                    current_width = part_width
                 else:
                     # Single word is too long, force wrap
                     wrapped_lines.append(word)
-        
-        if current_line:
-            wrapped_lines.append(' '.join(current_line))
+            
+            if current_line:
+                wrapped_lines.append(' '.join(current_line))
+            elif preserve_line_breaks and len(wrapped_lines) == paragraph_start:
+                wrapped_lines.append('')  # Keep blank lines
         
         return '\n'.join(wrapped_lines)
 
@@ -184,29 +563,38 @@ class VisualEffectsManager:
 class EnhancedTemplateManager:
     """Enhanced template manager with dynamic features."""
     
+    # Maximum number of compiled (template, color scheme) plans kept
+    MAX_TEMPLATE_PLANS = 256
+    
     def __init__(self, template_file_path: str = None):
         self.text_calculator = TextSizeCalculator()
+        self._effects_manager = None
+        self._template_plans = {}
         self.load_templates(template_file_path)
-        self.effects_manager = VisualEffectsManager(self.templates_data)
     
     def load_templates(self, template_file_path: str = None) -> None:
-        """Load unified templates with all dynamic features."""
-        if template_file_path is None:
-            current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            # Use the unified template file
-            template_file_path = os.path.join(current_dir, 'slide_layout_templates.json')
-        
-        try:
-            with open(template_file_path, 'r', encoding='utf-8') as f:
-                self.templates_data = json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Template file not found: {template_file_path}")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in template file: {str(e)}")
+        """Attach to the shared registry of the unified template file."""
+        self.template_registry = get_template_registry(template_file_path)
+        # Fail early if the template file is missing or invalid
+        self.template_registry.get()
+    
+    @property
+    def templates_data(self) -> Mapping:
+        """Current (read-only) template data from the shared registry."""
+        return self.template_registry.get()
+    
+    @property
+    def effects_manager(self) -> 'VisualEffectsManager':
+        """Visual effects manager for the current template data."""
+        templates_data = self.templates_data
+        if self._effects_manager is None or self._effects_manager.templates_data is not templates_data:
+            self._effects_manager = VisualEffectsManager(templates_data)
+        return self._effects_manager
 
 
-    def get_dynamic_font_size(self, element: Dict, content: str = None) -> int:
-        """Calculate dynamic font size based on content and container."""
+    def get_dynamic_font_size(self, element: Dict, content: str = None, font_name: str = None,
+                              bold: bool = False, italic: bool = False) -> int:
+        """Calculate dynamic font size based on content and container, measured in the given font if installed."""
         content = content or element.get('placeholder_text', '')
         if not content:
             return 14  # Default size
@@ -232,82 +620,48 @@ class EnhancedTemplateManager:
         font_size_setting = element.get('styling', {}).get('font_size')
         if font_size_setting == 'dynamic':
             return self.text_calculator.calculate_optimal_font_size(
-                content, container_width, container_height, font_type, min_size, max_size
+                content, container_width, container_height, font_type, min_size, max_size,
+                font_name, bold, italic
             )
         
         return default_size
     
+    def get_template_plan(self, template_id: str, color_scheme: str = 'modern_blue') -> Optional['CompiledTemplatePlan']:
+        """
+        Get the compiled plan for a template and color scheme, compiling it on first use.
+        
+        Plans are cached per template file version, so edits to the template file
+        are picked up on the next call.
+        
+        Returns:
+            The compiled plan, or None if the template doesn't exist
+        """
+        version = self.template_registry.version
+        templates_data = self.templates_data
+        key = (template_id, color_scheme, version)
+        
+        plan = self._template_plans.get(key)
+        if plan is None:
+            if template_id not in templates_data.get('templates', {}):
+                return None
+            plan = CompiledTemplatePlan(self, template_id, templates_data, color_scheme)
+            if len(self._template_plans) >= self.MAX_TEMPLATE_PLANS or any(
+                cached_key[2] != version for cached_key in self._template_plans
+            ):
+                self._template_plans = {}
+            self._template_plans[key] = plan
+        return plan
+    
     def apply_enhanced_slide_template(self, slide, template_id: str, color_scheme: str = 'modern_blue',
                                     content_mapping: Dict = None, image_paths: Dict = None) -> Dict:
         """Apply enhanced slide template with all dynamic features."""
         try:
-            if template_id not in self.templates_data.get('templates', {}):
+            plan = self.get_template_plan(template_id, color_scheme)
+            if plan is None:
                 # Fall back to regular template application
                 return apply_slide_template_basic(slide, template_id, color_scheme, content_mapping, image_paths)
             
-            template = self.templates_data['templates'][template_id]
-            elements_created = []
-            
-            # Apply enhanced background if specified
-            background_config = template.get('background')
-            if background_config:
-                apply_slide_background(slide, background_config, self.templates_data, color_scheme)
-            
-            # Create enhanced elements
-            for element in template.get('elements', []):
-                element_type = element.get('type')
-                element_role = element.get('role', '')
-                
-                try:
-                    # Override content if provided
-                    custom_content = None
-                    if content_mapping and element_role in content_mapping:
-                        custom_content = content_mapping[element_role]
-                    
-                    created_element = None
-                    
-                    if element_type == 'text':
-                        created_element = self.create_enhanced_text_element(
-                            slide, element, self.templates_data, color_scheme, custom_content
-                        )
-                    elif element_type == 'shape':
-                        created_element = create_shape_element(slide, element, self.templates_data, color_scheme)
-                    elif element_type == 'image':
-                        image_path = image_paths.get(element_role) if image_paths else None
-                        created_element = create_image_element(slide, element, image_path)
-                    elif element_type == 'table':
-                        created_element = create_table_element(slide, element, self.templates_data, color_scheme)
-                    elif element_type == 'chart':
-                        created_element = create_chart_element(slide, element, self.templates_data, color_scheme)
-                    
-                    if created_element:
-                        elements_created.append({
-                            'type': element_type,
-                            'role': element_role,
-                            'index': len(slide.shapes) - 1,
-                            'enhanced_features': self.get_element_features(element)
-                        })
-                
-                except Exception as e:
-                    elements_created.append({
-                        'type': element_type,
-                        'role': element_role,
-                        'error': str(e)
-                    })
-            
-            return {
-                'success': True,
-                'template_id': template_id,
-                'template_name': template.get('name', template_id),
-                'color_scheme': color_scheme,
-                'elements_created': elements_created,
-                'enhanced_features_applied': [
-                    'Dynamic text sizing',
-                    'Automatic text wrapping',
-                    'Visual effects',
-                    'Intelligent content adaptation'
-                ]
-            }
+            return plan.apply(slide, content_mapping, image_paths)
         
         except Exception as e:
             return {
@@ -323,12 +677,19 @@ class EnhancedTemplateManager:
         # Determine content
         content = custom_content or element.get('placeholder_text', '')
         
-        # Apply auto-wrapping if enabled
+        # Measure in the font the text is rendered with
         styling = element.get('styling', {})
-        if styling.get('auto_wrap', False):
+        font_name, bold, italic = _resolve_text_font(styling, templates_data)
+        
+        # Apply auto-wrapping if enabled
+        wrapping = get_line_wrapping_options(templates_data)
+        if styling.get('auto_wrap', False) and wrapping['enabled']:
             container_width = pos.get('width', 4.0)
-            font_size = self.get_dynamic_font_size(element, content)
-            content = self.text_calculator.wrap_text_intelligently(content, container_width, font_size)
+            font_size = self.get_dynamic_font_size(element, content, font_name, bold, italic)
+            content = self.text_calculator.wrap_text_intelligently(
+                content, container_width, font_size, font_name, bold, italic,
+                break_long_words=wrapping['break_long_words'], hyphenate=wrapping['hyphenate']
+            )
         
         # Create text box
         textbox = slide.shapes.add_textbox(
@@ -342,7 +703,7 @@ class EnhancedTemplateManager:
         textbox.text_frame.word_wrap = True
         
         # Apply dynamic font sizing
-        font_size = self.get_dynamic_font_size(element, content)
+        font_size = self.get_dynamic_font_size(element, content, font_name, bold, italic)
         
         # Apply enhanced styling
         self.apply_enhanced_text_styling(textbox.text_frame, element, templates_data, color_scheme, font_size)
@@ -455,9 +816,331 @@ class EnhancedTemplateManager:
         return features
 
 
+_ALIGNMENT_MAP = {
+    'left': PP_ALIGN.LEFT,
+    'center': PP_ALIGN.CENTER,
+    'right': PP_ALIGN.RIGHT,
+    'justify': PP_ALIGN.JUSTIFY
+}
+
+_VERTICAL_ALIGNMENT_MAP = {
+    'top': MSO_VERTICAL_ANCHOR.TOP,
+    'middle': MSO_VERTICAL_ANCHOR.MIDDLE,
+    'bottom': MSO_VERTICAL_ANCHOR.BOTTOM
+}
+
+
+def _resolve_text_font(styling: Mapping, templates_data: Mapping) -> Tuple[str, bool, bool]:
+    """Get the font name, bold and italic a template text element ends up with (see apply_enhanced_text_styling)."""
+    typography_style = templates_data.get('typography_styles', {}).get('modern_sans', {})
+    font_config = typography_style.get(styling.get('font_type', 'body'), {'name': 'Segoe UI', 'weight': 'normal'})
+    weight = font_config.get('weight', 'normal')
+    bold = styling.get('bold', weight in ['bold', 'semibold'])
+    italic = styling.get('italic', font_config.get('style') == 'italic')
+    
+    # Of the text effects only the shadow changes the font (it makes the text bold)
+    text_effects = templates_data.get('text_effects', {})
+    if any(text_effects.get(name, {}).get('type') == 'shadow' for name in styling.get('text_effects', [])):
+        bold = True
+    return font_config['name'], bold, italic
+
+
+class CompiledTextElement:
+    """
+    Text element with its position, font, color and alignment resolved up front.
+    
+    Mirrors EnhancedTemplateManager.create_enhanced_text_element; only the
+    content-dependent parts (wrapping, dynamic font size and line spacing)
+    are computed when the element is built.
+    """
+    
+    def __init__(self, manager: 'EnhancedTemplateManager', element: Mapping, templates_data: Mapping, color_scheme: str):
+        self.text_calculator = manager.text_calculator
+        self.placeholder_text = element.get('placeholder_text', '')
+        
+        pos = element['position']
+        self.emu_position = (Inches(pos['left']), Inches(pos['top']), Inches(pos['width']), Inches(pos['height']))
+        self.container_width = pos.get('width', 4.0)
+        self.container_height = pos.get('height', 1.0)
+        
+        styling = element.get('styling', {})
+        wrapping = get_line_wrapping_options(templates_data)
+        self.auto_wrap = styling.get('auto_wrap', False) and wrapping['enabled']
+        self.break_long_words = wrapping['break_long_words']
+        self.hyphenate = wrapping['hyphenate']
+        self.auto_fit = styling.get('auto_fit', False)
+        
+        # Font size constraints (see get_dynamic_font_size)
+        self.font_type = styling.get('font_type', 'body')
+        base_sizes = templates_data.get('auto_sizing_rules', {}).get('text_measurement', {}).get('base_font_sizes', {})
+        if self.font_type in base_sizes:
+            self.min_size = base_sizes[self.font_type]['min']
+            self.max_size = base_sizes[self.font_type]['max']
+            self.default_size = base_sizes[self.font_type]['default']
+        else:
+            self.min_size, self.max_size, self.default_size = 10, 18, 14
+        self.dynamic_font_size = styling.get('font_size') == 'dynamic'
+        
+        # Font, color and alignment (see apply_enhanced_text_styling)
+        self.font_name, self.bold, self.italic = _resolve_text_font(styling, templates_data)
+        self.underline = styling.get('underline', False)
+        
+        color = None
+        if 'color_role' in styling:
+            color = get_color_from_scheme(templates_data, color_scheme, styling['color_role'])
+        elif 'color' in styling:
+            color = tuple(styling['color'])
+        self.color = RGBColor(*color) if color else None
+        
+        self.alignment = _ALIGNMENT_MAP.get(styling.get('alignment'))
+        self.vertical_anchor = _VERTICAL_ALIGNMENT_MAP.get(styling.get('vertical_alignment'))
+        self.line_spacing = styling.get('line_spacing', 1.2)
+    
+    def font_size_for(self, content: str) -> int:
+        """Get the font size for the given content."""
+        content = content or self.placeholder_text
+        if not content:
+            return 14  # Default size
+        if self.dynamic_font_size:
+            return self.text_calculator.calculate_optimal_font_size(
+                content, self.container_width, self.container_height, self.font_type, self.min_size, self.max_size,
+                self.font_name, self.bold, self.italic
+            )
+        return self.default_size
+    
+    def build(self, slide, content: str = None, image_path: str = None) -> Any:
+        """Add the text box to a slide."""
+        content = content or self.placeholder_text
+        if self.auto_wrap:
+            content = self.text_calculator.wrap_text_intelligently(
+                content, self.container_width, self.font_size_for(content), self.font_name, self.bold, self.italic,
+                self.break_long_words, self.hyphenate
+            )
+        
+        textbox = slide.shapes.add_textbox(*self.emu_position)
+        text_frame = textbox.text_frame
+        text_frame.text = content
+        text_frame.word_wrap = True
+        
+        font_size = Pt(self.font_size_for(content))
+        
+        if self.vertical_anchor is not None:
+            text_frame.vertical_anchor = self.vertical_anchor
+        
+        line_spacing = self.line_spacing
+        if line_spacing == 'dynamic':
+            content_length = len(text_frame.text)
+            if content_length > 300:
+                line_spacing = 1.4
+            elif content_length > 150:
+                line_spacing = 1.3
+            else:
+                line_spacing = 1.2
+        
+        for paragraph in text_frame.paragraphs:
+            if self.alignment is not None:
+                paragraph.alignment = self.alignment
+            paragraph.line_spacing = line_spacing
+            
+            for run in paragraph.runs:
+                font = run.font
+                font.name = self.font_name
+                font.size = font_size
+                font.bold = self.bold
+                font.italic = self.italic
+                font.underline = self.underline
+                if self.color is not None:
+                    font.color.rgb = self.color
+        
+        if self.auto_fit:
+            text_frame.auto_size = True
+        
+        return textbox
+
+
+class CompiledShapeElement:
+    """Auto shape element with its fill and line colors resolved up front (see create_shape_element)."""
+    
+    def __init__(self, element: Mapping, templates_data: Mapping, color_scheme: str):
+        pos = element['position']
+        self.position = (pos['left'], pos['top'], pos['width'], pos['height'])
+        self.emu_position = tuple(Inches(value) for value in self.position)
+        self.shape_type = element.get('shape_type', 'rectangle')
+        
+        styling = element.get('styling', {})
+        self.fill_color = None
+        if 'fill_color_role' in styling:
+            self.fill_color = RGBColor(*get_color_from_scheme(templates_data, color_scheme, styling['fill_color_role']))
+        elif 'fill_color' in styling:
+            self.fill_color = RGBColor(*styling['fill_color'])
+        
+        self.line_color = None
+        if 'line_color_role' in styling:
+            self.line_color = RGBColor(*get_color_from_scheme(templates_data, color_scheme, styling['line_color_role']))
+        self.no_border = self.line_color is None and bool(styling.get('no_border'))
+    
+    def build(self, slide, content: str = None, image_path: str = None) -> Any:
+        """Add the shape to a slide."""
+        try:
+            from ppt_mcp_server import add_shape_direct
+            shape = add_shape_direct(slide, self.shape_type, *self.position)
+            
+            if self.fill_color is not None:
+                shape.fill.solid()
+                shape.fill.fore_color.rgb = self.fill_color
+            
+            if self.line_color is not None:
+                shape.line.color.rgb = self.line_color
+            elif self.no_border:
+                shape.line.fill.background()
+            
+            return shape
+        except Exception:
+            # Create a simple text box as fallback
+            textbox = slide.shapes.add_textbox(*self.emu_position)
+            textbox.text_frame.text = f"Shape: {self.shape_type}"
+            return textbox
+
+
+class DelegatedElement:
+    """
+    Element built by the regular, uncompiled code path.
+    
+    Used for image, table and chart elements, and for text and shape elements
+    whose styling could not be resolved at compile time.
+    """
+    
+    def __init__(self, manager: 'EnhancedTemplateManager', element: Mapping, templates_data: Mapping, color_scheme: str):
+        self.manager = manager
+        self.element = element
+        self.templates_data = templates_data
+        self.color_scheme = color_scheme
+    
+    def build(self, slide, content: str = None, image_path: str = None) -> Any:
+        """Add the element to a slide."""
+        element_type = self.element.get('type')
+        if element_type == 'text':
+            return self.manager.create_enhanced_text_element(
+                slide, self.element, self.templates_data, self.color_scheme, content
+            )
+        if element_type == 'shape':
+            return create_shape_element(slide, self.element, self.templates_data, self.color_scheme)
+        if element_type == 'image':
+            return create_image_element(slide, self.element, image_path)
+        if element_type == 'table':
+            return create_table_element(slide, self.element, self.templates_data, self.color_scheme)
+        return create_chart_element(slide, self.element, self.templates_data, self.color_scheme)
+
+
+class CompiledTemplatePlan:
+    """
+    A slide template compiled for one color scheme.
+    
+    Element types are dispatched and colors, fonts, alignments and EMU positions
+    are resolved once at compile time, so applying the plan to a slide is a
+    loop of shape insertions.
+    """
+    
+    ELEMENT_TYPES = ('text', 'shape', 'image', 'table', 'chart')
+    
+    def __init__(self, manager: 'EnhancedTemplateManager', template_id: str, templates_data: Mapping, color_scheme: str):
+        template = templates_data['templates'][template_id]
+        self.template_id = template_id
+        self.template_name = template.get('name', template_id)
+        self.color_scheme = color_scheme
+        
+        # Only professional gradients change the slide background (see apply_slide_background)
+        self.background = None
+        background_config = template.get('background')
+        if background_config and background_config.get('type', 'solid') == 'professional_gradient':
+            start_color, end_color = design_utils.get_professional_gradient_colors(
+                color_scheme, background_config.get('style', 'subtle')
+            )
+            self.background = (start_color, end_color, background_config.get('direction', 'diagonal'))
+        
+        # (type, role, features, builder) per element; unknown element types create nothing
+        self.elements = []
+        for element in template.get('elements', []):
+            element_type = element.get('type')
+            if element_type not in self.ELEMENT_TYPES:
+                continue
+            
+            builder = None
+            try:
+                if element_type == 'text':
+                    builder = CompiledTextElement(manager, element, templates_data, color_scheme)
+                elif element_type == 'shape':
+                    builder = CompiledShapeElement(element, templates_data, color_scheme)
+            except Exception:
+                # Leave malformed definitions to the regular code path, which reports them per slide
+                builder = None
+            if builder is None:
+                builder = DelegatedElement(manager, element, templates_data, color_scheme)
+            
+            self.elements.append((
+                element_type, element.get('role', ''), manager.get_element_features(element), builder
+            ))
+    
+    def apply(self, slide, content_mapping: Dict = None, image_paths: Dict = None) -> Dict:
+        """
+        Apply the compiled template to a slide.
+        
+        Args:
+            slide: PowerPoint slide object
+            content_mapping: Dictionary mapping element roles to content
+            image_paths: Dictionary mapping image element roles to file paths
+            
+        Returns:
+            Dictionary with application results
+        """
+        if self.background is not None:
+            design_utils.set_slide_gradient_background(slide, *self.background)
+        
+        elements_created = []
+        for element_type, role, features, builder in self.elements:
+            try:
+                content = content_mapping.get(role) if content_mapping and role in content_mapping else None
+                image_path = image_paths.get(role) if image_paths else None
+                
+                if builder.build(slide, content, image_path):
+                    elements_created.append({
+                        'type': element_type,
+                        'role': role,
+                        'index': len(slide.shapes) - 1,
+                        'enhanced_features': list(features)
+                    })
+            
+            except Exception as e:
+                elements_created.append({
+                    'type': element_type,
+                    'role': role,
+                    'error': str(e)
+                })
+        
+        return {
+            'success': True,
+            'template_id': self.template_id,
+            'template_name': self.template_name,
+            'color_scheme': self.color_scheme,
+            'elements_created': elements_created,
+            'enhanced_features_applied': [
+                'Dynamic text sizing',
+                'Automatic text wrapping',
+                'Visual effects',
+                'Intelligent content adaptation'
+            ]
+        }
+
+
 # Global instance for enhanced features
 enhanced_template_manager = EnhancedTemplateManager()
 
+# Optional background reload of slide_layout_templates.json when it changes on disk
+if os.environ.get('PPT_TEMPLATE_HOT_RELOAD', '').lower() in ('1', 'true', 'yes'):
+    enhanced_template_manager.template_registry.start_watcher(
+        float(os.environ.get('PPT_TEMPLATE_HOT_RELOAD_INTERVAL', '2'))
+    )
+
 
 def get_enhanced_template_manager() -> EnhancedTemplateManager:
     """Get the global enhanced template manager instance."""
@@ -465,20 +1148,60 @@ def get_enhanced_template_manager() -> EnhancedTemplateManager:
 
 
 def calculate_dynamic_font_size(text: str, container_width: float, container_height: float, 
-                               font_type: str = 'body') -> int:
+                               font_type: str = 'body', font_name: str = None,
+                               bold: bool = False, italic: bool = False) -> int:
     """Calculate optimal font size for given text and container."""
     return enhanced_template_manager.text_calculator.calculate_optimal_font_size(
-        text, container_width, container_height, font_type
+        text, container_width, container_height, font_type, font_name=font_name, bold=bold, italic=italic
     )
 
 
-def wrap_text_automatically(text: str, container_width: float, font_size: int) -> str:
-    """Automatically wrap text to fit container width."""
+def wrap_text_automatically(text: str, container_width: float, font_size: int, font_name: str = None,
+                            bold: bool = False, italic: bool = False, break_long_words: bool = None,
+                            hyphenate: bool = None) -> str:
+    """
+    Automatically wrap text to fit container width.
+    
+    break_long_words and hyphenate default to the template rules
+    (auto_sizing_rules.dynamic_adjustments.line_wrapping).
+    """
+    wrapping = get_line_wrapping_options(enhanced_template_manager.templates_data)
     return enhanced_template_manager.text_calculator.wrap_text_intelligently(
-        text, container_width, font_size
+        text, container_width, font_size, font_name, bold, italic,
+        wrapping['break_long_words'] if break_long_words is None else break_long_words,
+        wrapping['hyphenate'] if hyphenate is None else hyphenate
     )
 
 
+def wrap_texts_automatically(requests: List[Dict]) -> List[str]:
+    """
+    Wrap many texts in one call (see TextSizeCalculator.wrap_texts).
+    
+    Requests without 'break_long_words' or 'hyphenate' use the template rules.
+    
+    Args:
+        requests: List of dicts with 'text', 'container_width' and 'font_size', and
+            optionally 'font_name', 'bold', 'italic', 'break_long_words' and 'hyphenate'
+        
+    Returns:
+        List of wrapped texts, in request order
+    """
+    wrapping = get_line_wrapping_options(enhanced_template_manager.templates_data)
+    return enhanced_template_manager.text_calculator.wrap_texts([
+        {
+            'text': request['text'],
+            'max_width': request['container_width'],
+            'font_size': request['font_size'],
+            'font_name': request.get('font_name'),
+            'bold': request.get('bold', False),
+            'italic': request.get('italic', False),
+            'break_long_words': request.get('break_long_words', wrapping['break_long_words']),
+            'hyphenate': request.get('hyphenate', wrapping['hyphenate'])
+        }
+        for request in requests
+    ])
+
+
 def load_slide_templates(template_file_path: str = None) -> Dict:
     """
     Load slide layout templates from JSON file.
@@ -487,21 +1210,26 @@ def load_slide_templates(template_file_path: str = None) -> Dict:
         template_file_path: Path to template JSON file (defaults to slide_layout_templates.json)
         
     Returns:
-        Dictionary containing all template definitions
+        Dictionary containing all template definitions (a copy the caller may modify)
+    """
+    return thaw_template_data(get_slide_templates(template_file_path))
+
+
+def get_slide_templates(template_file_path: str = None) -> Mapping:
     """
-    if template_file_path is None:
-        # Default to the template file in the same directory as the script
-        current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        template_file_path = os.path.join(current_dir, 'slide_layout_templates.json')
+    Get the shared, read-only slide layout templates.
     
-    try:
-        with open(template_file_path, 'r', encoding='utf-8') as f:
-            templates = json.load(f)
-        return templates
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Template file not found: {template_file_path}")
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in template file: {str(e)}")
+    The file is parsed once and shared; see TemplateRegistry. Cheaper than
+    load_slide_templates, which copies the data.
+    
+    Args:
+        template_file_path: Path to template JSON file (defaults to slide_layout_templates.json)
+        
+    Returns:
+        Read-only mapping containing all template definitions
+        (use thaw_template_data for a mutable copy)
+    """
+    return get_template_registry(template_file_path).get()
 
 
 def get_available_templates() -> List[Dict]:
@@ -512,7 +1240,7 @@ def get_available_templates() -> List[Dict]:
         List of template information dictionaries
     """
     try:
-        templates_data = load_slide_templates()
+        templates_data = get_slide_templates()
         template_list = []
         
         for template_id, template_info in templates_data.get('templates', {}).items():
@@ -550,6 +1278,24 @@ def get_color_from_scheme(templates_data: Dict, color_scheme: str, color_role: s
     return tuple(scheme.get(color_role, scheme.get('primary', [0, 120, 215])))
 
 
+def get_line_wrapping_options(templates_data: Mapping) -> Dict:
+    """
+    Get the word wrapping options declared in the template rules.
+    
+    Args:
+        templates_data: Template data dictionary
+        
+    Returns:
+        Dictionary with 'enabled', 'break_long_words' and 'hyphenate'
+    """
+    rules = templates_data.get('auto_sizing_rules', {}).get('dynamic_adjustments', {}).get('line_wrapping', {})
+    return {
+        'enabled': rules.get('enabled', True),
+        'break_long_words': rules.get('break_long_words', False),
+        'hyphenate': rules.get('hyphenate', False)
+    }
+
+
 def get_font_settings(templates_data: Dict, font_type: str, font_size: str) -> Dict:
     """
     Get font settings from typography configuration.
@@ -920,7 +1666,7 @@ def apply_slide_template_basic(slide, template_id: str, color_scheme: str = 'mod
     """
     try:
         # Load templates
-        templates_data = load_slide_templates()
+        templates_data = get_slide_templates()
         
         if template_id not in templates_data.get('templates', {}):
             return {
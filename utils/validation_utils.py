@@ -2,7 +2,121 @@
 Validation utilities for PowerPoint MCP Server.
 Functions for validating and fixing slide content, text fit, and layouts.
 """
-from typing import Dict, List, Optional, Any
+import heapq
+import os
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
+
+
+EMU_PER_INCH = 914400
+
+
+class SlideGeometry:
+    """
+    Slide size of a presentation, shared by the layout validation functions.
+    
+    Use get_slide_geometry to get the (cached) geometry of a presentation; the
+    default is the standard 10 x 7.5 inch slide.
+    """
+    
+    def __init__(self, slide_width: int = 10 * EMU_PER_INCH, slide_height: int = int(7.5 * EMU_PER_INCH),
+                 min_spacing: int = int(0.1 * EMU_PER_INCH)):
+        """
+        Args:
+            slide_width: Slide width in EMU
+            slide_height: Slide height in EMU
+            min_spacing: Spacing between shapes below which more spacing is suggested (in EMU)
+        """
+        self.slide_width = slide_width
+        self.slide_height = slide_height
+        self.min_spacing = min_spacing
+    
+    def is_outside(self, box: Tuple[int, int, int, int]) -> bool:
+        """Check if a (left, top, width, height) box extends beyond the slide."""
+        left, top, width, height = box
+        return (left < 0 or top < 0 or 
+                left + width > self.slide_width or 
+                top + height > self.slide_height)
+    
+    def to_dict(self) -> Dict:
+        """Get the slide size in inches."""
+        return {
+            'width_inches': self.slide_width / EMU_PER_INCH,
+            'height_inches': self.slide_height / EMU_PER_INCH
+        }
+
+
+_slide_geometries = weakref.WeakKeyDictionary()  # PresentationPart -> SlideGeometry
+_slide_geometries_lock = threading.Lock()
+
+
+def get_slide_geometry(presentation, refresh: bool = False) -> SlideGeometry:
+    """
+    Get the slide geometry of a presentation, read once and cached per presentation.
+    
+    Args:
+        presentation: The presentation object, or one of its slides
+        refresh: Re-read the slide size (after changing slide_width/slide_height)
+        
+    Returns:
+        SlideGeometry of the presentation
+    """
+    # Keyed by the presentation part (python-pptx proxies aren't hashable)
+    presentation_part = presentation.part
+    if hasattr(presentation, 'shapes'):
+        presentation_part = presentation_part.package.presentation_part
+    
+    with _slide_geometries_lock:
+        geometry = None if refresh else _slide_geometries.get(presentation_part)
+        if geometry is None:
+            presentation = presentation_part.presentation
+            defaults = SlideGeometry()
+            geometry = SlideGeometry(
+                presentation.slide_width or defaults.slide_width,
+                presentation.slide_height or defaults.slide_height
+            )
+            _slide_geometries[presentation_part] = geometry
+        return geometry
+
+
+def _get_first_run_font(shape) -> Optional[Tuple[str, bool, bool]]:
+    """
+    Get the font of the shape's first run.
+    
+    Returns:
+        Tuple of (font name, bold, italic), or None if the first run has no explicit font
+    """
+    try:
+        paragraphs = shape.text_frame.paragraphs
+        if not paragraphs or not paragraphs[0].runs:
+            return None
+        font = paragraphs[0].runs[0].font
+        if not font.name:
+            return None
+        return font.name, bool(font.bold), bool(font.italic)
+    except Exception:
+        return None
+
+
+def _measure_with_font_metrics(text_content: str, font_size: int,
+                               font: Optional[Tuple[str, bool, bool]]) -> Optional[float]:
+    """
+    Measure text in points with a font's advance widths.
+    
+    Returns:
+        Width in points, or None if no font is given or it isn't installed
+    """
+    if font is None:
+        return None
+    try:
+        # Imported lazily so validation only loads fontTools when a named font is measured
+        from utils.font_metrics_utils import get_font_metrics_provider
+        return get_font_metrics_provider().measure_text(text_content, font_size, *font)
+    except Exception:
+        return None
 
 
 def validate_text_fit(shape, text_content: str = None, font_size: int = 12) -> Dict:
@@ -14,6 +128,46 @@ def validate_text_fit(shape, text_content: str = None, font_size: int = 12) -> D
         text_content: The text to validate (if None, uses existing text)
         font_size: The font size to check
     
+    Returns:
+        Dictionary with validation results and suggestions
+    """
+    try:
+        # Use existing text if not provided
+        if text_content is None and hasattr(shape, 'text_frame'):
+            text_content = shape.text_frame.text
+        
+        has_size = hasattr(shape, 'width') and hasattr(shape, 'height')
+        return check_text_fit(
+            text_content,
+            shape.width if has_size else None,
+            shape.height if has_size else None,
+            font_size,
+            _get_first_run_font(shape) if text_content and has_size else None
+        )
+    except Exception as e:
+        return {
+            'fits': False,
+            'estimated_overflow': False,
+            'suggested_font_size': font_size,
+            'suggested_dimensions': None,
+            'warnings': [],
+            'needs_optimization': False,
+            'error': str(e)
+        }
+
+
+def check_text_fit(text_content: str, width: Optional[int], height: Optional[int], font_size: int = 12,
+                   font: Optional[Tuple[str, bool, bool]] = None) -> Dict:
+    """
+    Validate if text will fit in a container of the given size (see validate_text_fit).
+    
+    Args:
+        text_content: The text to validate
+        width: Container width in EMU (None skips the overflow check)
+        height: Container height in EMU
+        font_size: The font size to check
+        font: Optional (font name, bold, italic) to measure the text with
+    
     Returns:
         Dictionary with validation results and suggestions
     """
@@ -27,22 +181,22 @@ def validate_text_fit(shape, text_content: str = None, font_size: int = 12) -> D
     }
     
     try:
-        # Use existing text if not provided
-        if text_content is None and hasattr(shape, 'text_frame'):
-            text_content = shape.text_frame.text
-        
         if not text_content:
             return result
         
-        # Basic heuristic: estimate if text will overflow
-        if hasattr(shape, 'width') and hasattr(shape, 'height'):
-            # Rough estimation: average character width is about 0.6 * font_size
-            avg_char_width = font_size * 0.6
-            estimated_width = len(text_content) * avg_char_width
+        # Estimate if text will overflow
+        if width is not None and height is not None:
+            # Measure with the font's advance widths when it is installed
+            estimated_width = _measure_with_font_metrics(text_content, font_size, font)
+            measured_with_font = estimated_width is not None
+            if not measured_with_font:
+                # Rough estimation: average character width is about 0.6 * font_size
+                avg_char_width = font_size * 0.6
+                estimated_width = len(text_content) * avg_char_width
             
             # Convert shape dimensions to points (assuming they're in EMU)
-            shape_width_pt = shape.width / 12700  # EMU to points conversion
-            shape_height_pt = shape.height / 12700
+            shape_width_pt = width / 12700  # EMU to points conversion
+            shape_height_pt = height / 12700
             
             if estimated_width > shape_width_pt:
                 result['fits'] = False
@@ -50,7 +204,11 @@ def validate_text_fit(shape, text_content: str = None, font_size: int = 12) -> D
                 result['needs_optimization'] = True
                 
                 # Suggest smaller font size
-                suggested_size = int((shape_width_pt / len(text_content)) * 0.8)
+                if measured_with_font:
+                    # Same margin as the heuristic below: aim for 48% of the width
+                    suggested_size = int(shape_width_pt * font_size / estimated_width * 0.48)
+                else:
+                    suggested_size = int((shape_width_pt / len(text_content)) * 0.8)
                 result['suggested_font_size'] = max(suggested_size, 8)
                 
                 # Suggest larger dimensions
@@ -174,71 +332,418 @@ def validate_and_fix_slide(slide, auto_fix: bool = True, min_font_size: int = 8,
         return result
 
 
-def validate_slide_layout(slide) -> Dict:
+def validate_slide_layout(slide, geometry: Optional[SlideGeometry] = None) -> Dict:
     """
     Validate slide layout for common issues.
     
     Args:
         slide: The slide object
+        geometry: Slide geometry (defaults to that of the slide's presentation)
         
     Returns:
         Dictionary with layout validation results
     """
+    try:
+        if geometry is None:
+            geometry = get_slide_geometry(slide)
+        shapes = list(slide.shapes)
+        names = [getattr(shape, 'name', f'Shape {i}') for i, shape in enumerate(shapes)]
+        # Read each shape's position and size from the XML once
+        return check_slide_layout(get_shape_bounds(shapes), names, geometry)
+        
+    except Exception as e:
+        return {
+            'layout_valid': False,
+            'issues': [],
+            'suggestions': [],
+            'shape_count': len(slide.shapes),
+            'overlapping_shapes': [],
+            'shapes_outside': [],
+            'error': str(e)
+        }
+
+
+def check_slide_layout(bounds: List[Optional[Tuple[int, int, int, int]]], names: List[str],
+                       geometry: Optional[SlideGeometry] = None) -> Dict:
+    """
+    Validate the layout of a slide given its shape boxes (see validate_slide_layout).
+    
+    Args:
+        bounds: (left, top, width, height) per shape, as returned by get_shape_bounds
+        names: Shape names, in the same order
+        geometry: Slide geometry (defaults to the standard 10 x 7.5 inch slide)
+        
+    Returns:
+        Dictionary with layout validation results
+    """
+    if geometry is None:
+        geometry = SlideGeometry()
+    
     result = {
         'layout_valid': True,
         'issues': [],
         'suggestions': [],
-        'shape_count': len(slide.shapes),
-        'overlapping_shapes': []
+        'shape_count': len(bounds),
+        'overlapping_shapes': [],
+        'shapes_outside': []
     }
     
-    try:
-        shapes = list(slide.shapes)
+    # Check for overlapping shapes
+    for i, j in find_overlapping_shapes(bounds):
+        result['overlapping_shapes'].append({
+            'shape1_index': i,
+            'shape2_index': j,
+            'shape1_name': names[i],
+            'shape2_name': names[j]
+        })
+    
+    if result['overlapping_shapes']:
+        result['layout_valid'] = False
+        result['issues'].append(f"Found {len(result['overlapping_shapes'])} overlapping shapes")
+        result['suggestions'].append("Consider repositioning overlapping shapes")
+    
+    # Check for shapes outside slide boundaries
+    shapes_outside = result['shapes_outside']
+    for i, box in enumerate(bounds):
+        if box is not None and geometry.is_outside(box):
+            shapes_outside.append(i)
+    
+    if shapes_outside:
+        result['layout_valid'] = False
+        result['issues'].append(f"Found {len(shapes_outside)} shapes outside slide boundaries")
+        result['suggestions'].append("Reposition shapes to fit within slide boundaries")
+    
+    # Check shape spacing
+    if len(bounds) > 1:
+        min_spacing = minimum_shape_spacing(bounds)
+        if min_spacing < geometry.min_spacing:
+            result['suggestions'].append("Consider increasing spacing between shapes")
+    
+    return result
+
+
+def snapshot_slide(slide) -> Dict:
+    """
+    Copy the geometry and text of a slide's shapes into plain data.
+    
+    The snapshot can be validated with check_slide_snapshot without touching
+    the presentation, e.g. on another thread.
+    
+    Args:
+        slide: The slide object
         
-        # Check for overlapping shapes
-        for i, shape1 in enumerate(shapes):
-            for j, shape2 in enumerate(shapes[i+1:], i+1):
-                if shapes_overlap(shape1, shape2):
-                    result['overlapping_shapes'].append({
-                        'shape1_index': i,
-                        'shape2_index': j,
-                        'shape1_name': getattr(shape1, 'name', f'Shape {i}'),
-                        'shape2_name': getattr(shape2, 'name', f'Shape {j}')
-                    })
-        
-        if result['overlapping_shapes']:
-            result['layout_valid'] = False
-            result['issues'].append(f"Found {len(result['overlapping_shapes'])} overlapping shapes")
-            result['suggestions'].append("Consider repositioning overlapping shapes")
-        
-        # Check for shapes outside slide boundaries
-        slide_width = 10 * 914400  # Standard slide width in EMU
-        slide_height = 7.5 * 914400  # Standard slide height in EMU
-        
-        shapes_outside = []
-        for i, shape in enumerate(shapes):
-            if (shape.left < 0 or shape.top < 0 or 
-                shape.left + shape.width > slide_width or 
-                shape.top + shape.height > slide_height):
-                shapes_outside.append(i)
-        
-        if shapes_outside:
-            result['layout_valid'] = False
-            result['issues'].append(f"Found {len(shapes_outside)} shapes outside slide boundaries")
-            result['suggestions'].append("Reposition shapes to fit within slide boundaries")
-        
-        # Check shape spacing
-        if len(shapes) > 1:
-            min_spacing = check_minimum_spacing(shapes)
-            if min_spacing < 0.1 * 914400:  # Less than 0.1 inch spacing
-                result['suggestions'].append("Consider increasing spacing between shapes")
+    Returns:
+        Dictionary with a 'shapes' list of name, bounds, text, first run font
+        and empty paragraph count per shape (text fields are None for shapes
+        without a text frame)
+    """
+    shapes = list(slide.shapes)
+    snapshot = []
+    for i, (shape, box) in enumerate(zip(shapes, get_shape_bounds(shapes))):
+        entry = {
+            'name': getattr(shape, 'name', f'Shape {i}'),
+            'bounds': box,
+            'text': None,
+            'font': None,
+            'empty_paragraphs': 0
+        }
+        if hasattr(shape, 'text_frame'):
+            text_frame = shape.text_frame
+            entry['text'] = text_frame.text
+            entry['font'] = _get_first_run_font(shape)
+            entry['empty_paragraphs'] = sum(1 for p in text_frame.paragraphs if not p.text.strip())
+        snapshot.append(entry)
+    return {'shapes': snapshot}
+
+
+def check_slide_snapshot(snapshot: Dict, geometry: Optional[SlideGeometry] = None, font_size: int = 12) -> Dict:
+    """
+    Run the text fit and layout checks on a slide snapshot.
+    
+    Text checks match validate_and_fix_slide and layout checks match
+    validate_slide_layout.
+    
+    Args:
+        snapshot: Slide snapshot from snapshot_slide
+        geometry: Slide geometry (defaults to the standard 10 x 7.5 inch slide)
+        font_size: The font size to check text fit with
         
-        return result
+    Returns:
+        Dictionary with text issues, warnings, suggested font sizes per shape
+        ('font_fixes') and the layout validation results
+    """
+    shapes = snapshot['shapes']
+    result = {
+        'text_issues': [],
+        'warnings': [],
+        'font_fixes': [],
+        'layout': check_slide_layout(
+            [shape['bounds'] for shape in shapes], [shape['name'] for shape in shapes], geometry
+        )
+    }
+    
+    for shape_index, shape in enumerate(shapes):
+        text = shape['text']
+        if not text or not text.strip():
+            continue
+        shape_name = f"Shape {shape_index}"
+        
+        box = shape['bounds']
+        text_validation = check_text_fit(
+            text, box[2] if box else None, box[3] if box else None, font_size, shape['font']
+        )
+        if not text_validation['fits'] or text_validation['needs_optimization']:
+            result['text_issues'].append(f"{shape_name}: Text may not fit properly")
+            if text_validation['suggested_font_size']:
+                result['font_fixes'].append({
+                    'shape_index': shape_index,
+                    'suggested_font_size': text_validation['suggested_font_size']
+                })
+        
+        if len(text) > 500:  # Very long text
+            result['warnings'].append(f"{shape_name}: Contains very long text (>500 chars)")
+        if shape['empty_paragraphs'] > 2:
+            result['warnings'].append(f"{shape_name}: Contains {shape['empty_paragraphs']} empty paragraphs")
+    
+    if len(shapes) > 20:
+        result['warnings'].append("Slide contains many shapes (>20), may affect performance")
+    
+    return result
+
+
+def check_slide_snapshots(snapshots: List[Dict], geometry: Optional[SlideGeometry] = None, font_size: int = 12,
+                          max_workers: Optional[int] = None) -> List[Dict]:
+    """
+    Run check_slide_snapshot on many slides using a worker pool.
+    
+    Args:
+        snapshots: Slide snapshots from snapshot_slide
+        geometry: Slide geometry (defaults to the standard 10 x 7.5 inch slide)
+        font_size: The font size to check text fit with
+        max_workers: Number of worker threads (defaults to the PPT_VALIDATION_WORKERS
+            environment variable; otherwise the CPU count capped at 8 on free-threaded
+            Python builds, and 1 where the GIL would serialize the checks anyway)
         
-    except Exception as e:
-        result['layout_valid'] = False
-        result['error'] = str(e)
-        return result
+    Returns:
+        List of check results, in slide order
+    """
+    if max_workers is None:
+        max_workers = int(os.environ.get('PPT_VALIDATION_WORKERS', '0'))
+        if not max_workers:
+            gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+            max_workers = 1 if gil_enabled else min(8, os.cpu_count() or 1)
+    
+    def check(snapshot: Dict) -> Dict:
+        return check_slide_snapshot(snapshot, geometry, font_size)
+    
+    if max_workers <= 1 or len(snapshots) <= 1:
+        return [check(snapshot) for snapshot in snapshots]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(snapshots)),
+                            thread_name_prefix="ppt-validate") as executor:
+        return list(executor.map(check, snapshots))
+
+
+def get_shape_bounds(shapes: List) -> List[Optional[Tuple[int, int, int, int]]]:
+    """
+    Read the position and size of each shape once.
+    
+    Args:
+        shapes: List of shapes
+        
+    Returns:
+        List of (left, top, width, height) tuples in EMU, in shape order; None for
+        shapes whose position or size can't be read
+    """
+    bounds = []
+    for shape in shapes:
+        try:
+            box = (shape.left, shape.top, shape.width, shape.height)
+            bounds.append(box if None not in box else None)
+        except Exception:
+            bounds.append(None)
+    return bounds
+
+
+# Up to this many shapes, find_overlapping_shapes scans a plain list of active boxes
+_SMALL_SWEEP_SIZE = 100
+
+
+class _ActiveIntervals:
+    """
+    Set of vertical intervals [top, bottom) over a fixed list of coordinates.
+    
+    A segment tree over the coordinate list stores each interval at the nodes
+    covering its span (for "contains this point" queries) and at the leaf of its
+    top (for "starts inside this range" queries), so adding, removing and
+    finding the k intervals overlapping a range all cost O(log n) (+ k).
+    """
+    
+    def __init__(self, coordinates: List[int]):
+        self._position = {y: i for i, y in enumerate(coordinates)}
+        size = 1
+        while size < len(coordinates):
+            size *= 2
+        self._size = size
+        self._spanning = [set() for _ in range(2 * size)]  # node -> intervals covering the node
+        self._starting = [set() for _ in range(size)]      # leaf -> intervals starting there
+        self._start_counts = [0] * (2 * size)              # node -> intervals starting under the node
+    
+    def _update(self, item, top: int, bottom: int, adding: bool) -> None:
+        lo, hi = self._position[top] + self._size, self._position[bottom] + self._size
+        while lo < hi:
+            if lo & 1:
+                (self._spanning[lo].add if adding else self._spanning[lo].discard)(item)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                (self._spanning[hi].add if adding else self._spanning[hi].discard)(item)
+            lo //= 2
+            hi //= 2
+        
+        leaf = self._position[top]
+        (self._starting[leaf].add if adding else self._starting[leaf].discard)(item)
+        node, step = leaf + self._size, 1 if adding else -1
+        while node:
+            self._start_counts[node] += step
+            node //= 2
+    
+    def add(self, item, top: int, bottom: int) -> None:
+        self._update(item, top, bottom, True)
+    
+    def remove(self, item, top: int, bottom: int) -> None:
+        self._update(item, top, bottom, False)
+    
+    def overlapping(self, top: int, bottom: int) -> List:
+        """Get the intervals with other_top < bottom and top < other_bottom (plus any starting at top)."""
+        first, last = self._position[top], self._position[bottom]
+        
+        # Intervals containing top
+        found = []
+        node = first + self._size
+        while node:
+            found.extend(self._spanning[node])
+            node //= 2
+        
+        # Intervals starting strictly between top and bottom
+        lo, hi = first + 1 + self._size, last + self._size
+        stack = []
+        while lo < hi:
+            if lo & 1:
+                stack.append(lo)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                stack.append(hi)
+            lo //= 2
+            hi //= 2
+        while stack:
+            node = stack.pop()
+            if not self._start_counts[node]:
+                continue
+            if node >= self._size:
+                found.extend(self._starting[node - self._size])
+            else:
+                stack.extend((2 * node, 2 * node + 1))
+        return found
+
+
+def find_overlapping_shapes(bounds: List[Optional[Tuple[int, int, int, int]]]) -> List[Tuple[int, int]]:
+    """
+    Find all pairs of overlapping shapes (same test as shapes_overlap).
+    
+    Sweeps the boxes from left to right. Boxes whose horizontal extent the sweep
+    line is still inside are kept in a segment tree over their vertical extents,
+    so each box is only compared with the active boxes it overlaps vertically.
+    Finding the k overlapping pairs among n shapes costs O((n + k) log n), also
+    for stacked rows, grids and timelines with many shapes side by side. Slides
+    with few shapes use a plain list of active boxes, which is faster there.
+    
+    Args:
+        bounds: (left, top, width, height) per shape, as returned by get_shape_bounds
+        
+    Returns:
+        Sorted list of (i, j) shape index pairs with i < j
+    """
+    boxes = sorted(
+        (left, left + width, top, top + height, index)
+        for index, box in enumerate(bounds) if box is not None
+        for left, top, width, height in (box,)
+    )
+    if len(boxes) < 2:
+        return []
+    
+    pairs = []
+    if len(boxes) <= _SMALL_SWEEP_SIZE:
+        # Few shapes: scanning a plain list of active boxes is cheaper than the tree
+        active = []
+        for left, right, top, bottom, index in boxes:
+            active = [other for other in active if other[1] > left]
+            for other_left, other_right, other_top, other_bottom, other_index in active:
+                if other_left < right and left < other_right and other_top < bottom and top < other_bottom:
+                    pairs.append((other_index, index) if other_index < index else (index, other_index))
+            active.append((left, right, top, bottom, index))
+        pairs.sort()
+        return pairs
+    
+    active = _ActiveIntervals(sorted({y for box in boxes for y in box[2:4]}))
+    by_right = []  # Heap of active boxes by right edge
+    for box in boxes:
+        left, right, top, bottom, index = box
+        while by_right and by_right[0][0] <= left:
+            other = by_right[0][1]
+            heapq.heappop(by_right)
+            active.remove(other, other[2], other[3])
+        
+        for other_left, other_right, other_top, other_bottom, other_index in active.overlapping(top, bottom):
+            # Re-check in full: boxes of zero width or height can match a range end
+            if other_left < right and left < other_right and other_top < bottom and top < other_bottom:
+                pairs.append((other_index, index) if other_index < index else (index, other_index))
+        
+        active.add(box, top, bottom)
+        heapq.heappush(by_right, (right, box))
+    
+    pairs.sort()
+    return pairs
+
+
+def minimum_shape_spacing(bounds: List[Optional[Tuple[int, int, int, int]]]) -> float:
+    """
+    Get the minimum spacing between shapes (same result as check_minimum_spacing).
+    
+    The spacing of two shapes is the smaller of their horizontal and vertical
+    edge gaps, so the minimum over all pairs is the smaller of the minimum
+    horizontal and minimum vertical gap, each found by one pass over the
+    boxes sorted along that axis.
+    
+    Args:
+        bounds: (left, top, width, height) per shape, as returned by get_shape_bounds
+        
+    Returns:
+        Minimum spacing found between shapes (in EMU)
+    """
+    if len(bounds) < 2:
+        return 0
+    if None in bounds:
+        return 0  # Shapes without a position count as touching (see calculate_shape_distance)
+    
+    def minimum_gap(intervals: List[Tuple[int, int]]) -> float:
+        intervals.sort()
+        furthest_end = intervals[0][1]
+        gap = float('inf')
+        for start, end in intervals[1:]:
+            gap = min(gap, start - furthest_end)
+            if gap <= 0:
+                return 0
+            furthest_end = max(furthest_end, end)
+        return gap
+    
+    gap_x = minimum_gap([(left, left + width) for left, top, width, height in bounds])
+    if gap_x == 0:
+        return 0
+    gap_y = minimum_gap([(top, top + height) for left, top, width, height in bounds])
+    if gap_y == 0:
+        return 0
+    return float(min(gap_x, gap_y))
 
 
 def shapes_overlap(shape1, shape2) -> bool:
@@ -276,16 +781,8 @@ def check_minimum_spacing(shapes: List) -> float:
     Returns:
         Minimum spacing found between shapes (in EMU)
     """
-    min_spacing = float('inf')
-    
     try:
-        for i, shape1 in enumerate(shapes):
-            for shape2 in shapes[i+1:]:
-                # Calculate distance between shape edges
-                distance = calculate_shape_distance(shape1, shape2)
-                min_spacing = min(min_spacing, distance)
-        
-        return min_spacing if min_spacing != float('inf') else 0
+        return minimum_shape_spacing(get_shape_bounds(shapes))
     except:
         return 0
 